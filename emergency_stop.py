@@ -19,15 +19,29 @@ ScalpingBot v2.4 - Emergency Stop (비상 정지 스크립트)
 
 import os
 import sys
+import time
 import argparse
 import signal
+import threading
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 
 # 프로젝트 루트 경로
 PROJECT_ROOT = Path(__file__).parent
 sys.path.insert(0, str(PROJECT_ROOT))
 
+# 🆕 병렬 처리 설정
+MAX_WORKERS = 8            # 동시 주문 스레드 수
+KIS_TPS_LIMIT = 20         # 한투 API 초당 호출 한도 (실전)
+KIS_TPS_LIMIT_MOCK = 2     # 한투 API 초당 호출 한도 (모의)
+
+# 🆕 엔진 프로세스 식별자 (python -m scalping.engine.scalp_engine)
+ENGINE_CMDLINE_MARKER = b'scalp_engine'
+
+# 🆕 PID 파일 경로 (문자열로 미리 계산)
+PID_FILE = os.fspath(PROJECT_ROOT / 'logs' / 'scalping.pid')
+
 
 def print_banner():
     """경고 배너 출력"""
@@ -65,19 +79,71 @@ def load_secrets():
         return yaml.safe_load(f)
 
 
+class RateLimiter:
+    """🆕 초당 호출 수 제한 (호출 간격을 균등하게 배분)"""
+    
+    def __init__(self, rate_per_sec: float):
+        self._interval = 1.0 / rate_per_sec
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """다음 호출 슬롯까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self._interval
+        
+        if wait > 0:
+            time.sleep(wait)
+
+
+def _run_parallel(broker, items, func):
+    """
+    🆕 브로커 호출 병렬 실행 (API 초당 한도 준수)
+    
+    Returns:
+        [(item, 결과 or 예외), ...] (입력 순서 유지)
+    """
+    if not items:
+        return []
+    
+    tps = KIS_TPS_LIMIT_MOCK if getattr(broker, 'environment', 'P') == 'V' else KIS_TPS_LIMIT
+    limiter = RateLimiter(tps)
+    
+    def task(item):
+        limiter.acquire()
+        try:
+            return func(item)
+        except Exception as e:
+            return e
+    
+    with ThreadPoolExecutor(max_workers=min(MAX_WORKERS, len(items))) as ex:
+        results = list(ex.map(task, items))
+    
+    return list(zip(items, results))
+
+
 def cancel_all_orders(broker) -> int:
-    """모든 미체결 주문 취소"""
+    """모든 미체결 주문 취소 (병렬)"""
     try:
         pending = broker.get_pending_orders()
         cancelled = 0
         
-        for order in pending:
-            result = broker.cancel_order(
+        results = _run_parallel(
+            broker,
+            pending,
+            lambda order: broker.cancel_order(
                 order.order_id,
                 order.stock_code,
-                order.remaining_qty
-            )
-            if result:
+                order.pending_qty
+            ),
+        )
+        
+        for order, result in results:
+            if isinstance(result, Exception):
+                print(f"  ❌ 취소 에러: {order.stock_code} #{order.order_id} - {result}")
+            elif result:
                 cancelled += 1
                 print(f"  ✅ 취소: {order.stock_code} #{order.order_id}")
             else:
@@ -90,17 +156,24 @@ def cancel_all_orders(broker) -> int:
 
 
 def liquidate_all_positions(broker) -> int:
-    """모든 포지션 시장가 청산"""
+    """모든 포지션 시장가 청산 (병렬)"""
     try:
         positions = broker.get_positions()
         liquidated = 0
         
         for pos in positions:
             print(f"  청산 중: {pos.stock_name} ({pos.stock_code}) {pos.quantity}주...")
-            
-            result = broker.sell_market(pos.stock_code, pos.quantity)
-            
-            if result.success:
+        
+        results = _run_parallel(
+            broker,
+            positions,
+            lambda pos: broker.sell_market(pos.stock_code, pos.quantity),
+        )
+        
+        for pos, result in results:
+            if isinstance(result, Exception):
+                print(f"  ❌ 청산 에러: {pos.stock_code} - {result}")
+            elif result.success:
                 liquidated += 1
                 print(f"  ✅ 청산 완료: {pos.stock_code} @ {result.price:,.0f}원")
             else:
@@ -112,21 +185,60 @@ def liquidate_all_positions(broker) -> int:
         return 0
 
 
+def _is_process_alive(pid: int) -> bool:
+    """🆕 프로세스 존재 확인 (시그널 0 = 존재 확인만)"""
+    try:
+        os.kill(pid, 0)
+        return True
+    except PermissionError:
+        return True  # 존재하지만 권한 없음
+    except OSError:
+        return False
+
+
+def _is_engine_process(pid: int) -> bool:
+    """
+    🆕 PID가 트레이딩 엔진 프로세스인지 확인
+    
+    PID 재사용으로 엉뚱한 프로세스에 SIGTERM을 보내지 않도록
+    Linux에서는 /proc/<pid>/cmdline 으로 실행 모듈을 확인합니다.
+    (/proc 이 없는 OS에서는 존재 여부만 확인)
+    """
+    if not _is_process_alive(pid):
+        return False
+    
+    cmdline_path = f'/proc/{pid}/cmdline'
+    if not os.path.exists(cmdline_path):
+        return True
+    
+    try:
+        with open(cmdline_path, 'rb') as f:
+            args = f.read().split(b'\0')
+    except OSError:
+        return False
+    
+    return any(ENGINE_CMDLINE_MARKER in arg for arg in args)
+
+
 def stop_trading_engine():
     """트레이딩 엔진 종료 신호 전송"""
-    pid_file = PROJECT_ROOT / 'logs' / 'scalping.pid'
-    
-    if pid_file.exists():
+    if os.path.exists(PID_FILE):
         try:
-            with open(pid_file, 'r') as f:
+            with open(PID_FILE, 'r') as f:
                 pid = int(f.read().strip())
             
+            # 🆕 전송 전 엔진 프로세스 확인 (오래된 PID 파일 정리)
+            if not _is_engine_process(pid):
+                print(f"  ⚠️ 프로세스가 이미 종료됨 (오래된 PID 파일 정리: {pid})")
+                os.unlink(PID_FILE)
+                return False
+            
             os.kill(pid, signal.SIGTERM)
             print(f"  ✅ 종료 신호 전송: PID {pid}")
             return True
         except ProcessLookupError:
             print(f"  ⚠️ 프로세스가 이미 종료됨")
-            pid_file.unlink()
+            os.unlink(PID_FILE)
         except Exception as e:
             print(f"  ❌ 종료 신호 전송 실패: {e}")
     else:
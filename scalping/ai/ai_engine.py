@@ -8,10 +8,11 @@ Qwen3:8b 모델을 이용한 비동기 AI 판단 엔진
 
 핵심 기능:
 - 비동기 Queue 처리 (메인 스레드 블로킹 방지)
+- 🆕 asyncio + aiohttp/httpx(HTTP/2) 워커 (max_concurrent 개 요청 동시 처리)
 - request_queue: 분석 요청 큐
 - result_queue: 분석 결과 큐
 - Qwen3 API 호출 (Ollama)
-- JSON 파싱 강화 (thinking 태그 제거, fallback 로직)
+- 🆕 JSON 출력 강제 (Ollama format / Gemini responseMimeType)
 - 타임아웃 10초 (실매매 환경에 적합)
 - 누적 학습 연동
 
@@ -25,30 +26,591 @@ Qwen3:8b 모델을 이용한 비동기 AI 판단 엔진
     # 결과 확인 (논블로킹)
     result = ai_engine.get_result()
     if result:
-        print(f"결정: {result['decision']}, 신뢰도: {result['confidence']}")
+        print(f"결정: {result.decision}, 신뢰도: {result.confidence}")
+        result.release()  # 🆕 사용 후 풀에 반납 (선택)
 ============================================================================
 """
 
-import re
 import json
 import time
+import importlib.util
+import random
+import asyncio
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import threading
-from queue import Queue, Empty
-from typing import Dict, Optional, Any
-from dataclasses import dataclass, field
+import weakref
+from queue import SimpleQueue, Empty
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque, OrderedDict
+from operator import attrgetter
+from typing import Dict, Optional, Any, Callable
+from dataclasses import dataclass, field, fields, MISSING
 from datetime import datetime
+from urllib.parse import urlsplit
+
+
+# 🆕 고속 JSON (선택적 - 없으면 표준 json)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# 🆕 비동기 HTTP (선택적 - 없으면 동기 워커)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+# 🆕 HTTP/2 비동기 HTTP (선택적 - Gemini 요청을 TLS 연결 하나에 다중화)
+try:
+    import httpx
+    HTTPX_AVAILABLE = importlib.util.find_spec('h2') is not None  # httpx http2=True 사용 시 필요
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+# 비동기 클라이언트별 타임아웃 예외
+_ASYNC_TIMEOUT_ERRORS = (asyncio.TimeoutError,) + ((httpx.TimeoutException,) if HTTPX_AVAILABLE else ())
 
 # 로거 설정
 logger = logging.getLogger('ScalpingBot.AI')
 
 
+def _json_dumps(obj: Any) -> bytes:
+    """JSON 직렬화 (bytes 반환, HTTP 바디로 바로 전송)"""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj)
+    return json.dumps(obj, ensure_ascii=False).encode('utf-8')
+
+
+def _json_loads(data) -> Any:
+    """JSON 역직렬화 (str/bytes 모두 허용)"""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _iter_json_values(text: str, opener: str = '{'):
+    """
+    🆕 텍스트 안에 섞인 JSON 값 순회 (opener 위치부터 raw_decode)
+    
+    정규식 없이 한 방향으로 스캔하며, 디코딩에 성공하면 그 값의 끝부터 이어서 찾습니다.
+    """
+    i = text.find(opener)
+    while i >= 0:
+        try:
+            value, end = _JSON_DECODER.raw_decode(text, i)
+        except ValueError:
+            i = text.find(opener, i + 1)
+            continue
+        yield value
+        i = text.find(opener, end)
+
+
+def _completed_json(text: str) -> Optional[str]:
+    """
+    🆕 스트리밍 중 누적 텍스트에 완성된 JSON 값이 있으면 그 구간 반환
+    
+    객체는 decision/confidence 키가 모두 나와야 완성으로 봅니다 (배열은 닫히면 완성).
+    """
+    starts = [i for i in (text.find('{'), text.find('[')) if i >= 0]
+    if not starts:
+        return None
+    
+    start = min(starts)
+    try:
+        value, end = _JSON_DECODER.raw_decode(text, start)
+    except ValueError:
+        return None
+    
+    if isinstance(value, dict) and not ('decision' in value and 'confidence' in value):
+        return None
+    return text[start:end]
+
+
+# 🆕 로컬 API 호스트 (gzip 압축 해제가 순수 오버헤드인 경우)
+_LOCAL_HOSTS = frozenset(('localhost', '127.0.0.1', '::1'))
+
+# 🆕 판단 캐시 설정 (동일 지표 중복 호출 방지)
+DECISION_CACHE_TTL = 60          # 초
+DECISION_CACHE_MAX_SIZE = 256    # 최대 항목 수 (LRU)
+DECISION_CACHE_MIN_CONFIDENCE = 0.5  # 이 미만 신뢰도 결과는 캐시하지 않음
+
+# 🆕 AI 엔진 통계 카운터 이름
+STAT_COUNTERS = (
+    'total_requests',
+    'success_count',
+    'timeout_count',
+    'error_count',
+    'dropped_count',    # 큐 초과/만료로 폐기된 요청·결과
+    'stale_dropped',    # 그중 max_request_age 초과로 폐기된 요청
+    'cache_hits',       # 판단 캐시 적중
+    'coalesced_count',  # 같은 종목 대기 요청 합침
+    'deduped',          # 처리 중인 종목 재요청 무시
+    'early_stops',      # JSON 완성 후 스트리밍 조기 종료
+    'screened_holds',   # 규칙 사전 선별로 API 호출 없이 HOLD
+)
+
+# 🆕 규칙 사전 선별 기준 (프롬프트의 MUST HOLD 조건과 동일, 해당 시 API 호출 없이 HOLD)
+SCREEN_CCI_MAX = 200             # CCI 과매수
+SCREEN_CCI_MIN = -100            # CCI 과매도
+SCREEN_VOLUME_MIN = 0.7          # 거래량 비율 하한 (배)
+SCREEN_CHANGE_MAX = 5.0          # 당일 등락률 상한 (%)
+SCREEN_HOLD_MODES = frozenset(('EMERGENCY', 'CONSERVATIVE'))
+PATTERN_WARN_WINRATE = 40        # 패턴 승률 경고 기준 (%)
+PATTERN_MIN_TRADES = 5           # CCI/점수 구간 경고 최소 거래 수
+STOCK_MIN_TRADES = 3             # 종목 경고 최소 거래 수
+SCREEN_CONFIDENCE = 0.5          # 선별 HOLD 결과의 신뢰도
+
+# 🆕 평균 응답 시간 EWMA 가중치 (클수록 최근 값 반영이 빠름)
+RESPONSE_TIME_EWMA_ALPHA = 0.1
+
+# 🆕 처리 중인 종목 재요청 무시 시간 (이 시간 안의 같은 종목 요청은 기존 결과 사용)
+INFLIGHT_DEDUPE_WINDOW = 5.0     # 초
+
+# 🆕 학습 통계 캐시 유효 시간 (전체/패턴 통계는 분 단위로만 변함)
+LEARNING_STATS_TTL = 30          # 초
+
+# 🆕 프롬프트 템플릿 (영어, JSON 강제 / 모듈 로드 시 1회 구성)
+# Gemini용으로 /no_think 제거 (Ollama 전용 지시어)
+# 고정 구간(머리말 + 규칙)을 앞에, 가변 구간(지표)을 뒤에 두어
+# Ollama가 공통 접두부의 KV 캐시를 재사용하도록 합니다.
+_PROMPT_INTRO = (
+    "You are a conservative Korean stock scalping AI. "
+    "Analyze indicators and decide BUY or HOLD.\n\n"
+)
+
+_PROMPT_MARKET_FMT = """[MARKET]
+- KOSPI: {market_change:+.2f}% | Mode: {market_mode} | Trend: {market_status}
+
+"""
+
+_PROMPT_STOCK_FMT = """[STOCK]
+- Score: {rule_score:.1f}/100
+- CCI(14): {cci:.1f}
+- Change: {change_pct:+.2f}%
+- MA20 Distance: {distance_ma20:+.2f}%
+- Volume: {volume_ratio:.2f}x
+- Bullish Days: {consec_bullish}
+
+[LEARNING DATA - YOUR PAST PERFORMANCE]
+- Overall: {winrate:.1f}% win rate ({total_trades} trades)
+- CCI {cci_zone} zone: {cci_winrate:.1f}% win rate ({cci_trades} trades)
+- Score {score_zone} zone: {score_winrate:.1f}% win rate ({score_trades} trades)
+- This stock: {stock_winrate:.1f}% win rate ({stock_trades} trades)
+
+[PATTERN WARNINGS]
+{warning_text}
+
+"""
+
+_PROMPT_DATA_FMT = _PROMPT_MARKET_FMT + _PROMPT_STOCK_FMT
+
+_PROMPT_RULES_TITLE = "[RULES - BE CONSERVATIVE]\n"
+
+# 🆕 HOLD 조건은 _rule_screen 과 같은 기준 (rule_screen 사용 시 프롬프트에서 생략)
+_PROMPT_HOLD_RULES = """MUST HOLD if ANY of these:
+- CCI > 200 (overbought, likely to drop)
+- CCI < -100 (oversold, wait for reversal)
+- Volume < 0.7x (low interest)
+- Change > +5% (already pumped today)
+- Market mode is EMERGENCY or CONSERVATIVE
+- Pattern win rate < 40%
+
+"""
+
+_PROMPT_BUY_RULES = """BUY conditions (ALL must be true):
+- Score >= 75: confidence 0.80-0.85
+- Score 70-74: confidence 0.70-0.75
+- Score 65-69: confidence 0.60-0.65 (only if Volume > 1.0x AND CCI 0~150)
+
+Default to HOLD when uncertain. Missing a trade is better than losing.
+
+"""
+
+PROMPT_PREAMBLE = _PROMPT_INTRO + _PROMPT_RULES_TITLE + _PROMPT_HOLD_RULES + _PROMPT_BUY_RULES
+
+# 🆕 규칙 사전 선별 후 AI에 보내는 머리말 (HOLD 조건은 이미 걸러짐)
+PROMPT_PREAMBLE_SCREENED = _PROMPT_INTRO + _PROMPT_RULES_TITLE + _PROMPT_BUY_RULES
+
+# 🆕 출력 형식은 API(format / responseMimeType)가 강제하므로 스키마 한 줄만 안내
+PROMPT_OUTPUT = """Output ONLY valid JSON:
+{"decision": "BUY" or "HOLD", "confidence": 0.0-1.0, "reason": "brief"}
+
+JSON:"""
+
+# 🆕 단건 프롬프트 가변 구간 + 출력 안내를 하나의 format_map 템플릿으로
+_PROMPT_SINGLE_FMT = _PROMPT_DATA_FMT + PROMPT_OUTPUT.replace('{', '{{').replace('}', '}}')
+
+# 🆕 배치 프롬프트 (여러 종목을 한 번의 호출로 판단)
+_PROMPT_BATCH_LEARNING_FMT = """[LEARNING DATA - YOUR PAST PERFORMANCE]
+- Overall: {winrate:.1f}% win rate ({total_trades} trades)
+
+[STOCKS]
+"""
+
+_PROMPT_BATCH_STOCK_FMT = (
+    "{index}. code={stock_code} | Score: {rule_score:.1f}/100 | CCI(14): {cci:.1f}"
+    " | Change: {change_pct:+.2f}% | MA20 Distance: {distance_ma20:+.2f}%"
+    " | Volume: {volume_ratio:.2f}x | Bullish Days: {consec_bullish}\n"
+    "   Win rates: CCI {cci_zone} zone {cci_winrate:.1f}% ({cci_trades} trades),"
+    " Score {score_zone} zone {score_winrate:.1f}% ({score_trades} trades),"
+    " this stock {stock_winrate:.1f}% ({stock_trades} trades)"
+    " | Warnings: {batch_warning_text}\n"
+)
+
+PROMPT_BATCH_OUTPUT = """
+Decide EACH stock independently.
+Output ONLY a valid JSON array with one object per stock, in the same order:
+[{"code": "005930", "decision": "BUY", "confidence": 0.75, "reason": "brief"}, {"code": "000660", "decision": "HOLD", "confidence": 0.5, "reason": "brief"}]
+
+JSON:"""
+
+# 🆕 Ollama 컨텍스트 길이 (프롬프트 ~1K 토큰 + 배치 응답 여유)
+OLLAMA_NUM_CTX = 2048
+
+# 🆕 Ollama 단건 응답 최대 토큰 (JSON 한 줄 ~40토큰 + reason 여유)
+OLLAMA_NUM_PREDICT = 60
+
+# 🆕 Gemini 안전 설정 (BLOCK_NONE으로 설정하여 금융 관련 내용 허용 / 요청 간 공유)
+GEMINI_SAFETY_SETTINGS = (
+    {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
+    {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
+)
+
+# 🆕 배치 처리 설정
+AI_BATCH_SIZE = 4            # 한 번의 호출로 판단할 최대 종목 수
+GEMINI_WORKER_COUNT = 4      # 🆕 Gemini 워커 스레드 수 (HTTPS I/O 대기 위주)
+OLLAMA_WORKER_COUNT = 1      # 🆕 Ollama 워커 스레드 수 (OLLAMA_NUM_PARALLEL 설정 시 늘림)
+HEALTH_CHECK_TTL = 5.0       # 🆕 health_check 결과 재사용 시간 (초)
+AI_EXECUTOR_WORKERS = 8      # 🆕 generate_async 폴백 스레드 수 (aiohttp/httpx 미설치 시, asyncio 기본 executor와 분리)
+HTTPX_MAX_CONNECTIONS = 16   # 🆕 httpx 클라이언트 최대 연결 수 (HTTP/2는 연결당 여러 스트림)
+AI_BATCH_WAIT = 0.05         # 배치를 채우기 위해 추가 대기하는 시간 (초)
+AI_PRIORITY_THRESHOLD = 75   # 🆕 이 점수 이상 요청은 우선 큐에서 먼저 처리
+BATCH_TOKENS_PER_ITEM = 60   # 배치 응답 종목당 출력 토큰
+GEMINI_BATCH_TOKENS_PER_ITEM = 200  # 🆕 Gemini 배치 응답 종목당 출력 토큰 (단건 maxOutputTokens 와 동일)
+
+# 🆕 Ollama 출력 형식 강제 (문법 제약 디코딩 → 항상 유효한 JSON)
+OLLAMA_FORMAT_JSON = "json"
+OLLAMA_BATCH_FORMAT = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": {
+            "code": {"type": "string"},
+            "decision": {"type": "string", "enum": ["BUY", "HOLD", "SELL"]},
+            "confidence": {"type": "number"},
+            "reason": {"type": "string"},
+        },
+        "required": ["code", "decision", "confidence", "reason"],
+    },
+}
+
+# 🆕 Gemini 배치 응답 스키마 (responseSchema, OLLAMA_BATCH_FORMAT 과 같은 구조)
+GEMINI_BATCH_SCHEMA = {
+    "type": "ARRAY",
+    "items": {
+        "type": "OBJECT",
+        "properties": {
+            "code": {"type": "STRING"},
+            "decision": {"type": "STRING", "enum": ["BUY", "HOLD", "SELL"]},
+            "confidence": {"type": "NUMBER"},
+            "reason": {"type": "STRING"},
+        },
+        "required": ["code", "decision", "confidence", "reason"],
+    },
+}
+
+# 🆕 재시도 백오프 (지수 증가 + 지터로 워커들이 같은 시점에 몰리지 않도록)
+RETRY_BACKOFF_BASE = 0.25                        # 첫 재시도 대기 상한 (초, 매번 2배)
+RATE_LIMIT_STATUS = frozenset((429, 503))        # Retry-After 를 따르는 응답
+NON_RETRIABLE_STATUS = frozenset((400, 401, 403))  # 재시도해도 같은 결과 → 즉시 중단
+
+
+# =============================================================================
+# 🆕 API 에러
+# =============================================================================
+
+class AIAPIError(Exception):
+    """AI API 응답 에러 (HTTP 상태 코드 포함)"""
+    
+    def __init__(self, message: str, status: int = None):
+        super().__init__(message)
+        self.status = status
+    
+    @property
+    def retriable(self) -> bool:
+        """재시도 의미 여부 (잘못된 요청/인증 실패는 False)"""
+        return self.status not in NON_RETRIABLE_STATUS
+
+
+class RateLimitedError(AIAPIError):
+    """호출 한도 초과 (429/503) - retry_after: 서버가 지정한 대기 시간(초), 없으면 None"""
+    
+    def __init__(self, message: str, status: int = None, retry_after: float = None):
+        super().__init__(message, status)
+        self.retry_after = retry_after
+
+
+def _status_error(message: str, status: int, headers) -> AIAPIError:
+    """🆕 HTTP 에러 응답 → AIAPIError (429/503 은 Retry-After 포함 RateLimitedError)"""
+    if status not in RATE_LIMIT_STATUS:
+        return AIAPIError(message, status)
+    
+    try:
+        retry_after = float(headers.get('Retry-After'))
+    except (TypeError, ValueError):
+        retry_after = None  # 헤더 없음 또는 HTTP-date 형식 → 백오프 사용
+    return RateLimitedError(message, status, retry_after)
+
+
+# 🆕 패턴 통계 구간 (학습 통계 cci_stats / score_stats 키, 인덱스 = 구간 표 행 번호)
+CCI_ZONES = ('oversold', 'neutral', 'overbought')
+SCORE_ZONES = ('low', 'medium', 'high')
+
+
+def _cci_zone_index(cci: float) -> int:
+    """🆕 CCI 구간 인덱스 (CCI_ZONES)"""
+    if cci < -100:
+        return 0
+    if cci > 100:
+        return 2
+    return 1
+
+
+def _score_zone_index(rule_score: float) -> int:
+    """🆕 규칙 점수 구간 인덱스 (SCORE_ZONES)"""
+    if rule_score >= 80:
+        return 2
+    if rule_score >= 70:
+        return 1
+    return 0
+
+
+def _zone_table(zone_stats: Dict[str, Dict], zones: tuple) -> tuple:
+    """
+    🆕 구간별 통계 → ((승률, 거래 수), ...) 표 (행 = zones 순서, 통계 없는 구간은 50% / 0건)
+    
+    스냅샷 갱신 시 한 번 만들어 두고 프롬프트마다 인덱스로만 읽습니다.
+    """
+    return tuple(
+        (stats.get('winrate', 50), int(stats.get('total', 0)))
+        for stats in (zone_stats.get(zone, {}) for zone in zones)
+    )
+
+
+# =============================================================================
+# 🆕 객체 풀 (단기 객체 재사용으로 할당/해제 부담 감소)
+# =============================================================================
+
+OBJECT_POOL_SIZE = 256
+
+
+class _ObjectPool:
+    """
+    데이터 클래스 인스턴스 free-list
+    
+    반납된 인스턴스의 필드를 제자리에서 다시 채워 재사용합니다.
+    frozen 데이터 클래스이므로 object.__setattr__로 필드를 기록합니다.
+    deque의 append/pop은 원자적이라 별도 락이 필요 없습니다.
+    """
+    __slots__ = ('cls', 'free', '_fields')
+    
+    def __init__(self, cls, maxlen: int = OBJECT_POOL_SIZE):
+        self.cls = cls
+        self.free = deque(maxlen=maxlen)
+        self._fields = [(f.name, f.default, f.default_factory) for f in fields(cls)]
+    
+    def acquire(self, **values):
+        """인스턴스 획득 (풀이 비어 있으면 새로 생성)"""
+        try:
+            obj = self.free.pop()
+        except IndexError:
+            return self.cls(**values)
+        
+        for name, default, default_factory in self._fields:
+            if name in values:
+                value = values[name]
+            elif default is not MISSING:
+                value = default
+            elif default_factory is not MISSING:
+                value = default_factory()
+            else:
+                self.free.append(obj)
+                raise TypeError(f"{self.cls.__name__}.acquire() 필수 필드 누락: '{name}'")
+            object.__setattr__(obj, name, value)
+        return obj
+    
+    def release(self, obj):
+        """인스턴스 반납 (반납 후에는 참조를 보관하지 말 것)"""
+        self.free.append(obj)
+
+
+# =============================================================================
+# 🆕 요청 큐 (deque + Condition)
+# =============================================================================
+
+class TimedQueue:
+    """
+    timestamp 속성을 가진 항목용 FIFO 큐
+    
+    - 가득 차면 가장 오래된 항목을 밀어내고 새 항목을 넣습니다.
+    - prune_older_than()으로 만료 항목을 락 한 번에 앞에서부터 일괄 제거합니다.
+      (항목이 들어온 순서 = timestamp 순서)
+    - 🆕 key 함수가 주어지면 같은 키의 대기 항목은 최신 항목 하나로 합칩니다.
+    - 🆕 close()는 대기 중인 get()을 즉시 깨웁니다 (종료 신호, 폴링 불필요).
+    - 🆕 priority 함수가 True인 항목은 별도 우선 큐에 넣고 항상 먼저 꺼냅니다.
+      (우선/일반 큐는 크기 상한이 따로라 일반 요청이 몰려도 우선 자리를 뺏지 않음)
+    """
+    
+    def __init__(
+        self,
+        maxsize: int = 0,
+        key: Callable[[Any], Any] = None,
+        priority: Callable[[Any], bool] = None,
+        hi_maxsize: int = None,
+    ):
+        self.maxsize = maxsize
+        self.hi_maxsize = maxsize if hi_maxsize is None else hi_maxsize
+        self._dq = deque()   # 일반 큐
+        self._hi = deque()   # 🆕 우선 큐
+        self._cond = threading.Condition(threading.Lock())
+        self._key = key
+        self._priority = priority
+        self._pending: Dict[Any, Any] = {}  # 키 → 대기 항목
+        self._closed = False
+    
+    def put(self, item):
+        """
+        항목 추가
+        
+        같은 키의 대기 항목이 있으면 그 항목을 빼고 새 항목을 맨 뒤에 넣습니다.
+        
+        Returns:
+            대체되거나 밀려난 항목 (없으면 None)
+        """
+        high = self._priority is not None and self._priority(item)
+        dq, limit = (self._hi, self.hi_maxsize) if high else (self._dq, self.maxsize)
+        
+        with self._cond:
+            dropped = None
+            if self._key is not None:
+                k = self._key(item)
+                dropped = self._pending.get(k)
+                if dropped is not None:
+                    self._remove(dropped)
+                self._pending[k] = item
+            
+            if dropped is None and limit > 0 and len(dq) >= limit:
+                dropped = self._popleft(dq)
+            
+            dq.append(item)
+            self._cond.notify()
+            return dropped
+    
+    def get(self, timeout: float = None):
+        """
+        항목 꺼내기 (🆕 우선 큐 먼저)
+        
+        timeout 내에 없으면 Empty, 🆕 close() 된 빈 큐면 None (종료 신호)
+        """
+        with self._cond:
+            if not self._cond.wait_for(lambda: self._hi or self._dq or self._closed, timeout):
+                raise Empty
+            if not (self._hi or self._dq):
+                return None
+            return self._popleft(self._hi or self._dq)
+    
+    def get_nowait(self):
+        """항목 즉시 꺼내기 (없으면 Empty)"""
+        with self._cond:
+            if not (self._hi or self._dq):
+                raise Empty
+            return self._popleft(self._hi or self._dq)
+    
+    def prune_older_than(self, max_age: float) -> list:
+        """
+        max_age 초보다 오래된 항목 일괄 제거
+        
+        Returns:
+            제거된 항목 리스트
+        """
+        cutoff = time.monotonic() - max_age
+        pruned = []
+        with self._cond:
+            for dq in (self._hi, self._dq):
+                while dq and dq[0].timestamp < cutoff:
+                    pruned.append(self._popleft(dq))
+        return pruned
+    
+    def drain(self) -> list:
+        """🆕 대기 항목 전부 꺼내기 (락 한 번, 항목별 예외 처리 없음)"""
+        with self._cond:
+            items = list(self._hi) + list(self._dq)
+            self._hi.clear()
+            self._dq.clear()
+            self._pending.clear()
+        return items
+    
+    def close(self):
+        """🆕 대기 중인 get()을 모두 깨우고 이후 빈 큐에서는 None 반환"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+    
+    def reopen(self):
+        """🆕 close() 해제 (워커 재시작 시)"""
+        with self._cond:
+            self._closed = False
+    
+    def _popleft(self, dq: deque):
+        """dq 맨 앞 항목 제거 (락 보유 상태에서 호출)"""
+        item = dq.popleft()
+        self._forget(item)
+        return item
+    
+    def _remove(self, item):
+        """🆕 대체될 대기 항목 제거 (락 보유 상태에서 호출, 합침 인덱스는 호출자가 갱신)"""
+        try:
+            self._dq.remove(item)
+        except ValueError:
+            self._hi.remove(item)
+    
+    def _forget(self, item):
+        """합침 인덱스에서 항목 제거 (락 보유 상태에서 호출)"""
+        if self._key is not None:
+            k = self._key(item)
+            if self._pending.get(k) is item:
+                del self._pending[k]
+    
+    def qsize(self) -> int:
+        return len(self._hi) + len(self._dq)
+    
+    def hi_qsize(self) -> int:
+        """🆕 우선 큐 대기 수"""
+        return len(self._hi)
+    
+    def lo_qsize(self) -> int:
+        """🆕 일반 큐 대기 수"""
+        return len(self._dq)
+    
+    def empty(self) -> bool:
+        return not (self._hi or self._dq)
+
+
 # =============================================================================
 # 데이터 클래스
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)  # 🆕 __dict__ 제거 + 불변
 class AIRequest:
     """AI 분석 요청 데이터"""
     stock_code: str                    # 종목 코드
@@ -57,10 +619,19 @@ class AIRequest:
     rule_score: float                  # 규칙 기반 점수 (0~100)
     market_state: Dict[str, Any]       # 시장 상태
     current_price: float               # 현재가
-    timestamp: float = field(default_factory=time.time)
+    timestamp: float = field(default_factory=time.monotonic)  # 🆕 단조 시계 (대기 시간 계산용)
+    
+    @classmethod
+    def acquire(cls, **values) -> 'AIRequest':
+        """🆕 풀에서 인스턴스 획득"""
+        return _POOLS[cls].acquire(**values)
+    
+    def release(self):
+        """🆕 풀에 반납 (처리 완료 후 호출)"""
+        _POOLS[type(self)].release(self)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)  # 🆕 __dict__ 제거 + 불변
 class AIResult:
     """AI 분석 결과 데이터"""
     stock_code: str                    # 종목 코드
@@ -70,7 +641,25 @@ class AIResult:
     reason: str                        # 판단 이유
     original_price: float              # 분석 시점 가격
     elapsed: float                     # AI 응답 시간 (초)
-    timestamp: float = field(default_factory=time.time)
+    rule_score: float = 0.0            # 규칙 기반 점수
+    indicators: Dict[str, Any] = field(default_factory=dict)  # 지표 (CCI 포함)
+    timestamp: float = field(default_factory=time.time)  # 실제 시각 (가격 검증용)
+    
+    @classmethod
+    def acquire(cls, **values) -> 'AIResult':
+        """🆕 풀에서 인스턴스 획득"""
+        return _POOLS[cls].acquire(**values)
+    
+    def release(self):
+        """🆕 풀에 반납 (처리 완료 후 호출)"""
+        _POOLS[type(self)].release(self)
+
+
+# 🆕 클래스별 객체 풀
+_POOLS = {
+    AIRequest: _ObjectPool(AIRequest),
+    AIResult: _ObjectPool(AIResult),
+}
 
 
 # =============================================================================
@@ -97,7 +686,16 @@ class AIEngine:
                 - model: 사용할 모델명
                 - timeout: API 타임아웃 (초)
                 - max_queue_size: 최대 큐 크기
+                - max_result_queue_size: 🆕 결과 큐 최대 크기 (기본: max_queue_size)
                 - retry_count: 재시도 횟수
+                - max_concurrent: 🆕 워커당 동시 처리 요청 수 (aiohttp)
+                - worker_count: 🆕 워커 스레드 수 (기본: Gemini 4, Ollama 1)
+                - batch_size: 🆕 한 번의 호출로 판단할 최대 종목 수
+                - stream: 🆕 Ollama 응답 스트리밍 후 JSON 완성 시 조기 종료 (기본 True)
+                - priority_threshold: 🆕 우선 처리 규칙 점수 (기본 75)
+                - max_hi_queue_size: 🆕 우선 큐 최대 크기 (기본: max_queue_size)
+                - rule_screen: 🆕 명백한 HOLD 조건은 API 호출 없이 판단 (기본 True)
+                - ai_workers: 🆕 generate_async 폴백 스레드 수 (aiohttp/httpx 미설치 시만 사용, 기본 8)
             secrets: API 키 등 비밀 설정
         """
         self.config = config
@@ -120,39 +718,240 @@ class AIEngine:
             self.model = config.get('model', 'qwen3:8b')
             self.api_key = None
         
+        # 🆕 요청 헤더 (로컬 Ollama는 응답 압축 비활성화)
+        self._headers = {"Content-Type": "application/json"}
+        if urlsplit(self.api_url).hostname in _LOCAL_HOSTS:
+            self._headers["Accept-Encoding"] = "identity"
+        
         self.timeout = config.get('timeout', 10)
         self.max_queue_size = config.get('max_queue_size', 50)
         self.retry_count = config.get('retry_count', 2)
         self.min_confidence = config.get('min_confidence', 0.6)
+        self.max_request_age = config.get('max_request_age', 5.0)  # 🆕 요청 유효 시간 (초)
+        self.keep_alive = config.get('keep_alive', '30m')  # 🆕 Ollama 모델 메모리 유지 시간
+        self.num_ctx = config.get('num_ctx', OLLAMA_NUM_CTX)  # 🆕 Ollama 컨텍스트 길이 (고정)
+        self.stream = config.get('stream', True)  # 🆕 Ollama JSON 응답 스트리밍 (완성 즉시 중단)
+        self.max_concurrent = max(1, config.get('max_concurrent', 2))  # 🆕 워커당 동시 요청 수
+        # 🆕 워커 스레드 수 (Ollama 단일 서버는 병렬 요청 시 오히려 느려지므로 1)
+        default_workers = GEMINI_WORKER_COUNT if self.provider == 'gemini' else OLLAMA_WORKER_COUNT
+        self.worker_count = max(1, config.get('worker_count', default_workers))
+        self.batch_size = max(1, config.get('batch_size', AI_BATCH_SIZE))  # 🆕 호출당 최대 종목 수
+        # 🆕 배치 응답 종목당 출력 토큰 (Gemini 2.5는 사고 토큰도 출력 한도에 포함)
+        self._batch_tokens_per_item = (
+            GEMINI_BATCH_TOKENS_PER_ITEM if self.provider == 'gemini' else BATCH_TOKENS_PER_ITEM
+        )
+        self.priority_threshold = config.get('priority_threshold', AI_PRIORITY_THRESHOLD)  # 🆕 우선 처리 점수
+        self.rule_screen = config.get('rule_screen', True)  # 🆕 규칙 사전 선별 (명백한 HOLD는 API 생략)
+        
+        # 🆕 요청 바디 고정 구간 (요청마다 다시 만들지 않음 / 워커 간 공유, 변경 금지)
+        self._gemini_config = {
+            "temperature": 0.1,
+            "maxOutputTokens": 200,
+            "topP": 0.9,
+            "responseMimeType": "application/json",  # JSON 출력 강제
+        }
+        self._ollama_options = {
+            "temperature": 0,       # greedy 디코딩 (일관된 응답)
+            "num_predict": OLLAMA_NUM_PREDICT,  # 최대 토큰 수 제한
+            "top_k": 10,            # 후보 토큰 축소
+            "top_p": 0.9,
+            "num_ctx": self.num_ctx,  # 고정 (변경 시 모델 재로드 + KV 캐시 초기화)
+        }
         
-        # 비동기 Queue
-        self.request_queue: Queue[Dict] = Queue(maxsize=self.max_queue_size)
-        self.result_queue: Queue[Dict] = Queue()
-        
-        # 워커 스레드 관리
-        self._worker: Optional[threading.Thread] = None
-        self._running = False
+        # 🆕 프롬프트 고정 구간 (요청마다 다시 만들지 않음)
+        self._prompt_head = PROMPT_PREAMBLE_SCREENED if self.rule_screen else PROMPT_PREAMBLE
+        self._prompt_batch_tail = PROMPT_BATCH_OUTPUT
+        
+        # 🆕 HTTP 세션 (Ollama/Gemini 연결 재사용, Keep-Alive)
+        # 스레드마다 별도 세션 → 워커 간 커넥션 풀 락 경합 없음 (stop() 시 모두 닫음)
+        self._tls = threading.local()
+        self._sessions = []
+        self._sessions_lock = threading.Lock()
+        
+        # 🆕 generate_async 용 비동기 클라이언트 {이벤트 루프: 클라이언트} (루프마다 하나, 호출 간 재사용)
+        # 루프가 사라지면 항목도 사라짐 (aiohttp 세션은 생성한 루프에서만 사용 가능)
+        self._async_clients = weakref.WeakKeyDictionary()
+        
+        # 🆕 generate_async 폴백 executor (aiohttp/httpx 미설치 시만, 첫 호출 시 생성)
+        self.ai_workers = max(1, config.get('ai_workers', AI_EXECUTOR_WORKERS))
+        self._ai_executor: Optional[ThreadPoolExecutor] = None
+        
+        # 비동기 Queue (🆕 요청/결과 모두 상한, 가득 차면 가장 오래된 항목 폐기)
+        # 🆕 같은 종목의 대기 요청은 최신 지표 하나로 합침
+        # 🆕 규칙 점수가 높은 요청은 우선 큐로 (일반 요청 적체에 밀리지 않도록)
+        self.request_queue = TimedQueue(
+            maxsize=self.max_queue_size,
+            key=attrgetter('stock_code'),
+            priority=self._is_high_priority,
+            hi_maxsize=config.get('max_hi_queue_size', self.max_queue_size),
+        )
+        # 🆕 결과 큐는 get_nowait 위주라 조건 변수가 없는 SimpleQueue + 크기 카운터
+        self.result_queue: SimpleQueue = SimpleQueue()
+        self.max_result_queue_size = config.get('max_result_queue_size', self.max_queue_size)
+        self._result_count = 0
+        self._result_lock = threading.Lock()
+        
+        # 워커 스레드 관리 (🆕 여러 개)
+        self._workers: list = []
+        self._stop_event = threading.Event()  # 🆕 종료 신호 (set = 중지 상태)
+        self._stop_event.set()
         self._lock = threading.Lock()
         
-        # 통계
-        self._stats = {
-            'total_requests': 0,
-            'success_count': 0,
-            'timeout_count': 0,
-            'error_count': 0,
-            'avg_response_time': 0.0,
-        }
+        # 통계 (🆕 카운터는 정수 딕셔너리, 증가만 짧은 락으로 보호)
+        self._counters: Dict[str, int] = dict.fromkeys(STAT_COUNTERS, 0)
+        self._counters_lock = threading.Lock()
+        self._avg_response_time = 0.0
+        
+        # 🆕 처리 중인 요청 {종목코드: 요청 시각(monotonic)}
+        self._inflight: Dict[str, float] = {}
+        self._inflight_lock = threading.Lock()
+        
+        # 🆕 판단 캐시 {양자화 지표 키: (저장 시각, 파싱 결과)} (LRU 순서)
+        self._decision_cache: 'OrderedDict[tuple, tuple]' = OrderedDict()
+        self._cache_lock = threading.Lock()
         
         # 누적 학습 저장소 (지연 로딩)
         self._learning_store = None
+        # 🆕 학습 통계 스냅샷 (조회 시각, 전체 통계, 패턴 통계, {종목코드: 종목 통계})
+        self._learning_cache: Optional[tuple] = None
+        self._learning_lock = threading.Lock()  # 만료 시 한 워커만 다시 조회
+        
+        # 🆕 상태 확인 캐시 (확인 시각(monotonic), 결과) - 동시 호출은 한 번의 확인 결과를 공유
+        self._health_cache = (float('-inf'), False)
+        self._health_lock = threading.Lock()
         
         provider_display = f"Gemini ({self.model})" if self.provider == 'gemini' else f"Ollama ({self.model})"
-        logger.info(f"AI 엔진 초기화 완료 (제공자: {provider_display}, 타임아웃: {self.timeout}초)")
+        logger.info("AI 엔진 초기화 완료 (제공자: %s, 타임아웃: %s초)", provider_display, self.timeout)
+    
+    @staticmethod
+    def _create_session(max_concurrent: int, headers: Dict[str, str]) -> requests.Session:
+        """
+        🆕 HTTP 세션 생성 (동시 요청 수만큼 커넥션 유지)
+        
+        공통 헤더는 세션에 한 번만 설정하고, 재시도는 _call_api_with_retry 가
+        담당하므로 어댑터 자체 재시도는 끕니다.
+        """
+        session = requests.Session()
+        session.headers.update(headers)
+        adapter = HTTPAdapter(pool_connections=2, pool_maxsize=max(4, max_concurrent), max_retries=0)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _get_session(self) -> requests.Session:
+        """🆕 현재 스레드 전용 HTTP 세션 (첫 호출 시 생성)"""
+        session = getattr(self._tls, 'session', None)
+        if session is None:
+            session = self._create_session(self.max_concurrent, self._headers)
+            self._tls.session = session
+            with self._sessions_lock:
+                self._sessions.append(session)
+        return session
+    
+    def _close_sessions(self):
+        """🆕 생성된 세션 모두 닫기 (종료된 워커의 세션 참조도 함께 정리)"""
+        with self._sessions_lock:
+            sessions, self._sessions = self._sessions, []
+            self._tls = threading.local()
+        
+        for session in sessions:
+            session.close()
+    
+    def _get_async_client(self):
+        """🆕 현재 이벤트 루프의 generate_async 클라이언트 (없거나 닫혔으면 생성)"""
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            client = self._async_clients.get(loop)
+            if client is None or self._async_client_closed(client):
+                client = self._async_clients[loop] = self._create_async_client()
+            return client
+    
+    @staticmethod
+    def _async_client_closed(client) -> bool:
+        """🆕 비동기 클라이언트 닫힘 여부 (aiohttp/httpx 공통)"""
+        if HTTPX_AVAILABLE and isinstance(client, httpx.AsyncClient):
+            return client.is_closed
+        return client.closed
+    
+    @staticmethod
+    def _async_client_close(client):
+        """🆕 비동기 클라이언트 닫기 코루틴 (aiohttp/httpx 공통)"""
+        if HTTPX_AVAILABLE and isinstance(client, httpx.AsyncClient):
+            return client.aclose()
+        return client.close()
+    
+    async def aclose_async_client(self):
+        """
+        🆕 현재 이벤트 루프의 generate_async 클라이언트 닫기
+        
+        asyncio.run() 으로 만든 임시 루프에서 generate_async 를 썼다면
+        루프가 끝나기 전에 호출하세요 (닫힌 루프의 클라이언트는 정리할 수 없음).
+        """
+        loop = asyncio.get_running_loop()
+        with self._sessions_lock:
+            client = self._async_clients.pop(loop, None)
+        
+        if client is not None:
+            await self._async_client_close(client)
+    
+    def _close_async_clients(self):
+        """🆕 모든 generate_async 클라이언트 닫기 (각 클라이언트의 루프에서 실행)"""
+        with self._sessions_lock:
+            clients = list(self._async_clients.items())
+            self._async_clients.clear()
+        
+        try:
+            current = asyncio.get_running_loop()
+        except RuntimeError:
+            current = None
+        
+        for loop, client in clients:
+            if loop.is_closed():
+                continue  # 루프와 함께 정리됨
+            
+            coro = self._async_client_close(client)
+            if loop is current:
+                loop.create_task(coro)
+            elif loop.is_running():
+                asyncio.run_coroutine_threadsafe(coro, loop)
+            else:
+                try:
+                    loop.run_until_complete(coro)
+                except RuntimeError as e:
+                    coro.close()
+                    logger.debug("비동기 클라이언트 정리 생략: %s", e)
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """🆕 generate_async 폴백 executor (없으면 생성)"""
+        with self._sessions_lock:
+            if self._ai_executor is None:
+                self._ai_executor = ThreadPoolExecutor(
+                    max_workers=self.ai_workers,
+                    thread_name_prefix='aiengine',
+                )
+            return self._ai_executor
+    
+    def _shutdown_executor(self):
+        """🆕 generate_async 폴백 executor 종료 (진행 중인 호출은 끝까지 실행, 대기하지 않음)"""
+        with self._sessions_lock:
+            executor, self._ai_executor = self._ai_executor, None
+        
+        if executor is not None:
+            executor.shutdown(wait=False)
     
     # =========================================================================
     # 누적 학습 저장소
     # =========================================================================
     
+    def _close_learning_store(self):
+        """🆕 지연 생성한 학습 저장소 닫기 (대기 기록 반영, 다음 사용 시 다시 생성)"""
+        store, self._learning_store = self._learning_store, None
+        if store is not None:
+            try:
+                store.close()
+            except Exception as e:
+                logger.error("학습 저장소 종료 실패: %s", e)
+    
     @property
     def learning_store(self):
         """누적 학습 저장소 (지연 로딩)"""
@@ -161,6 +960,45 @@ class AIEngine:
             self._learning_store = LearningStore()
         return self._learning_store
     
+    def _learning_snapshot(self) -> tuple:
+        """
+        🆕 전체/패턴 학습 통계 조회 (LEARNING_STATS_TTL 동안 재사용)
+        
+        프롬프트마다 저장소를 읽지 않도록 캐시합니다.
+        🆕 여러 워커가 동시에 만료를 만나도 저장소 조회는 한 번만 합니다.
+        
+        Returns:
+            (전체 통계, CCI 구간 표, 점수 구간 표, 종목 통계 캐시 dict)
+            🆕 구간 표는 _zone_table 형식 (행: CCI_ZONES / SCORE_ZONES)
+        """
+        cached = self._learning_cache
+        if cached is not None and time.monotonic() - cached[0] < LEARNING_STATS_TTL:
+            return cached[1:]
+        
+        with self._learning_lock:
+            cached = self._learning_cache
+            if cached is not None and time.monotonic() - cached[0] < LEARNING_STATS_TTL:
+                return cached[1:]
+            
+            stats = self.learning_store.get_stats()
+            pattern_stats = self.learning_store.get_pattern_stats()
+            self._learning_cache = (
+                time.monotonic(),
+                stats,
+                _zone_table(pattern_stats.get('cci_stats', {}), CCI_ZONES),
+                _zone_table(pattern_stats.get('score_stats', {}), SCORE_ZONES),
+                {},
+            )
+            return self._learning_cache[1:]
+    
+    def _stock_learning_stats(self, stock_code: str, stock_cache: Dict[str, Dict]) -> Dict:
+        """🆕 종목별 학습 통계 (스냅샷과 같은 TTL 동안 재사용)"""
+        stats = stock_cache.get(stock_code)
+        if stats is None:
+            stats = self.learning_store.get_stock_stats(stock_code)
+            stock_cache[stock_code] = stats
+        return stats
+    
     # =========================================================================
     # 워커 스레드 관리
     # =========================================================================
@@ -172,18 +1010,25 @@ class AIEngine:
         이미 실행 중이면 무시합니다.
         """
         with self._lock:
-            if self._running:
+            if not self._stop_event.is_set():
                 logger.warning("AI 워커가 이미 실행 중입니다.")
                 return
             
-            self._running = True
-            self._worker = threading.Thread(
-                target=self._worker_loop,
-                name="AI-Worker",
-                daemon=True  # 메인 스레드 종료 시 함께 종료
-            )
-            self._worker.start()
-            logger.info("🧠 AI 워커 스레드 시작")
+            self._stop_event.clear()
+            self.request_queue.reopen()
+            
+            # 🆕 워커 여러 개가 같은 request_queue를 나눠 처리
+            self._workers = [
+                threading.Thread(
+                    target=self._worker_loop,
+                    name=f"AI-Worker-{i}",
+                    daemon=True  # 메인 스레드 종료 시 함께 종료
+                )
+                for i in range(self.worker_count)
+            ]
+            for worker in self._workers:
+                worker.start()
+            logger.info("🧠 AI 워커 스레드 시작 (%s개)", self.worker_count)
     
     def stop(self):
         """
@@ -192,21 +1037,32 @@ class AIEngine:
         현재 처리 중인 요청은 완료될 때까지 대기합니다.
         """
         with self._lock:
-            if not self._running:
+            if self._stop_event.is_set():
+                self._close_async_clients()  # 🆕 워커 없이 generate_async 만 사용한 경우
+                self._close_learning_store()  # 🆕 워커 없이 record_result 만 사용한 경우
                 return
             
-            self._running = False
+            self._stop_event.set()
+            self.request_queue.close()  # 🆕 요청 대기 중인 워커 즉시 깨우기
             logger.info("AI 워커 중지 요청...")
             
-            # 워커 스레드 종료 대기 (최대 5초)
-            if self._worker and self._worker.is_alive():
-                self._worker.join(timeout=5)
+            # 워커 스레드 종료 대기 (전체 최대 5초)
+            deadline = time.monotonic() + 5
+            for worker in self._workers:
+                if worker.is_alive():
+                    worker.join(timeout=max(0.0, deadline - time.monotonic()))
+            
+            # 🆕 스레드별 세션 정리 (다음 호출 시 새 세션 생성)
+            self._close_sessions()
+            self._close_async_clients()
+            self._shutdown_executor()
+            self._close_learning_store()  # 🆕 대기 중인 매매 결과 기록 반영
             
             logger.info("🛑 AI 워커 스레드 중지됨")
     
     def is_running(self) -> bool:
         """워커 실행 상태 확인"""
-        return self._running
+        return not self._stop_event.is_set()
     
     # =========================================================================
     # 분석 요청/결과 인터페이스
@@ -244,39 +1100,158 @@ class AIEngine:
             current_price: 현재가
         
         Returns:
-            True: 요청 성공
-            False: 큐가 가득 참
+            True: 요청 성공 (🆕 규칙 선별 HOLD 포함)
+            False: 워커 미실행, 🆕 같은 종목 처리 중, 또는 큐 추가 실패
+        
+        🆕 큐가 가득 차면 가장 오래된 요청을 버리고 새 요청을 넣습니다.
+        🆕 같은 종목의 대기 요청이 있으면 새 요청(최신 지표)으로 대체합니다.
+        🆕 명백한 HOLD 조건이면 큐를 거치지 않고 HOLD 결과를 바로 넣습니다.
         """
-        if not self._running:
+        if self._stop_event.is_set():
             logger.warning("AI 워커가 실행 중이 아닙니다.")
             return False
         
-        # 큐가 가득 찼는지 확인
-        if self.request_queue.full():
-            logger.warning(f"AI 요청 큐가 가득 참 ({self.max_queue_size}개)")
+        # 🆕 규칙 사전 선별 (API 호출 없이 HOLD)
+        if self.rule_screen:
+            try:
+                screen_reason = self._rule_screen(indicators, market_state, rule_score, stock_code)
+            except Exception as e:
+                # 선별 실패는 매매 루프로 올리지 않고 일반 경로(AI 판단)로 진행
+                logger.warning("AI 사전 선별 실패 (%s): %s", stock_code, e)
+                screen_reason = None
+            if screen_reason is not None:
+                self._inc_stat('screened_holds')
+                self._put_result(AIResult.acquire(
+                    stock_code=stock_code,
+                    stock_name=stock_name,
+                    decision='HOLD',
+                    confidence=SCREEN_CONFIDENCE,
+                    reason=f"rule-screen:{screen_reason}",
+                    original_price=current_price,
+                    rule_score=rule_score,
+                    indicators=indicators,
+                    elapsed=0.0,
+                    timestamp=time.time(),
+                ))
+                logger.debug("AI 사전 선별 HOLD: %s (%s)", stock_code, screen_reason)
+                return True
+        
+        # 🆕 같은 종목을 이미 처리 중이면 그 결과를 사용 (중복 API 호출 방지)
+        if self._is_inflight(stock_code):
+            self._inc_stat('deduped')
+            logger.debug("AI 요청 중복 (처리 중): %s", stock_code)
             return False
         
-        # 요청 데이터 생성
-        request = {
-            'stock_code': stock_code,
-            'stock_name': stock_name,
-            'indicators': indicators,
-            'rule_score': rule_score,
-            'market_state': market_state,
-            'current_price': current_price,
-            'timestamp': time.time(),
-        }
+        # 요청 데이터 생성 (🆕 풀에서 재사용)
+        request = AIRequest.acquire(
+            stock_code=stock_code,
+            stock_name=stock_name,
+            indicators=indicators,
+            rule_score=rule_score,
+            market_state=market_state,
+            current_price=current_price,
+            timestamp=time.monotonic(),
+        )
+        
+        # 🆕 만료된 요청을 먼저 정리해 새 요청이 살아있는 요청을 밀어내지 않게 함
+        self._prune_stale_requests()
         
         try:
-            self.request_queue.put_nowait(request)
-            self._stats['total_requests'] += 1
-            logger.debug(f"AI 분석 요청: {stock_code} {stock_name}")
+            dropped = self.request_queue.put(request)
+            if dropped is not None:
+                if dropped.stock_code == stock_code:
+                    # 🆕 같은 종목 대기 요청 → 최신 요청으로 대체
+                    self._inc_stat('coalesced_count')
+                    logger.debug("AI 요청 합침 (최신 지표로 대체): %s", stock_code)
+                else:
+                    self._inc_stat('dropped_count')
+                    logger.debug("AI 큐 초과 - 오래된 항목 폐기: %s", dropped.stock_code)
+                dropped.release()
+            self._inc_stat('total_requests')
+            logger.debug("AI 분석 요청: %s %s", stock_code, stock_name)
             return True
         except Exception as e:
-            logger.error(f"AI 요청 큐 추가 실패: {e}")
+            logger.error("AI 요청 큐 추가 실패: %s", e)
             return False
     
-    def get_result(self, timeout: float = 0) -> Optional[Dict]:
+    def _rule_screen(
+        self,
+        indicators: Dict[str, Any],
+        market_state: Dict[str, Any],
+        rule_score: float,
+        stock_code: str,
+    ) -> Optional[str]:
+        """
+        🆕 규칙 사전 선별 (프롬프트의 MUST HOLD 조건을 Python에서 먼저 판단)
+        
+        지표/시장 상태/학습 통계만으로 결정되는 조건이라 AI 호출이 필요 없습니다.
+        
+        지표 값이 None 이면 없는 것으로 보고 기본값을 사용합니다.
+        
+        Returns:
+            HOLD 사유 태그 (예: "cci_overbought"), 해당 없으면 None
+        """
+        indicators = indicators or {}
+        market_state = market_state or {}
+        
+        def value(key: str, default: float) -> float:
+            v = indicators.get(key)
+            return default if v is None else v
+        
+        cci = value('cci', 0)
+        if cci > SCREEN_CCI_MAX:
+            return 'cci_overbought'
+        if cci < SCREEN_CCI_MIN:
+            return 'cci_oversold'
+        if value('volume_ratio', 1.0) < SCREEN_VOLUME_MIN:
+            return 'low_volume'
+        if value('change_pct', 0) > SCREEN_CHANGE_MAX:
+            return 'already_pumped'
+        
+        market_mode = market_state.get('mode') or 'NORMAL'
+        if market_mode in SCREEN_HOLD_MODES:
+            return f"market_{market_mode.lower()}"
+        
+        # 패턴 승률 (프롬프트 경고와 같은 기준)
+        try:
+            _, cci_table, score_table, stock_cache = self._learning_snapshot()
+            for zone_winrate, zone_trades in (
+                cci_table[_cci_zone_index(cci)],
+                score_table[_score_zone_index(rule_score or 0)],
+            ):
+                if zone_trades >= PATTERN_MIN_TRADES and zone_winrate < PATTERN_WARN_WINRATE:
+                    return 'low_pattern_winrate'
+            
+            stock_stats = self._stock_learning_stats(stock_code, stock_cache)
+            if (stock_stats.get('total_trades', 0) >= STOCK_MIN_TRADES
+                    and stock_stats.get('winrate', 50) < PATTERN_WARN_WINRATE):
+                return 'low_stock_winrate'
+        except Exception as e:
+            logger.debug("학습 데이터 로드 실패: %s", e)
+        
+        return None
+    
+    def _put_result(self, result: AIResult):
+        """
+        🆕 결과 큐에 추가 (max_result_queue_size 초과 시 가장 오래된 결과 폐기)
+        
+        소비자가 멈춰도 결과가 무한히 쌓이지 않도록 합니다.
+        """
+        with self._result_lock:
+            while self._result_count >= self.max_result_queue_size:
+                try:
+                    dropped = self.result_queue.get_nowait()
+                except Empty:
+                    break
+                self._result_count -= 1
+                self._inc_stat('dropped_count')
+                logger.debug("AI 결과 큐 초과 - 오래된 결과 폐기: %s", dropped.stock_code)
+                dropped.release()
+            
+            self.result_queue.put(result)
+            self._result_count += 1
+    
+    def get_result(self, timeout: float = 0) -> Optional[AIResult]:
         """
         AI 분석 결과 가져오기 (논블로킹)
         
@@ -287,38 +1262,42 @@ class AIEngine:
             timeout: 대기 시간 (초). 0이면 즉시 반환.
         
         Returns:
-            결과 딕셔너리 또는 None
-            {
-                'stock_code': str,
-                'stock_name': str,
-                'decision': str,  # BUY / HOLD / SELL
-                'confidence': float,  # 0.0 ~ 1.0
-                'reason': str,
-                'original_price': float,
-                'elapsed': float,
-            }
+            🆕 AIResult 또는 None
+            (stock_code, stock_name, decision, confidence, reason,
+             original_price, elapsed, rule_score, indicators, timestamp)
+            사용이 끝나면 result.release()로 풀에 반납할 수 있습니다.
         """
         try:
             if timeout > 0:
-                return self.result_queue.get(timeout=timeout)
+                result = self.result_queue.get(timeout=timeout)
             else:
-                return self.result_queue.get_nowait()
+                result = self.result_queue.get_nowait()
         except Empty:
             return None
+        
+        with self._result_lock:
+            self._result_count -= 1
+        return result
     
     def get_all_results(self) -> list:
         """
         모든 대기 중인 결과 가져오기
         
         Returns:
-            결과 딕셔너리 리스트
+            AIResult 리스트
         """
+        return self._drain_results()
+    
+    def _drain_results(self) -> list:
+        """🆕 결과 큐 일괄 비우기 (크기 카운터만큼만 꺼내 Empty 예외 루프 방지)"""
         results = []
-        while True:
-            result = self.get_result()
-            if result is None:
-                break
-            results.append(result)
+        with self._result_lock:
+            for _ in range(self._result_count):
+                try:
+                    results.append(self.result_queue.get_nowait())
+                except Empty:
+                    break
+            self._result_count -= len(results)
         return results
     
     def clear_queues(self):
@@ -327,26 +1306,15 @@ class AIEngine:
         
         비상 모드 진입 시 호출합니다.
         """
-        cleared_requests = 0
-        cleared_results = 0
-        
-        # 요청 큐 비우기
-        while not self.request_queue.empty():
-            try:
-                self.request_queue.get_nowait()
-                cleared_requests += 1
-            except Empty:
-                break
-        
-        # 결과 큐 비우기
-        while not self.result_queue.empty():
-            try:
-                self.result_queue.get_nowait()
-                cleared_results += 1
-            except Empty:
-                break
-        
-        logger.info(f"AI 큐 비움 (요청: {cleared_requests}, 결과: {cleared_results})")
+        # 🆕 요청/결과 큐 일괄 비우기 (꺼낸 객체는 풀에 반납)
+        requests_ = self.request_queue.drain()
+        results = self._drain_results()
+        for item in requests_ + results:
+            item.release()
+        
+        cleared_requests = len(requests_)
+        cleared_results = len(results)
+        logger.info("AI 큐 비움 (요청: %s, 결과: %s)", cleared_requests, cleared_results)
     
     # =========================================================================
     # 워커 루프 (내부)
@@ -358,110 +1326,487 @@ class AIEngine:
         
         별도 스레드에서 실행되며, request_queue에서 요청을 꺼내
         Qwen3 API를 호출하고 결과를 result_queue에 넣습니다.
+        
+        🆕 aiohttp/httpx가 있으면 이벤트 루프에서 여러 요청을 동시에 처리하고,
+        없으면 기존 방식(한 번에 하나씩)으로 처리합니다.
+        🆕 worker_count 개의 스레드에서 동시에 실행됩니다.
         """
         logger.info("AI 워커 루프 시작")
         
-        while self._running:
+        if AIOHTTP_AVAILABLE or HTTPX_AVAILABLE:
+            asyncio.run(self._async_worker_loop())
+        else:
+            self._sync_worker_loop()
+        
+        logger.info("AI 워커 루프 종료")
+    
+    def _sync_worker_loop(self):
+        """동기 워커 루프 (aiohttp/httpx 미설치 시)"""
+        while not self._stop_event.is_set():
             try:
-                # 요청 큐에서 가져오기 (1초 타임아웃)
+                # 🆕 대기 중인 요청을 batch_size 개까지 모아서 처리
+                batch = self._drain_batch(self.batch_size, AI_BATCH_WAIT)
+                if not batch:
+                    continue
+                
+                # AI 분석 실행 → 결과 큐에 넣기
                 try:
-                    request = self.request_queue.get(timeout=1)
-                except Empty:
+                    for result in self._process_batch(batch):
+                        self._put_result(result)
+                finally:
+                    self._finish_batch(batch)
+                
+            except Exception as e:
+                logger.exception("AI 워커 루프 에러: %s", e)
+                self._inc_stat('error_count')
+    
+    async def _async_worker_loop(self):
+        """
+        🆕 비동기 워커 루프
+        
+        세마포어로 동시 처리 수를 max_concurrent 로 제한합니다.
+        슬롯이 빈 뒤에만 큐에서 꺼내므로, 처리 못 한 요청은 큐에 남아
+        기존 폐기 정책(가장 오래된 요청 폐기)을 그대로 따릅니다.
+        """
+        loop = asyncio.get_running_loop()
+        sem = asyncio.Semaphore(self.max_concurrent)
+        tasks = set()
+        
+        async with self._create_async_client() as session:
+            while not self._stop_event.is_set():
+                await sem.acquire()
+                try:
+                    batch = await loop.run_in_executor(
+                        None, self._drain_batch, self.batch_size, AI_BATCH_WAIT
+                    )
+                except Exception as e:
+                    sem.release()
+                    logger.exception("AI 워커 루프 에러: %s", e)
+                    self._inc_stat('error_count')
                     continue
                 
-                # 요청이 너무 오래됐으면 스킵 (30초 이상)
-                age = time.time() - request.get('timestamp', 0)
-                if age > 30:
-                    logger.warning(f"오래된 AI 요청 스킵: {request['stock_code']} ({age:.1f}초 경과)")
+                if not batch:
+                    sem.release()
                     continue
                 
-                # AI 분석 실행
+                task = asyncio.create_task(self._process_async(batch, sem, session))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            
+            # 처리 중인 요청 완료 대기
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+    
+    def _create_async_client(self):
+        """
+        🆕 비동기 HTTP 클라이언트 생성 (async with 로 사용)
+        
+        Gemini는 httpx HTTP/2 로 여러 요청이 TLS 연결 하나를 공유하고,
+        그 외에는 aiohttp 를 사용합니다 (aiohttp 미설치 시 httpx HTTP/1.1).
+        """
+        if HTTPX_AVAILABLE and (self.provider == 'gemini' or not AIOHTTP_AVAILABLE):
+            return httpx.AsyncClient(
+                http2=self.provider == 'gemini',
+                timeout=self.timeout,
+                headers=self._headers,
+                limits=httpx.Limits(max_connections=HTTPX_MAX_CONNECTIONS),
+            )
+        
+        return aiohttp.ClientSession(
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+            headers=self._headers,
+        )
+    
+    @staticmethod
+    async def _post_async(session, url: str, body: bytes) -> tuple:
+        """🆕 비동기 POST (aiohttp/httpx 공통) → (상태 코드, 응답 바이트, 응답 헤더)"""
+        if HTTPX_AVAILABLE and isinstance(session, httpx.AsyncClient):
+            response = await session.post(url, content=body)
+            return response.status_code, response.content, response.headers
+        
+        async with session.post(url, data=body) as response:
+            return response.status, await response.read(), response.headers
+    
+    def _drain_batch(self, max_n: int, max_wait: float) -> list:
+        """
+        🆕 요청 큐에서 최대 max_n 개 꺼내기
+        
+        먼저 만료된 요청을 큐 앞에서 일괄 제거한 뒤,
+        첫 요청이 올 때까지 기다리고 (🆕 타임아웃 폴링 없음, stop() 시 즉시 깨어남),
+        이후 max_wait 초 동안 추가로 들어오는 요청을 모읍니다.
+        
+        Returns:
+            AIRequest 리스트 (종료 신호면 빈 리스트)
+        """
+        self._prune_stale_requests()
+        
+        first = self.request_queue.get()
+        if first is None:
+            return []
+        batch = [first]
+        
+        deadline = time.monotonic() + max_wait
+        while len(batch) < max_n:
+            remaining = deadline - time.monotonic()
+            try:
+                if remaining > 0:
+                    batch.append(self.request_queue.get(timeout=remaining))
+                else:
+                    batch.append(self.request_queue.get_nowait())
+            except Empty:
+                break
+        
+        self._mark_inflight(batch)
+        return batch
+    
+    def _prune_stale_requests(self):
+        """오래된 요청 일괄 폐기 (🆕 max_request_age 초과)"""
+        stale = self.request_queue.prune_older_than(self.max_request_age)
+        if not stale:
+            return
+        
+        self._inc_stat('dropped_count', len(stale))
+        self._inc_stat('stale_dropped', len(stale))
+        codes = ', '.join(request.stock_code for request in stale)
+        logger.warning("오래된 AI 요청 %s건 스킵: %s", len(stale), codes)
+        self._release_requests(stale)
+    
+    def _is_high_priority(self, request: AIRequest) -> bool:
+        """🆕 우선 큐 대상 여부 (규칙 점수 기준)"""
+        return (request.rule_score or 0) >= self.priority_threshold
+    
+    def _is_inflight(self, stock_code: str) -> bool:
+        """🆕 같은 종목 요청이 INFLIGHT_DEDUPE_WINDOW 안에 처리 중인지 확인"""
+        with self._inflight_lock:
+            started = self._inflight.get(stock_code)
+        return started is not None and time.monotonic() - started < INFLIGHT_DEDUPE_WINDOW
+    
+    def _mark_inflight(self, batch: list):
+        """🆕 워커가 꺼낸 요청을 처리 중으로 표시"""
+        with self._inflight_lock:
+            for request in batch:
+                self._inflight[request.stock_code] = request.timestamp
+    
+    def _finish_batch(self, batch: list):
+        """🆕 처리 중 표시 해제 + 요청 객체 반납"""
+        with self._inflight_lock:
+            for request in batch:
+                self._inflight.pop(request.stock_code, None)
+        self._release_requests(batch)
+    
+    @staticmethod
+    def _release_requests(batch: list):
+        """🆕 처리 끝난 요청 객체를 풀에 반납"""
+        for request in batch:
+            request.release()
+    
+    async def _process_async(self, batch: list, sem: asyncio.Semaphore, session) -> None:
+        """🆕 요청 배치 비동기 처리 (완료 시 세마포어 반환)"""
+        try:
+            for result in await self._process_batch_async(batch, session):
+                self._put_result(result)
+        except Exception as e:
+            logger.exception("AI 워커 루프 에러: %s", e)
+            self._inc_stat('error_count')
+        finally:
+            self._finish_batch(batch)
+            sem.release()
+    
+    def _process_batch(self, batch: list) -> list:
+        """
+        🆕 요청 배치 처리
+        
+        캐시 적중분을 먼저 처리하고, 남은 요청이 2개 이상이면
+        한 번의 API 호출로 판단합니다. 응답에서 빠진 종목은 개별 처리합니다.
+        
+        Returns:
+            AIResult 리스트
+        """
+        results, pending = self._split_cached(batch)
+        
+        if len(pending) == 1:
+            result = self._process_request(pending[0][0])
+            return results + [result] if result else results
+        
+        if pending:
+            start_time = time.monotonic()
+            try:
+                prompt = self._build_batch_prompt([request for request, _ in pending])
+                response_text = self._call_api_with_retry(
+                    prompt, self._batch_tokens_per_item * len(pending), OLLAMA_BATCH_FORMAT
+                )
+            except Exception as e:
+                self._on_batch_error(pending, e)
+                return results
+            
+            done, missing = self._apply_batch_response(pending, response_text, start_time)
+            results.extend(done)
+            
+            for request in missing:
                 result = self._process_request(request)
-                
-                # 결과 큐에 넣기
                 if result:
-                    self.result_queue.put(result)
-                
+                    results.append(result)
+        
+        return results
+    
+    async def _process_batch_async(self, batch: list, session) -> list:
+        """🆕 요청 배치 처리 (aiohttp 버전, 동작은 _process_batch와 동일)"""
+        results, pending = self._split_cached(batch)
+        
+        if len(pending) == 1:
+            result = await self._process_request_async(pending[0][0], session)
+            return results + [result] if result else results
+        
+        if pending:
+            start_time = time.monotonic()
+            try:
+                prompt = self._build_batch_prompt([request for request, _ in pending])
+                response_text = await self._call_api_with_retry_async(
+                    session, prompt, self._batch_tokens_per_item * len(pending), OLLAMA_BATCH_FORMAT
+                )
             except Exception as e:
-                logger.exception(f"AI 워커 루프 에러: {e}")
-                self._stats['error_count'] += 1
+                self._on_batch_error(pending, e)
+                return results
+            
+            done, missing = self._apply_batch_response(pending, response_text, start_time)
+            results.extend(done)
+            
+            for request in missing:
+                result = await self._process_request_async(request, session)
+                if result:
+                    results.append(result)
         
-        logger.info("AI 워커 루프 종료")
+        return results
+    
+    def _split_cached(self, batch: list) -> tuple:
+        """배치를 캐시 적중 결과와 API 호출 대상 [(요청, 캐시 키), ...]로 분리"""
+        results = []
+        pending = []
+        
+        for request in batch:
+            start_time = time.monotonic()
+            cache_key, parsed = self._lookup_cached_decision(request)
+            if parsed is None:
+                pending.append((request, cache_key))
+            else:
+                results.append(self._make_result(request, parsed, time.monotonic() - start_time))
+        
+        return results, pending
     
-    def _process_request(self, request: Dict) -> Optional[Dict]:
+    def _apply_batch_response(self, pending: list, response_text: str, start_time: float) -> tuple:
+        """
+        배치 응답을 요청별 결과로 변환
+        
+        Returns:
+            (결과 리스트, 응답에서 빠진 요청 리스트)
+        """
+        logger.debug("AI 배치 원본 응답 (%s종목): %s...", len(pending), response_text[:500])
+        
+        parsed_list = self._parse_batch_response(response_text, [request for request, _ in pending])
+        elapsed = time.monotonic() - start_time
+        
+        results = []
+        missing = []
+        for (request, cache_key), parsed in zip(pending, parsed_list):
+            if parsed is None:
+                missing.append(request)
+                continue
+            
+            self._record_decision(cache_key, parsed, elapsed)
+            results.append(self._make_result(request, parsed, elapsed))
+        
+        if missing:
+            logger.debug("AI 배치 응답 누락 %s종목 → 개별 처리", len(missing))
+        
+        return results, missing
+    
+    def _on_batch_error(self, pending: list, error: Exception):
+        """배치 호출 실패 처리 (통계/로그)"""
+        codes = ', '.join(request.stock_code for request, _ in pending)
+        
+        if isinstance(error, TimeoutError):
+            self._inc_stat('timeout_count')
+            logger.warning("AI 배치 분석 타임아웃: %s (%s초 초과)", codes, self.timeout)
+        else:
+            self._inc_stat('error_count')
+            logger.error("AI 배치 분석 에러: %s - %s", codes, error)
+    
+    def _process_request(self, request: AIRequest) -> Optional[AIResult]:
         """
         단일 AI 요청 처리
         
         Args:
-            request: 요청 딕셔너리
+            request: AI 분석 요청
         
         Returns:
-            결과 딕셔너리 또는 None (실패 시)
+            AIResult 또는 None (실패 시)
         """
-        stock_code = request['stock_code']
-        stock_name = request['stock_name']
-        
-        logger.debug(f"AI 분석 시작: {stock_code} {stock_name}")
+        stock_code = request.stock_code
+        logger.debug("AI 분석 시작: %s %s", stock_code, request.stock_name)
         
-        start_time = time.time()
+        start_time = time.monotonic()
         
         try:
-            # 프롬프트 생성
-            prompt = self._build_prompt(request)
+            # 🆕 동일 지표 판단 캐시 확인
+            cache_key, parsed = self._lookup_cached_decision(request)
             
-            # 🆕 API 호출 (provider에 따라 분기)
-            response_text = self._call_api_with_retry(prompt)
-            
-            # 🆕 원본 응답 로깅 (디버깅용)
-            logger.debug(f"AI 원본 응답 ({stock_code}): {response_text[:500]}...")
-            
-            # 응답 파싱
-            parsed = self._parse_response(response_text)
-            
-            # 🆕 파싱 결과 로깅
-            logger.debug(f"AI 파싱 결과 ({stock_code}): {parsed}")
+            if parsed is None:
+                # 프롬프트 생성
+                prompt = self._build_prompt(request)
+                
+                # 🆕 API 호출 (provider에 따라 분기)
+                response_text = self._call_api_with_retry(prompt)
+                
+                parsed = self._handle_response(request, cache_key, response_text, start_time)
             
-            elapsed = time.time() - start_time
+            return self._make_result(request, parsed, time.monotonic() - start_time)
             
-            # 통계 업데이트
-            self._stats['success_count'] += 1
-            self._update_avg_response_time(elapsed)
+        except TimeoutError:
+            self._inc_stat('timeout_count')
+            logger.warning("AI 분석 타임아웃: %s (%s초 초과)", stock_code, self.timeout)
+            return None
             
-            result = {
-                'stock_code': stock_code,
-                'stock_name': stock_name,
-                'decision': parsed['decision'],
-                'confidence': parsed['confidence'],
-                'reason': parsed['reason'],
-                'original_price': request['current_price'],
-                'rule_score': request.get('rule_score', 0),  # 🆕 점수 추가
-                'indicators': request.get('indicators', {}),  # 🆕 지표 추가 (CCI 포함)
-                'elapsed': elapsed,
-                'timestamp': time.time(),
-            }
+        except Exception as e:
+            self._inc_stat('error_count')
+            logger.error("AI 분석 에러: %s - %s", stock_code, e)
+            return None
+    
+    async def _process_request_async(self, request: AIRequest, session) -> Optional[AIResult]:
+        """🆕 단일 AI 요청 처리 (aiohttp 버전, 동작은 _process_request와 동일)"""
+        stock_code = request.stock_code
+        logger.debug("AI 분석 시작: %s %s", stock_code, request.stock_name)
+        
+        start_time = time.monotonic()
+        
+        try:
+            cache_key, parsed = self._lookup_cached_decision(request)
             
-            logger.info(
-                f"AI 분석 완료: {stock_code} → {parsed['decision']} "
-                f"(신뢰도: {parsed['confidence']:.2f}, {elapsed:.1f}초)"
-            )
+            if parsed is None:
+                prompt = self._build_prompt(request)
+                response_text = await self._call_api_with_retry_async(session, prompt)
+                parsed = self._handle_response(request, cache_key, response_text, start_time)
             
-            return result
+            return self._make_result(request, parsed, time.monotonic() - start_time)
             
         except TimeoutError:
-            self._stats['timeout_count'] += 1
-            logger.warning(f"AI 분석 타임아웃: {stock_code} ({self.timeout}초 초과)")
+            self._inc_stat('timeout_count')
+            logger.warning("AI 분석 타임아웃: %s (%s초 초과)", stock_code, self.timeout)
             return None
             
         except Exception as e:
-            self._stats['error_count'] += 1
-            logger.error(f"AI 분석 에러: {stock_code} - {e}")
+            self._inc_stat('error_count')
+            logger.error("AI 분석 에러: %s - %s", stock_code, e)
             return None
     
+    def _lookup_cached_decision(self, request: AIRequest) -> tuple:
+        """캐시 키 생성 + 캐시 조회 → (키, 파싱 결과 or None)"""
+        cache_key = self._decision_cache_key(request)
+        parsed = self._get_cached_decision(cache_key)
+        if parsed is not None:
+            self._inc_stat('cache_hits')
+            logger.debug("AI 판단 캐시 적중: %s", request.stock_code)
+        return cache_key, parsed
+    
+    def _handle_response(self, request: AIRequest, cache_key: tuple, response_text: str, start_time: float) -> Dict:
+        """AI 응답 파싱 + 통계/캐시 갱신"""
+        stock_code = request.stock_code
+        
+        # 🆕 원본 응답 로깅 (디버깅용)
+        logger.debug("AI 원본 응답 (%s): %s...", stock_code, response_text[:500])
+        
+        # 응답 파싱
+        parsed = self._parse_response(response_text)
+        
+        # 🆕 파싱 결과 로깅
+        logger.debug("AI 파싱 결과 (%s): %s", stock_code, parsed)
+        
+        self._record_decision(cache_key, parsed, time.monotonic() - start_time)
+        return parsed
+    
+    def _record_decision(self, cache_key: tuple, parsed: Dict, elapsed: float):
+        """통계 업데이트 + 판단 캐시 저장"""
+        self._inc_stat('success_count')
+        self._update_avg_response_time(elapsed)
+        
+        self._put_cached_decision(cache_key, parsed)
+    
+    def _make_result(self, request: AIRequest, parsed: Dict, elapsed: float) -> AIResult:
+        """결과 생성 (🆕 풀에서 재사용)"""
+        stock_code = request.stock_code
+        
+        result = AIResult.acquire(
+            stock_code=stock_code,
+            stock_name=request.stock_name,
+            decision=parsed['decision'],
+            confidence=parsed['confidence'],
+            reason=parsed['reason'],
+            original_price=request.current_price,
+            rule_score=request.rule_score,  # 🆕 점수 추가
+            indicators=request.indicators,  # 🆕 지표 추가 (CCI 포함)
+            elapsed=elapsed,
+            timestamp=time.time(),
+        )
+        
+        logger.info(
+            "AI 분석 완료: %s → %s (신뢰도: %.2f, %.1f초)",
+            stock_code, parsed['decision'], parsed['confidence'], elapsed,
+        )
+        
+        return result
+    
+    # =========================================================================
+    # 🆕 판단 캐시
+    # =========================================================================
+    
+    def _decision_cache_key(self, request: AIRequest) -> tuple:
+        """
+        판단 캐시 키 생성
+        
+        🆕 종목코드 + 시장 모드 + 주요 지표를 양자화한 튜플.
+        스캔 틱 사이 미세한 지표 변화는 같은 키로 취급합니다.
+        """
+        indicators = request.indicators or {}
+        market_state = request.market_state or {}
+        return (
+            request.stock_code,
+            market_state.get('mode', 'NORMAL'),
+            round(indicators.get('cci', 0) or 0),
+            round(indicators.get('change_pct', 0) or 0, 1),
+            round(indicators.get('volume_ratio', 1.0) or 0, 1),
+            round(request.rule_score or 0),
+        )
+    
+    def _get_cached_decision(self, key: tuple) -> Optional[Dict]:
+        """캐시된 판단 조회 (TTL 만료 시 None, 적중 시 최근 사용으로 이동)"""
+        with self._cache_lock:
+            entry = self._decision_cache.get(key)
+            if entry is None:
+                return None
+            
+            cached_at, parsed = entry
+            if time.monotonic() - cached_at > DECISION_CACHE_TTL:
+                del self._decision_cache[key]
+                return None
+            
+            self._decision_cache.move_to_end(key)
+            return dict(parsed)
+    
+    def _put_cached_decision(self, key: tuple, parsed: Dict):
+        """판단 캐시 저장 (신뢰도 낮은 결과는 저장 안 함, 가득 차면 LRU 제거)"""
+        if parsed.get('confidence', 0) < DECISION_CACHE_MIN_CONFIDENCE:
+            return
+        
+        with self._cache_lock:
+            self._decision_cache[key] = (time.monotonic(), dict(parsed))
+            self._decision_cache.move_to_end(key)
+            if len(self._decision_cache) > DECISION_CACHE_MAX_SIZE:
+                self._decision_cache.popitem(last=False)
+    
     # =========================================================================
     # 프롬프트 생성
     # =========================================================================
     
-    def _build_prompt(self, request: Dict) -> str:
+    def _build_prompt(self, request: AIRequest) -> str:
         """
         AI 프롬프트 생성
         
@@ -470,15 +1815,46 @@ class AIEngine:
         🆕 학습 데이터 패턴 통계 포함
         
         Args:
-            request: 요청 딕셔너리
+            request: AI 분석 요청
+        
+        Returns:
+            프롬프트 문자열
+        """
+        # 🆕 고정 머리말/규칙 + 가변 구간 템플릿 한 번 치환
+        return self._prompt_head + _PROMPT_SINGLE_FMT.format_map(self._prompt_fields(request))
+    
+    def _build_batch_prompt(self, requests_list: list) -> str:
+        """
+        🆕 배치 프롬프트 생성 (여러 종목 → JSON 배열 응답)
+        
+        머리말/규칙은 한 번만 보내고 종목별로 두 줄씩 나열합니다.
+        시장 상태와 전체 승률은 첫 요청 기준입니다 (같은 스캔 틱의 요청).
+        
+        Args:
+            requests_list: AIRequest 리스트
         
         Returns:
             프롬프트 문자열
         """
-        indicators = request.get('indicators', {})
-        market_state = request.get('market_state', {})
-        rule_score = request.get('rule_score', 0)
-        stock_code = request.get('stock_code', '')
+        all_fields = [self._prompt_fields(request) for request in requests_list]
+        
+        parts = [
+            self._prompt_head,
+            _PROMPT_MARKET_FMT.format_map(all_fields[0]),
+            _PROMPT_BATCH_LEARNING_FMT.format_map(all_fields[0]),
+        ]
+        for index, fields_ in enumerate(all_fields, 1):
+            parts.append(_PROMPT_BATCH_STOCK_FMT.format(index=index, **fields_))
+        parts.append(self._prompt_batch_tail)
+        
+        return ''.join(parts)
+    
+    def _prompt_fields(self, request: AIRequest) -> Dict[str, Any]:
+        """프롬프트 치환 값 계산 (지표 + 학습 데이터 통계)"""
+        indicators = request.indicators or {}
+        market_state = request.market_state or {}
+        rule_score = request.rule_score or 0
+        stock_code = request.stock_code
         
         # 시장 상태 해석
         market_mode = market_state.get('mode', 'NORMAL')
@@ -494,44 +1870,29 @@ class AIEngine:
         consec_bullish = indicators.get('consec_bullish', 0)
         candle_score = indicators.get('candle_score', 0)
         
-        # 🆕 학습 데이터에서 패턴별 통계 가져오기
+        # 🆕 학습 데이터에서 패턴별 통계 가져오기 (TTL 캐시)
         try:
-            stats = self.learning_store.get_stats()
+            stats, cci_table, score_table, stock_cache = self._learning_snapshot()
             winrate = stats.get('winrate', 50)
             total_trades = stats.get('total_trades', 0)
             
-            # 패턴별 통계
-            pattern_stats = self.learning_store.get_pattern_stats()
-            
-            # CCI 구간 판단 및 해당 구간 승률
-            if cci < -100:
-                cci_zone = 'oversold'
-            elif cci > 100:
-                cci_zone = 'overbought'
-            else:
-                cci_zone = 'neutral'
-            cci_zone_stats = pattern_stats.get('cci_stats', {}).get(cci_zone, {})
-            cci_winrate = cci_zone_stats.get('winrate', 50)
-            cci_trades = cci_zone_stats.get('total', 0)
+            # CCI 구간 판단 및 해당 구간 승률 (🆕 구간 표 인덱스 조회)
+            cci_index = _cci_zone_index(cci)
+            cci_zone = CCI_ZONES[cci_index]
+            cci_winrate, cci_trades = cci_table[cci_index]
             
             # 점수 구간 판단 및 해당 구간 승률
-            if rule_score >= 80:
-                score_zone = 'high'
-            elif rule_score >= 70:
-                score_zone = 'medium'
-            else:
-                score_zone = 'low'
-            score_zone_stats = pattern_stats.get('score_stats', {}).get(score_zone, {})
-            score_winrate = score_zone_stats.get('winrate', 50)
-            score_trades = score_zone_stats.get('total', 0)
+            score_index = _score_zone_index(rule_score)
+            score_zone = SCORE_ZONES[score_index]
+            score_winrate, score_trades = score_table[score_index]
             
             # 종목별 통계
-            stock_stats = self.learning_store.get_stock_stats(stock_code)
+            stock_stats = self._stock_learning_stats(stock_code, stock_cache)
             stock_winrate = stock_stats.get('winrate', 50)
             stock_trades = stock_stats.get('total_trades', 0)
             
         except Exception as e:
-            logger.debug(f"학습 데이터 로드 실패: {e}")
+            logger.debug("학습 데이터 로드 실패: %s", e)
             winrate = 50
             total_trades = 0
             cci_zone = 'neutral'
@@ -545,102 +1906,193 @@ class AIEngine:
         
         # 🆕 패턴 기반 경고 메시지 생성
         warnings = []
-        if cci_trades >= 5 and cci_winrate < 40:
+        if cci_trades >= PATTERN_MIN_TRADES and cci_winrate < PATTERN_WARN_WINRATE:
             warnings.append(f"⚠️ CCI {cci_zone} zone has {cci_winrate:.0f}% win rate")
-        if score_trades >= 5 and score_winrate < 40:
+        if score_trades >= PATTERN_MIN_TRADES and score_winrate < PATTERN_WARN_WINRATE:
             warnings.append(f"⚠️ Score {score_zone} zone has {score_winrate:.0f}% win rate")
-        if stock_trades >= 3 and stock_winrate < 40:
+        if stock_trades >= STOCK_MIN_TRADES and stock_winrate < PATTERN_WARN_WINRATE:
             warnings.append(f"⚠️ This stock has {stock_winrate:.0f}% win rate")
         warning_text = "\n".join(warnings) if warnings else "No pattern warnings"
         
-        # 프롬프트 구성 (영어, JSON 강제)
-        # 🆕 Gemini용으로 /no_think 제거 (Ollama 전용 지시어)
-        prompt = f"""You are a conservative Korean stock scalping AI. Analyze indicators and decide BUY or HOLD.
-
-[MARKET]
-- KOSPI: {market_change:+.2f}% | Mode: {market_mode} | Trend: {market_status}
-
-[STOCK]
-- Score: {rule_score:.1f}/100
-- CCI(14): {cci:.1f}
-- Change: {change_pct:+.2f}%
-- MA20 Distance: {distance_ma20:+.2f}%
-- Volume: {volume_ratio:.2f}x
-- Bullish Days: {consec_bullish}
-
-[LEARNING DATA - YOUR PAST PERFORMANCE]
-- Overall: {winrate:.1f}% win rate ({total_trades} trades)
-- CCI {cci_zone} zone: {cci_winrate:.1f}% win rate ({cci_trades} trades)
-- Score {score_zone} zone: {score_winrate:.1f}% win rate ({score_trades} trades)
-- This stock: {stock_winrate:.1f}% win rate ({stock_trades} trades)
-
-[PATTERN WARNINGS]
-{warning_text}
-
-[RULES - BE CONSERVATIVE]
-**MUST HOLD if ANY of these:**
-- CCI > 200 (overbought, likely to drop)
-- CCI < -100 (oversold, wait for reversal)
-- Volume < 0.7x (low interest)
-- Change > +5% (already pumped today)
-- Market mode is EMERGENCY or CONSERVATIVE
-- Pattern win rate < 40%
-
-**BUY conditions (ALL must be true):**
-- Score >= 75: confidence 0.80-0.85
-- Score 70-74: confidence 0.70-0.75
-- Score 65-69: confidence 0.60-0.65 (only if Volume > 1.0x AND CCI 0~150)
-
-**Default to HOLD when uncertain.** Missing a trade is better than losing.
-
-Output ONLY valid JSON:
-{{"decision": "BUY", "confidence": 0.75, "reason": "brief"}} or {{"decision": "HOLD", "confidence": 0.5, "reason": "brief"}}
-
-JSON:"""
-        
-        return prompt
+        return {
+            'stock_code': stock_code,
+            'market_change': market_change,
+            'market_mode': market_mode,
+            'market_status': market_status,
+            'rule_score': rule_score,
+            'cci': cci,
+            'change_pct': change_pct,
+            'distance_ma20': distance_ma20,
+            'volume_ratio': volume_ratio,
+            'consec_bullish': consec_bullish,
+            'winrate': winrate,
+            'total_trades': total_trades,
+            'cci_zone': cci_zone,
+            'cci_winrate': cci_winrate,
+            'cci_trades': cci_trades,
+            'score_zone': score_zone,
+            'score_winrate': score_winrate,
+            'score_trades': score_trades,
+            'stock_winrate': stock_winrate,
+            'stock_trades': stock_trades,
+            'warning_text': warning_text,
+            'batch_warning_text': "; ".join(warnings) if warnings else "none",
+        }
     
     # =========================================================================
     # API 호출 (Provider별 분기)
     # =========================================================================
     
-    def _call_api_with_retry(self, prompt: str) -> str:
+    def _call_api_with_retry(self, prompt: str, max_tokens: int = None, fmt: Any = OLLAMA_FORMAT_JSON) -> str:
         """
         AI API 호출 (재시도 포함)
         
         Args:
             prompt: 프롬프트 문자열
+            max_tokens: 🆕 출력 토큰 상한 (None이면 provider 기본값)
+            fmt: 🆕 Ollama 출력 형식 ("json" 또는 JSON 스키마, 배치 형식은 Gemini responseSchema 로 변환)
         
         Returns:
             응답 텍스트
         
         Raises:
             TimeoutError: 타임아웃 발생
+            AIAPIError: 🆕 에러 응답 (400/401/403 은 재시도 없이 즉시)
             Exception: API 호출 실패
         """
         last_error = None
         provider_name = "Gemini" if self.provider == 'gemini' else "Ollama"
+        backoff = RETRY_BACKOFF_BASE
         
         for attempt in range(self.retry_count + 1):
             try:
                 if self.provider == 'gemini':
-                    return self._call_gemini(prompt)
+                    return self._call_gemini(prompt, max_tokens, self._gemini_schema(fmt))
                 else:
-                    return self._call_ollama(prompt)
+                    return self._call_ollama(prompt, max_tokens, fmt)
             except requests.Timeout:
                 last_error = TimeoutError(f"API 타임아웃 ({self.timeout}초)")
-                logger.warning(f"{provider_name} 타임아웃 (시도 {attempt + 1}/{self.retry_count + 1})")
+                logger.warning("%s 타임아웃 (시도 %s/%s)", provider_name, attempt + 1, self.retry_count + 1)
+            except AIAPIError as e:
+                if not e.retriable:
+                    raise
+                last_error = e
+                logger.warning("%s API 에러 (시도 %s): %s", provider_name, attempt + 1, e)
+            except Exception as e:
+                last_error = e
+                logger.warning("%s API 에러 (시도 %s): %s", provider_name, attempt + 1, e)
+            
+            # 🆕 재시도 전 대기 (Retry-After 우선, 없으면 지수 백오프 + 지터)
+            if attempt < self.retry_count:
+                delay = self._retry_delay(last_error, backoff)
+                if delay is None:
+                    logger.warning("%s Retry-After 가 요청 유효 시간 초과 → 재시도 중단", provider_name)
+                    break
+                time.sleep(delay)
+                backoff *= 2
+        
+        raise last_error
+    
+    async def _call_api_with_retry_async(
+        self, session, prompt: str, max_tokens: int = None, fmt: Any = OLLAMA_FORMAT_JSON
+    ) -> str:
+        """
+        🆕 AI API 호출 (비동기 버전, 재시도 정책은 _call_api_with_retry와 동일)
+        
+        Raises:
+            TimeoutError: 타임아웃 발생
+            AIAPIError: 🆕 에러 응답 (400/401/403 은 재시도 없이 즉시)
+            Exception: API 호출 실패
+        """
+        last_error = None
+        provider_name = "Gemini" if self.provider == 'gemini' else "Ollama"
+        backoff = RETRY_BACKOFF_BASE
+        
+        for attempt in range(self.retry_count + 1):
+            try:
+                if self.provider == 'gemini':
+                    return await self._call_gemini_async(session, prompt, max_tokens, self._gemini_schema(fmt))
+                else:
+                    return await self._call_ollama_async(session, prompt, max_tokens, fmt)
+            except _ASYNC_TIMEOUT_ERRORS:
+                last_error = TimeoutError(f"API 타임아웃 ({self.timeout}초)")
+                logger.warning("%s 타임아웃 (시도 %s/%s)", provider_name, attempt + 1, self.retry_count + 1)
+            except AIAPIError as e:
+                if not e.retriable:
+                    raise
+                last_error = e
+                logger.warning("%s API 에러 (시도 %s): %s", provider_name, attempt + 1, e)
             except Exception as e:
                 last_error = e
-                logger.warning(f"{provider_name} API 에러 (시도 {attempt + 1}): {e}")
+                logger.warning("%s API 에러 (시도 %s): %s", provider_name, attempt + 1, e)
             
-            # 재시도 전 잠시 대기
+            # 🆕 재시도 전 대기 (Retry-After 우선, 없으면 지수 백오프 + 지터)
             if attempt < self.retry_count:
-                time.sleep(0.5)
+                delay = self._retry_delay(last_error, backoff)
+                if delay is None:
+                    logger.warning("%s Retry-After 가 요청 유효 시간 초과 → 재시도 중단", provider_name)
+                    break
+                await asyncio.sleep(delay)
+                backoff *= 2
         
         raise last_error
     
-    def _call_gemini(self, prompt: str) -> str:
+    def _retry_delay(self, error: Exception, backoff: float) -> Optional[float]:
+        """
+        🆕 재시도 대기 시간 (None = 재시도하지 않음)
+        
+        429/503 응답에 Retry-After 가 있으면 그 값을 따르되 timeout 으로 제한하고,
+        max_request_age 를 넘기면 기다려도 결과가 쓸모없으므로 None 을 반환합니다.
+        그 외에는 [0, min(backoff, timeout)] 구간에서 무작위로 골라
+        여러 워커가 같은 시점에 재시도하지 않도록 합니다.
+        """
+        if isinstance(error, RateLimitedError) and error.retry_after is not None:
+            if error.retry_after > self.max_request_age:
+                return None
+            return min(max(error.retry_after, 0.0), self.timeout)
+        return random.uniform(0, min(backoff, self.timeout))
+    
+    @staticmethod
+    def _gemini_schema(fmt: Any) -> Optional[Dict]:
+        """🆕 Ollama 출력 형식 → Gemini responseSchema (배치 형식만, 단건은 JSON 모드로 충분)"""
+        return GEMINI_BATCH_SCHEMA if fmt is OLLAMA_BATCH_FORMAT else None
+    
+    def _gemini_payload(self, prompt: str, max_tokens: int = None, schema: Dict = None) -> Dict:
+        """
+        Gemini 요청 바디
+        
+        Args:
+            max_tokens: 🆕 출력 토큰 상한 (배치 호출 시 확대)
+            schema: 🆕 응답 스키마 (responseSchema, 배치 호출 시 JSON 배열 강제)
+        """
+        config = self._gemini_config
+        if max_tokens or schema:
+            config = dict(config)
+            if max_tokens:
+                config["maxOutputTokens"] = max_tokens
+            if schema:
+                config["responseSchema"] = schema
+        
+        return {
+            "contents": [{
+                "parts": [{"text": prompt}]
+            }],
+            "generationConfig": config,
+            "safetySettings": GEMINI_SAFETY_SETTINGS,
+        }
+    
+    def _gemini_text(self, data: Dict) -> str:
+        """Gemini 응답에서 텍스트 추출"""
+        # Gemini 응답 구조: candidates[0].content.parts[0].text
+        try:
+            raw_response = data['candidates'][0]['content']['parts'][0]['text']
+            logger.debug("AI 원본 응답: %s...", raw_response[:200])
+            return raw_response
+        except (KeyError, IndexError) as e:
+            logger.error("Gemini 응답 파싱 에러: %s", data)
+            raise Exception(f"Gemini 응답 파싱 실패: {e}")
+    
+    def _call_gemini(self, prompt: str, max_tokens: int = None, schema: Dict = None) -> str:
         """
         Gemini API 호출
         
@@ -652,80 +2104,179 @@ JSON:"""
         """
         url = f"{self.api_url}?key={self.api_key}"
         
-        payload = {
-            "contents": [{
-                "parts": [{"text": prompt}]
-            }],
-            "generationConfig": {
-                "temperature": 0.1,
-                "maxOutputTokens": 200,
-                "topP": 0.9,
-            },
-            # 🆕 안전 설정 (BLOCK_NONE으로 설정하여 금융 관련 내용 허용)
-            "safetySettings": [
-                {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-                {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-                {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-                {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-            ]
-        }
-        
-        response = requests.post(
+        response = self._get_session().post(
             url,
-            json=payload,
+            data=_json_dumps(self._gemini_payload(prompt, max_tokens, schema)),
             timeout=self.timeout,
-            headers={"Content-Type": "application/json"}
         )
         
         if response.status_code == 200:
-            data = response.json()
-            # Gemini 응답 구조: candidates[0].content.parts[0].text
-            try:
-                raw_response = data['candidates'][0]['content']['parts'][0]['text']
-                logger.info(f"AI 원본 응답: {raw_response[:200]}...")
-                return raw_response
-            except (KeyError, IndexError) as e:
-                logger.error(f"Gemini 응답 파싱 에러: {data}")
-                raise Exception(f"Gemini 응답 파싱 실패: {e}")
+            return self._gemini_text(_json_loads(response.content))
         else:
             error_msg = response.text[:200] if response.text else str(response.status_code)
-            raise Exception(f"Gemini API 에러: {response.status_code} - {error_msg}")
+            raise _status_error(
+                f"Gemini API 에러: {response.status_code} - {error_msg}",
+                response.status_code, response.headers,
+            )
+    
+    async def _call_gemini_async(self, session, prompt: str, max_tokens: int = None, schema: Dict = None) -> str:
+        """🆕 Gemini API 호출 (비동기, httpx HTTP/2 또는 aiohttp)"""
+        url = f"{self.api_url}?key={self.api_key}"
+        
+        status, body, headers = await self._post_async(
+            session, url, _json_dumps(self._gemini_payload(prompt, max_tokens, schema))
+        )
+        
+        if status == 200:
+            return self._gemini_text(_json_loads(body))
+        else:
+            error_msg = body[:200].decode('utf-8', 'replace') if body else str(status)
+            raise _status_error(f"Gemini API 에러: {status} - {error_msg}", status, headers)
     
-    def _call_ollama(self, prompt: str) -> str:
+    def _ollama_payload(
+        self, prompt: str, max_tokens: int = None, fmt: Any = OLLAMA_FORMAT_JSON, stream: bool = False
+    ) -> Dict:
         """
-        Ollama API 호출 (Qwen3 등 로컬 모델)
+        Ollama 요청 바디
         
         Args:
-            prompt: 프롬프트 문자열
-        
-        Returns:
-            응답 텍스트
+            max_tokens: 🆕 출력 토큰 상한 (배치 호출 시 확대)
+            fmt: 🆕 출력 형식 ("json", JSON 스키마, None이면 자유 텍스트)
+            stream: 🆕 토큰 단위 스트리밍 응답 여부
         """
+        options = self._ollama_options
+        if max_tokens:
+            options = {**options, "num_predict": max_tokens}
+        
         payload = {
             "model": self.model,
             "prompt": prompt,
-            "stream": False,
-            "options": {
-                "temperature": 0.1,     # 낮은 temperature로 일관된 응답
-                "num_predict": 150,     # 최대 토큰 수 제한
-                "top_p": 0.9,
-            },
+            "stream": stream,
+            "options": options,
             "think": False,  # Qwen3 thinking 비활성화
+            "keep_alive": self.keep_alive,  # 🆕 모델 언로드 방지 (콜드스타트 제거)
         }
+        if fmt is not None:
+            payload["format"] = fmt
+        return payload
+    
+    def _call_ollama(self, prompt: str, max_tokens: int = None, fmt: Any = OLLAMA_FORMAT_JSON) -> str:
+        """
+        Ollama API 호출 (Qwen3 등 로컬 모델)
+        
+        Args:
+            prompt: 프롬프트 문자열
+        
+        Returns:
+            응답 텍스트
         
-        response = requests.post(
+        🆕 JSON 형식 응답은 스트리밍으로 받아 JSON이 완성되는 즉시 연결을 끊습니다.
+        (연결이 끊기면 Ollama도 남은 토큰 생성을 멈춤)
+        """
+        stream = self.stream and fmt is not None
+        response = self._get_session().post(
             self.api_url,
-            json=payload,
-            timeout=self.timeout
+            data=_json_dumps(self._ollama_payload(prompt, max_tokens, fmt, stream)),
+            timeout=self.timeout,
+            stream=stream,
         )
         
+        if stream:
+            with response:
+                if response.status_code != 200:
+                    raise _status_error(
+                        f"Ollama API 응답 에러: {response.status_code}",
+                        response.status_code, response.headers,
+                    )
+                
+                parts = []
+                for line in response.iter_lines():
+                    text = self._feed_stream_line(parts, line)
+                    if text is not None:
+                        return text
+                return self._finish_stream(parts)
+        
         if response.status_code == 200:
-            data = response.json()
+            data = _json_loads(response.content)
+            raw_response = data.get('response', '')
+            logger.debug("AI 원본 응답: %s...", raw_response[:200])
+            return raw_response
+        else:
+            raise _status_error(
+                f"Ollama API 응답 에러: {response.status_code}",
+                response.status_code, response.headers,
+            )
+    
+    async def _call_ollama_async(
+        self, session, prompt: str, max_tokens: int = None, fmt: Any = OLLAMA_FORMAT_JSON
+    ) -> str:
+        """🆕 Ollama API 호출 (비동기, 세션 커넥션 재사용 / JSON 응답은 스트리밍)"""
+        if self.stream and fmt is not None:
+            body = _json_dumps(self._ollama_payload(prompt, max_tokens, fmt, stream=True))
+            if HTTPX_AVAILABLE and isinstance(session, httpx.AsyncClient):
+                async with session.stream('POST', self.api_url, content=body) as response:
+                    return await self._collect_stream_async(
+                        response.status_code, response.headers, response.aiter_lines()
+                    )
+            async with session.post(self.api_url, data=body) as response:
+                return await self._collect_stream_async(response.status, response.headers, response.content)
+        
+        status, body, headers = await self._post_async(
+            session, self.api_url, _json_dumps(self._ollama_payload(prompt, max_tokens, fmt))
+        )
+        
+        if status == 200:
+            data = _json_loads(body)
             raw_response = data.get('response', '')
-            logger.info(f"AI 원본 응답: {raw_response[:200]}...")
+            logger.debug("AI 원본 응답: %s...", raw_response[:200])
             return raw_response
         else:
-            raise Exception(f"Ollama API 응답 에러: {response.status_code}")
+            raise _status_error(f"Ollama API 응답 에러: {status}", status, headers)
+    
+    async def _collect_stream_async(self, status: int, headers, lines) -> str:
+        """🆕 비동기 스트리밍 응답 수집 (JSON 완성 시 중단, 호출자의 async with 가 연결 정리)"""
+        if status != 200:
+            raise _status_error(f"Ollama API 응답 에러: {status}", status, headers)
+        
+        parts = []
+        async for line in lines:
+            text = self._feed_stream_line(parts, line)
+            if text is not None:
+                return text
+        return self._finish_stream(parts)
+    
+    def _feed_stream_line(self, parts: list, line) -> Optional[str]:
+        """
+        🆕 Ollama 스트리밍 한 줄 처리
+        
+        Returns:
+            응답이 끝났거나 JSON이 완성되면 응답 텍스트, 아니면 None
+        """
+        line = line.strip()
+        if not line:
+            return None
+        
+        chunk = _json_loads(line)
+        piece = chunk.get('response', '')
+        parts.append(piece)
+        
+        if chunk.get('done'):
+            return self._finish_stream(parts)
+        
+        if '}' in piece or ']' in piece:
+            text = _completed_json(''.join(parts))
+            if text is not None:
+                self._inc_stat('early_stops')
+                logger.debug("AI 원본 응답: %s...", text[:200])
+                return text
+        return None
+    
+    @staticmethod
+    def _finish_stream(parts: list) -> str:
+        """스트리밍 조각 합치기 (정상 종료)"""
+        raw_response = ''.join(parts)
+        logger.debug("AI 원본 응답: %s...", raw_response[:200])
+        return raw_response
     
     # 🆕 기존 함수 호환성 유지
     def _call_qwen3_with_retry(self, prompt: str) -> str:
@@ -742,13 +2293,11 @@ JSON:"""
     
     def _parse_response(self, text: str) -> Dict:
         """
-        AI 응답 파싱 (강화된 버전)
+        AI 응답 파싱
         
-        Qwen3 모델의 다양한 응답 형식을 처리합니다:
-        1. <think>...</think> 태그 제거
-        2. 다양한 JSON 패턴 매칭
-        3. 키 대소문자 정규화
-        4. Fallback: 텍스트에서 직접 추출
+        🆕 Ollama format / Gemini responseMimeType 으로 출력이 JSON으로
+        강제되므로 한 번의 JSON 파싱으로 처리합니다. 앞뒤에 설명이 붙은
+        응답은 '{' 위치부터 raw_decode 로 스캔합니다. 실패 시 기본 응답(HOLD).
         
         Args:
             text: AI 응답 텍스트
@@ -764,135 +2313,103 @@ JSON:"""
         if not text:
             return self._default_response("빈 응답")
         
-        original_text = text  # 디버깅용
-        
-        # Step 1: <think>...</think> 태그 제거 (Qwen3 특성)
-        text = re.sub(r'<think>.*?</think>', '', text, flags=re.DOTALL | re.IGNORECASE)
-        
-        # Step 1.5: "Thinking..." ~ "...done thinking." 텍스트 제거 (Qwen3 CLI 출력)
-        text = re.sub(r'Thinking\.\.\..*?\.\.\.done thinking\.', '', text, flags=re.DOTALL | re.IGNORECASE)
-        text = re.sub(r'Thinking\.\.\..*$', '', text, flags=re.DOTALL)  # done thinking 없는 경우
-        
-        # Step 2: 줄바꿈/탭/공백 정리
-        text = re.sub(r'[\n\r\t]+', ' ', text)
-        text = re.sub(r'\s+', ' ', text)
-        text = text.strip()
-        
-        # Step 3: JSON 추출 시도 (여러 패턴)
-        json_patterns = [
-            # 완전한 형식
-            r'\{[^{}]*"decision"\s*:\s*"[^"]+"\s*,\s*"confidence"\s*:\s*[\d.]+\s*,\s*"reason"\s*:\s*"[^"]*"\s*\}',
-            # decision과 confidence만 있는 경우
-            r'\{[^{}]*"decision"\s*:\s*"[^"]+"\s*,\s*"confidence"\s*:\s*[\d.]+[^{}]*\}',
-            # 순서가 다른 경우
-            r'\{[^{}]*"confidence"[^{}]*"decision"[^{}]*\}',
-            # 최소한의 JSON
-            r'\{[^{}]+\}',
-        ]
+        try:
+            result = self._normalize_decision(_json_loads(text))
+        except ValueError:
+            result = None
         
-        for pattern in json_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                result = self._try_parse_json(match.group())
+        if result is None:
+            for value in _iter_json_values(text):
+                result = self._normalize_decision(value)
                 if result:
                     return result
+            
+            logger.warning("AI JSON 파싱 실패: %s", text[:200])
+            return self._default_response("JSON 파싱 실패")
         
-        # Step 4: Fallback - 텍스트에서 직접 추출
-        return self._extract_from_text(text, original_text)
+        return result
     
-    def _try_parse_json(self, json_str: str) -> Optional[Dict]:
+    def _parse_batch_response(self, text: str, requests_list: list) -> list:
         """
-        JSON 문자열 파싱 시도
+        🆕 배치 응답(JSON 배열) 파싱
+        
+        배열 안의 각 객체를 "code" 값으로 요청과 매칭합니다.
+        code가 하나도 없으면 순서대로 매칭합니다.
         
         Args:
-            json_str: JSON 문자열
+            text: AI 응답 텍스트
+            requests_list: AIRequest 리스트 (프롬프트 나열 순서)
         
         Returns:
-            파싱 성공 시 딕셔너리, 실패 시 None
+            요청 순서와 같은 파싱 결과 리스트 (응답에 없는 종목은 None)
         """
+        text = text or '[]'
         try:
-            # 키 대소문자 정규화
-            normalized = json_str
-            normalized = re.sub(r'"(Decision|DECISION)"', '"decision"', normalized)
-            normalized = re.sub(r'"(Confidence|CONFIDENCE)"', '"confidence"', normalized)
-            normalized = re.sub(r'"(Reason|REASON)"', '"reason"', normalized)
-            
-            # JSON 파싱
-            parsed = json.loads(normalized)
-            
-            # 값 검증 및 정규화
-            decision = str(parsed.get('decision', 'HOLD')).upper().strip()
-            if decision not in ['BUY', 'HOLD', 'SELL']:
-                decision = 'HOLD'
-            
-            confidence = float(parsed.get('confidence', 0.5))
-            confidence = max(0.0, min(1.0, confidence))  # 0~1 범위 제한
-            
-            reason = str(parsed.get('reason', ''))[:100]  # 100자 제한
+            items = _json_loads(text)
+        except ValueError:
+            # 🆕 설명이 섞인 응답: 첫 배열, 없으면 흩어진 객체들을 모음
+            items = next(_iter_json_values(text, '['), None)
+            if items is None:
+                items = list(_iter_json_values(text))
+            if not items:
+                logger.warning("AI 배치 JSON 파싱 실패: %s", text[:200])
+        
+        if isinstance(items, dict):
+            items = [items]
+        elif not isinstance(items, list):
+            items = []
+        
+        by_code = {}
+        in_order = []
+        for item in items:
+            parsed = self._normalize_decision(item)
+            if not parsed:
+                continue
             
-            return {
-                'decision': decision,
-                'confidence': confidence,
-                'reason': reason,
-            }
-            
-        except (json.JSONDecodeError, ValueError, TypeError) as e:
-            logger.debug(f"JSON 파싱 실패: {e}, 원본: {json_str[:100]}")
-            return None
+            in_order.append(parsed)
+            code = item.get('code')
+            if code is not None:
+                by_code.setdefault(str(code), parsed)
+        
+        if not by_code:
+            return [
+                in_order[i] if i < len(in_order) else None
+                for i in range(len(requests_list))
+            ]
+        
+        return [by_code.get(request.stock_code) for request in requests_list]
     
-    def _extract_from_text(self, text: str, original: str = "") -> Dict:
+    @staticmethod
+    def _normalize_decision(parsed: Any) -> Optional[Dict]:
         """
-        텍스트에서 직접 결정/신뢰도 추출 (Fallback)
-        
-        JSON 파싱이 실패했을 때 텍스트에서 BUY/HOLD/SELL과
-        신뢰도를 직접 추출합니다.
-        
-        Args:
-            text: 정리된 텍스트
-            original: 원본 텍스트 (로깅용)
+        파싱된 JSON 값 검증 및 정규화
         
-        Returns:
-            추출된 결과 딕셔너리
+        decision 키가 있는 딕셔너리만 받아들이고, 나머지는 None을 반환합니다.
+        🆕 키 대소문자가 다르면 ("Decision" 등) 소문자 키로 한 번만 변환합니다.
         """
-        # 🆕 Fallback 진입 시 경고 로그
-        logger.warning(f"AI JSON 파싱 실패, Fallback 사용. 원본: {original[:200]}...")
-        
-        text_upper = text.upper()
+        if not isinstance(parsed, dict):
+            return None
         
-        # 결정 추출
-        decision = 'HOLD'
-        if 'BUY' in text_upper:
-            decision = 'BUY'
-        elif 'SELL' in text_upper:
-            decision = 'SELL'
+        if 'decision' not in parsed:
+            parsed = {str(k).lower(): v for k, v in parsed.items()}
         
-        # 신뢰도 추출
-        confidence = 0.5
-        conf_patterns = [
-            r'confidence["\s:]+([0-9.]+)',
-            r'([0-9]\.[0-9]+)',  # 소수점 숫자
-        ]
+        decision = parsed.get('decision')
+        if decision is None:
+            return None
         
-        for pattern in conf_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
-            if match:
-                try:
-                    conf_value = float(match.group(1))
-                    if 0 <= conf_value <= 1:
-                        confidence = conf_value
-                        break
-                except ValueError:
-                    continue
+        decision = str(decision).upper().strip()
+        if decision not in ('BUY', 'HOLD', 'SELL'):
+            decision = 'HOLD'
         
-        # 로깅
-        logger.debug(f"Fallback 파싱: {decision}, {confidence:.2f}")
-        if original:
-            logger.debug(f"원본 응답 (처음 200자): {original[:200]}")
+        try:
+            confidence = float(parsed.get('confidence', 0.5))
+        except (TypeError, ValueError):
+            return None
         
         return {
             'decision': decision,
-            'confidence': confidence,
-            'reason': 'fallback parsing',
+            'confidence': max(0.0, min(1.0, confidence)),  # 0~1 범위 제한
+            'reason': str(parsed.get('reason', ''))[:100],  # 100자 제한
         }
     
     def _default_response(self, reason: str = "") -> Dict:
@@ -933,24 +2450,37 @@ JSON:"""
                 profit=actual_profit,
                 win=actual_profit > 0,
             )
-            logger.debug(f"매매 결과 기록: {stock_code}, 수익률: {actual_profit:+.2f}%")
+            self._learning_cache = None  # 🆕 다음 프롬프트에서 통계 갱신
+            logger.debug("매매 결과 기록: %s, 수익률: %+.2f%%", stock_code, actual_profit)
         except Exception as e:
-            logger.error(f"매매 결과 기록 실패: {e}")
+            logger.error("매매 결과 기록 실패: %s", e)
     
     # =========================================================================
     # 통계 및 유틸리티
     # =========================================================================
     
+    def _inc_stat(self, key: str, n: int = 1):
+        """🆕 통계 카운터 증가 (여러 워커 스레드에서 호출)"""
+        with self._counters_lock:
+            self._counters[key] += n
+    
+    def _stat(self, key: str) -> int:
+        """🆕 카운터 현재 값 (정수 읽기는 원자적이라 락 불필요)"""
+        return self._counters[key]
+    
     def _update_avg_response_time(self, elapsed: float):
-        """평균 응답 시간 업데이트"""
-        total = self._stats['success_count']
-        current_avg = self._stats['avg_response_time']
+        """
+        평균 응답 시간 업데이트
         
-        # 이동 평균 계산
-        if total == 1:
-            self._stats['avg_response_time'] = elapsed
-        else:
-            self._stats['avg_response_time'] = (current_avg * (total - 1) + elapsed) / total
+        🆕 지수 이동 평균(EWMA): avg += α (x - avg), 첫 값은 그대로 사용.
+        누적 평균과 달리 최근 API 지연 변화가 바로 드러납니다.
+        워커 스레드/비동기 태스크가 동시에 갱신하므로 카운터 락으로 보호합니다 (샘플 누락 없음).
+        """
+        with self._counters_lock:
+            prev = self._avg_response_time
+            self._avg_response_time = (
+                elapsed if prev == 0.0 else prev + RESPONSE_TIME_EWMA_ALPHA * (elapsed - prev)
+            )
     
     def generate(self, prompt: str, max_tokens: int = 1000, json_mode: bool = False) -> str:
         """
@@ -961,7 +2491,7 @@ JSON:"""
         Args:
             prompt: 프롬프트 문자열
             max_tokens: 최대 토큰 수
-            json_mode: True면 JSON 형식으로만 응답 (Gemini만 지원)
+            json_mode: True면 JSON 형식으로만 응답
         
         Returns:
             AI 응답 텍스트
@@ -969,68 +2499,70 @@ JSON:"""
         try:
             if self.provider == 'gemini':
                 # Gemini 직접 호출 (max_tokens 적용)
-                url = f"{self.api_url}?key={self.api_key}"
-                
-                generation_config = {
-                    "temperature": 0.3,
-                    "maxOutputTokens": max_tokens,
-                    "topP": 0.9,
-                }
-                
-                # JSON 모드 활성화 시 응답 형식 강제
-                if json_mode:
-                    generation_config["responseMimeType"] = "application/json"
-                
-                payload = {
-                    "contents": [{"parts": [{"text": prompt}]}],
-                    "generationConfig": generation_config,
-                    "safetySettings": [
-                        {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
-                        {"category": "HARM_CATEGORY_HATE_SPEECH", "threshold": "BLOCK_NONE"},
-                        {"category": "HARM_CATEGORY_SEXUALLY_EXPLICIT", "threshold": "BLOCK_NONE"},
-                        {"category": "HARM_CATEGORY_DANGEROUS_CONTENT", "threshold": "BLOCK_NONE"},
-                    ]
-                }
-                
-                response = requests.post(
-                    url,
-                    json=payload,
+                response = self._get_session().post(
+                    f"{self.api_url}?key={self.api_key}",
+                    data=_json_dumps(self._generate_payload(prompt, max_tokens, json_mode)),
                     timeout=self.timeout,
-                    headers={"Content-Type": "application/json"}
                 )
                 
                 if response.status_code == 200:
-                    data = response.json()
-                    
-                    # 응답 완료 이유 확인
-                    candidate = data['candidates'][0]
-                    finish_reason = candidate.get('finishReason', 'UNKNOWN')
-                    
-                    if finish_reason == 'MAX_TOKENS':
-                        logger.warning(f"⚠️ Gemini 응답이 max_tokens({max_tokens})에서 잘림!")
-                    elif finish_reason == 'SAFETY':
-                        logger.warning("⚠️ Gemini 응답이 안전 필터에 의해 차단됨")
-                    elif finish_reason not in ('STOP', 'END_TURN'):
-                        logger.warning(f"⚠️ Gemini 응답 종료 이유: {finish_reason}")
-                    
-                    text = candidate['content']['parts'][0]['text']
-                    logger.debug(f"Gemini 응답 (finishReason={finish_reason}): {text[:200]}...")
-                    return text
+                    return self._generate_text(_json_loads(response.content), max_tokens)
                 else:
                     error_detail = response.text[:500] if response.text else "No detail"
                     raise Exception(f"Gemini API 에러: {response.status_code} - {error_detail}")
             else:
-                # Ollama 호출
-                return self._call_ollama(prompt)
+                # Ollama 호출 (🆕 max_tokens 적용, JSON 모드일 때만 형식 강제)
+                return self._call_ollama(prompt, max_tokens, OLLAMA_FORMAT_JSON if json_mode else None)
                 
         except Exception as e:
-            logger.error(f"generate() 실패: {e}")
+            logger.error("generate() 실패: %s", e)
             raise
     
+    @staticmethod
+    def _generate_payload(prompt: str, max_tokens: int, json_mode: bool) -> Dict:
+        """🆕 generate() 용 Gemini 요청 바디 (동기/비동기 공통)"""
+        generation_config = {
+            "temperature": 0.3,
+            "maxOutputTokens": max_tokens,
+            "topP": 0.9,
+        }
+        
+        # JSON 모드 활성화 시 응답 형식 강제
+        if json_mode:
+            generation_config["responseMimeType"] = "application/json"
+        
+        return {
+            "contents": [{"parts": [{"text": prompt}]}],
+            "generationConfig": generation_config,
+            "safetySettings": GEMINI_SAFETY_SETTINGS,
+        }
+    
+    @staticmethod
+    def _generate_text(data: Dict, max_tokens: int) -> str:
+        """🆕 generate() 용 Gemini 응답 텍스트 추출 (완료 이유 경고 포함)"""
+        # 응답 완료 이유 확인
+        candidate = data['candidates'][0]
+        finish_reason = candidate.get('finishReason', 'UNKNOWN')
+        
+        if finish_reason == 'MAX_TOKENS':
+            logger.warning("⚠️ Gemini 응답이 max_tokens(%s)에서 잘림!", max_tokens)
+        elif finish_reason == 'SAFETY':
+            logger.warning("⚠️ Gemini 응답이 안전 필터에 의해 차단됨")
+        elif finish_reason not in ('STOP', 'END_TURN'):
+            logger.warning("⚠️ Gemini 응답 종료 이유: %s", finish_reason)
+        
+        text = candidate['content']['parts'][0]['text']
+        logger.debug("Gemini 응답 (finishReason=%s): %s...", finish_reason, text[:200])
+        return text
+    
     async def generate_async(self, prompt: str, max_tokens: int = 1000, json_mode: bool = False) -> str:
         """
         비동기 버전의 generate (async/await 지원)
         
+        🆕 aiohttp/httpx가 있으면 스레드를 거치지 않고 이벤트 루프에서 직접 호출합니다.
+        클라이언트는 이벤트 루프마다 하나를 만들어 재사용합니다 (연결 재사용, stop() 시 닫음).
+        aiohttp/httpx 가 모두 없을 때만 폴백 executor 에서 generate 를 실행합니다.
+        
         Args:
             prompt: 프롬프트 문자열
             max_tokens: 최대 토큰 수
@@ -1039,17 +2571,53 @@ JSON:"""
         Returns:
             AI 응답 텍스트
         """
-        import asyncio
-        loop = asyncio.get_event_loop()
-        return await loop.run_in_executor(None, self.generate, prompt, max_tokens, json_mode)
+        if not (AIOHTTP_AVAILABLE or HTTPX_AVAILABLE):
+            # 폴백: 전용 executor 사용 (기본 executor를 쓰는 다른 to_thread 호출과 경합하지 않음)
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(
+                self._get_executor(), self.generate, prompt, max_tokens, json_mode
+            )
+        
+        try:
+            session = self._get_async_client()
+            if self.provider == 'gemini':
+                status, body, _ = await self._post_async(
+                    session,
+                    f"{self.api_url}?key={self.api_key}",
+                    _json_dumps(self._generate_payload(prompt, max_tokens, json_mode)),
+                )
+                
+                if status == 200:
+                    return self._generate_text(_json_loads(body), max_tokens)
+                else:
+                    error_detail = body[:500].decode('utf-8', 'replace') if body else "No detail"
+                    raise Exception(f"Gemini API 에러: {status} - {error_detail}")
+            
+            # Ollama 호출 (JSON 모드일 때만 형식 강제)
+            return await self._call_ollama_async(
+                session, prompt, max_tokens, OLLAMA_FORMAT_JSON if json_mode else None
+            )
+        
+        except Exception as e:
+            logger.error("generate_async() 실패: %s", e)
+            raise
     
     def get_stats(self) -> Dict:
         """AI 엔진 통계 조회"""
+        executor = self._ai_executor
         return {
-            **self._stats,
+            **{name: self._stat(name) for name in STAT_COUNTERS},
+            'avg_response_time': self._avg_response_time,
             'queue_size': self.request_queue.qsize(),
+            'hi_queue_depth': self.request_queue.hi_qsize(),  # 🆕
+            'lo_queue_depth': self.request_queue.lo_qsize(),  # 🆕
             'result_queue_size': self.result_queue.qsize(),
-            'is_running': self._running,
+            # 🆕 병목 위치 확인용 (워커/처리 중 요청/generate_async executor 포화도)
+            'workers_alive': sum(1 for worker in self._workers if worker.is_alive()),
+            'inflight': len(self._inflight),
+            'ai_executor_threads': len(executor._threads) if executor else 0,
+            'ai_executor_queue': executor._work_queue.qsize() if executor else 0,
+            'is_running': self.is_running(),
         }
     
     def get_queue_size(self) -> int:
@@ -1061,19 +2629,34 @@ JSON:"""
         AI 엔진 상태 확인
         
         Ollama API가 정상적으로 응답하는지 확인합니다.
+        🆕 결과는 HEALTH_CHECK_TTL 초 동안 재사용하고, 확인 중에 들어온 호출은
+        새로 요청하지 않고 그 결과를 기다립니다 (장애 시 5초 타임아웃이 겹치지 않음).
         
         Returns:
             True: 정상
             False: 비정상
         """
-        try:
-            response = requests.get(
-                self.api_url.replace('/api/generate', '/api/tags'),
-                timeout=5
-            )
-            return response.status_code == 200
-        except Exception:
-            return False
+        checked_at, ok = self._health_cache
+        if time.monotonic() - checked_at < HEALTH_CHECK_TTL:
+            return ok
+        
+        with self._health_lock:
+            # 락 대기 중 다른 스레드가 확인했으면 그 결과 사용
+            checked_at, ok = self._health_cache
+            if time.monotonic() - checked_at < HEALTH_CHECK_TTL:
+                return ok
+            
+            try:
+                response = self._get_session().get(
+                    self.api_url.replace('/api/generate', '/api/tags'),
+                    timeout=5
+                )
+                ok = response.status_code == 200
+            except Exception:
+                ok = False
+            
+            self._health_cache = (time.monotonic(), ok)
+            return ok
 
 
 # =============================================================================
@@ -1151,11 +2734,11 @@ if __name__ == '__main__':
     # 결과 출력
     if result:
         print("\n5. 분석 결과:")
-        print(f"   종목: {result['stock_code']} {result['stock_name']}")
-        print(f"   결정: {result['decision']}")
-        print(f"   신뢰도: {result['confidence']:.2f}")
-        print(f"   이유: {result['reason']}")
-        print(f"   소요 시간: {result['elapsed']:.2f}초")
+        print(f"   종목: {result.stock_code} {result.stock_name}")
+        print(f"   결정: {result.decision}")
+        print(f"   신뢰도: {result.confidence:.2f}")
+        print(f"   이유: {result.reason}")
+        print(f"   소요 시간: {result.elapsed:.2f}초")
     else:
         print("\n5. ❌ 결과를 받지 못했습니다.")
     
@@ -32,17 +32,36 @@ AI 매매 결과를 기록하고 통계를 제공하는 저장소
 """
 
 import os
+import time
+import atexit
+import weakref
 import sqlite3
 import logging
 import threading
+from queue import Queue, Full, Empty
 from pathlib import Path
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 from typing import Dict, List, Optional, Any
-from collections import defaultdict
+from collections import defaultdict, namedtuple, deque
+from contextlib import contextmanager
+from operator import itemgetter
 
 # 로거 설정
 logger = logging.getLogger('ScalpingBot.Learning')
 
+# 🆕 열려 있는 저장소 (프로세스 종료 시 대기 중인 기록 반영용, 약한 참조)
+_open_stores = weakref.WeakSet()
+
+
+@atexit.register
+def _close_open_stores():
+    """🆕 종료 시 close() 되지 않은 저장소의 대기 기록을 DB에 반영"""
+    for store in list(_open_stores):
+        try:
+            store.close()
+        except Exception as e:
+            logger.error(f"학습 저장소 종료 처리 실패: {e}")
+
 
 # =============================================================================
 # 상수 정의
@@ -57,6 +76,244 @@ STATS_LOOKBACK_DAYS = 30
 # 메모리 캐시 갱신 주기 (초)
 CACHE_REFRESH_INTERVAL = 60
 
+# 🆕 오늘 날짜 캐시 최대 유지 시간 (초, 자정이 먼저 오면 자정까지)
+TODAY_DATE_TTL = 60
+
+# 🆕 오늘 매매 기록 메모리 보관 상한 (초과 시 오래된 기록부터 버림, 집계는 유지)
+TODAY_RESULTS_MAX = 5000
+TODAY_SHARDS = 8                 # 🆕 오늘 기록 샤드 수 (2의 거듭제곱, 종목코드 해시로 분산)
+
+# 🆕 CSV 내보내기 시 한 번에 읽어 쓰는 행 수 (전체를 메모리에 올리지 않음)
+CSV_EXPORT_CHUNK = 1000
+
+# 🆕 매매 결과 비동기 기록 (add_result 는 큐에 넣고 즉시 반환, 백그라운드 스레드가 일괄 기록)
+WRITE_QUEUE_MAX = 10000          # 기록 대기 큐 최대 크기 (가득 차면 호출 스레드에서 직접 기록)
+WRITE_BATCH_MAX = 2000           # 한 번에 기록할 최대 행 수
+WRITE_BATCH_WAIT = 0.2           # 첫 행 이후 더 모으는 시간 (초)
+
+# 🆕 SQLite 연결 설정 (WAL: 읽기와 쓰기가 서로 막지 않음, NORMAL: 체크포인트 때만 fsync)
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",   # 256MB
+    "PRAGMA cache_size=-20000",     # 약 20MB
+)
+
+# 🆕 읽기 전용 연결 설정 (journal_mode/synchronous 는 쓰기 연결이 설정)
+SQLITE_READER_PRAGMAS = (
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",   # 256MB (여러 연결이 같은 매핑 페이지 공유)
+    "PRAGMA cache_size=-8000",      # 약 8MB
+)
+
+# 🆕 시작 시 ANALYZE 가 인덱스당 살펴보는 최대 행 수 (근사 통계로 충분)
+SQLITE_ANALYSIS_LIMIT = 1000
+
+
+# 🆕 일별 요약 행 (daily_summary 컬럼 순서, 딕셔너리가 필요하면 ._asdict())
+DailySummary = namedtuple('DailySummary', (
+    'id', 'trade_date', 'total_trades', 'win_count', 'loss_count',
+    'total_profit', 'avg_confidence', 'created_at',
+))
+
+
+# =============================================================================
+# 🆕 SQL 문 (모듈 상수 - 문자열을 매번 만들지 않고 sqlite3 문장 캐시 적중)
+# =============================================================================
+
+# 매매 결과 INSERT
+_INSERT_RESULT_SQL = """
+    INSERT INTO trade_results
+    (stock_code, decision, confidence, profit, win,
+     rule_score, cci, market_mode, trade_date)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# 종목별 통계
+_STOCK_STATS_SQL = """
+    SELECT
+        COUNT(*) as total,
+        SUM(win) as wins,
+        AVG(profit) as avg_profit,
+        MAX(profit) as max_profit,
+        MIN(profit) as min_profit
+    FROM trade_results
+    WHERE stock_code = ?
+"""
+
+# 🆕 일별 집계 트리거 (trade_results 행이 들어올 때마다 daily_summary 증분 갱신)
+_DAILY_SUMMARY_TRIGGER_SQL = """
+    CREATE TRIGGER IF NOT EXISTS trg_daily_summary
+    AFTER INSERT ON trade_results
+    WHEN NEW.trade_date IS NOT NULL
+    BEGIN
+        INSERT INTO daily_summary
+        (trade_date, total_trades, win_count, loss_count, total_profit, avg_confidence)
+        VALUES (NEW.trade_date, 1, NEW.win, 1 - NEW.win, NEW.profit, NEW.confidence)
+        ON CONFLICT(trade_date) DO UPDATE SET
+            total_trades = total_trades + 1,
+            win_count = win_count + NEW.win,
+            loss_count = loss_count + (1 - NEW.win),
+            total_profit = total_profit + NEW.profit,
+            avg_confidence = (avg_confidence * total_trades + NEW.confidence) / (total_trades + 1);
+    END
+"""
+
+# 🆕 일별 집계 전체 재계산 (트리거 도입 전 기록 반영용)
+_DAILY_SUMMARY_REBUILD_SQL = """
+    INSERT INTO daily_summary
+    (trade_date, total_trades, win_count, loss_count, total_profit, avg_confidence)
+    SELECT trade_date, COUNT(*), SUM(win), COUNT(*) - SUM(win), SUM(profit), AVG(confidence)
+    FROM trade_results
+    WHERE trade_date IS NOT NULL
+    GROUP BY trade_date
+    ON CONFLICT(trade_date) DO UPDATE SET
+        total_trades = excluded.total_trades,
+        win_count = excluded.win_count,
+        loss_count = excluded.loss_count,
+        total_profit = excluded.total_profit,
+        avg_confidence = excluded.avg_confidence
+"""
+
+# 🆕 기간 통계 (일별 요약 합산, 신뢰도는 평균×건수로 합계 복원)
+_STATS_FROM_SUMMARY_SQL = """
+    SELECT COALESCE(SUM(total_trades), 0),
+           COALESCE(SUM(win_count), 0),
+           COALESCE(SUM(total_profit), 0.0),
+           COALESCE(SUM(avg_confidence * total_trades), 0.0)
+    FROM daily_summary
+    WHERE trade_date >= ?
+"""
+
+# 🆕 패턴별 승률 (CCI 구간 / 점수 구간 / 시장 모드를 한 번의 쿼리로, kind 열로 구분)
+# 각 부분은 부분 커버링 인덱스(idx_*_cover)만 읽음
+_PATTERN_STATS_SQL = """
+    SELECT
+        'cci_stats' as kind,
+        CASE
+            WHEN cci < -100 THEN 'oversold'
+            WHEN cci > 100 THEN 'overbought'
+            ELSE 'neutral'
+        END as bucket,
+        COUNT(*) as total,
+        SUM(win) as wins,
+        AVG(profit) as avg_profit
+    FROM trade_results
+    WHERE cci IS NOT NULL
+    GROUP BY bucket
+    UNION ALL
+    SELECT
+        'score_stats',
+        CASE
+            WHEN rule_score >= 80 THEN 'high'
+            WHEN rule_score >= 70 THEN 'medium'
+            ELSE 'low'
+        END as bucket,
+        COUNT(*),
+        SUM(win),
+        AVG(profit)
+    FROM trade_results
+    WHERE rule_score IS NOT NULL
+    GROUP BY bucket
+    UNION ALL
+    SELECT
+        'market_stats',
+        market_mode,
+        COUNT(*),
+        SUM(win),
+        AVG(profit)
+    FROM trade_results
+    WHERE market_mode IS NOT NULL
+    GROUP BY market_mode
+"""
+
+
+def _result_row(result: Dict, trade_date: date) -> tuple:
+    """🆕 결과 딕셔너리 → _INSERT_RESULT_SQL 파라미터 튜플"""
+    get = result.get
+    return (
+        result['stock_code'], result['decision'], result['confidence'],
+        result['profit'], 1 if result['win'] else 0,
+        get('rule_score'), get('cci'), get('market_mode'),
+        trade_date
+    )
+
+
+# =============================================================================
+# 🆕 읽기/쓰기 락
+# =============================================================================
+
+class _RWLock:
+    """
+    읽기/쓰기 락 (쓰기 우선)
+    
+    통계 조회끼리는 동시에 진행하고, 기록/집계 갱신만 단독으로 실행합니다.
+    쓰기 대기자가 있으면 새 읽기는 기다려 쓰기가 굶지 않게 합니다.
+    """
+    
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+    
+    @contextmanager
+    def read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+    
+    @contextmanager
+    def write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+# =============================================================================
+# 🆕 오늘 매매 기록 샤드
+# =============================================================================
+
+class _TodayShard:
+    """
+    🆕 오늘 매매 기록 샤드 (샤드마다 락 + 최근 기록 + 누적 집계)
+    
+    종목코드 해시로 샤드를 나눠, 여러 스레드의 add_result 가 서로 다른 락을 잡고
+    DB 읽기/쓰기 락(_rwlock)과도 경합하지 않습니다. 조회 시 모든 샤드를 합산합니다.
+    """
+    
+    __slots__ = ('lock', 'results', 'count', 'wins', 'sum_profit')
+    
+    def __init__(self, maxlen: int):
+        self.lock = threading.Lock()
+        self.results: deque = deque(maxlen=maxlen)
+        self.clear()
+    
+    def clear(self):
+        """기록/집계 초기화 (lock 보유 상태에서 호출)"""
+        self.results.clear()
+        self.count = 0
+        self.wins = 0
+        self.sum_profit = 0.0
+
 
 # =============================================================================
 # Learning Store 클래스
@@ -70,98 +327,233 @@ class LearningStore:
     AI 프롬프트에 활용합니다.
     """
     
-    def __init__(self, db_path: Path = None):
+    def __init__(self, db_path: Path = None, today_cap: int = TODAY_RESULTS_MAX):
         """
         초기화
         
         Args:
             db_path: SQLite 데이터베이스 경로 (기본값: db/learning.db)
+            today_cap: 🆕 오늘 매매 기록 메모리 보관 건수 상한
         """
         self.db_path = db_path or DEFAULT_DB_PATH
         
         # DB 디렉토리 생성
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # 스레드 안전성을 위한 락
-        self._lock = threading.Lock()
+        # 스레드 안전성을 위한 락 (🆕 조회는 동시에, 기록/갱신만 단독)
+        self._rwlock = _RWLock()
+        
+        # 🆕 영구 연결 (호출마다 connect 하지 않음 / autocommit, 일괄 기록만 명시적 트랜잭션)
+        # 쓰기는 이 연결 하나로만 (백그라운드 기록 스레드 / 초기화)
+        self._conn = self._connect()
+        
+        # 🆕 조회용 읽기 전용 연결 (스레드마다 별도 → WAL 에서 조회끼리 연결 뮤텍스 경합 없음)
+        self._reader_tls = threading.local()
+        self._readers: List[sqlite3.Connection] = []
+        self._readers_lock = threading.Lock()
+        self._closed = False
         
         # 메모리 캐시
         self._cache = {
             'stats': None,
             'pattern_stats': None,
             'last_update': 0,
+            'pattern_last_update': 0,  # 🆕 패턴 통계 캐시 시각
         }
         
-        # 오늘 매매 기록 (메모리)
-        self._today_results: List[Dict] = []
+        # 🆕 오늘 날짜 캐시 (만료 시각(monotonic), 날짜) - 기록/조회마다 시계를 읽지 않음
+        self._today_date_cache = (0.0, None)
+        
+        # 오늘 매매 기록 (메모리, 🆕 최근 today_cap 건만 보관)
+        # 🆕 종목코드 해시로 TODAY_SHARDS 개 샤드에 분산 (샤드별 락 + 누적 집계 → 조회 시 합산)
+        self._today_shards = [
+            _TodayShard(max(1, today_cap // TODAY_SHARDS)) for _ in range(TODAY_SHARDS)
+        ]
         
         # DB 초기화
         self._init_database()
         
+        # 🆕 기록 대기 큐 + 백그라운드 기록 스레드 (None = 종료 신호)
+        self._write_closed = False  # close() 시작 후 기록 거부
+        self._write_queue: Queue = Queue(maxsize=WRITE_QUEUE_MAX)
+        self._flusher = threading.Thread(
+            target=self._flush_loop,
+            name="LearningStore-Flusher",
+            daemon=True,
+        )
+        self._flusher.start()
+        _open_stores.add(self)
+        
         logger.info(f"LearningStore 초기화 완료 (DB: {self.db_path})")
     
     # =========================================================================
     # 데이터베이스 초기화
     # =========================================================================
     
+    def _connect(self) -> sqlite3.Connection:
+        """🆕 WAL 모드 쓰기 연결 생성 (_rwlock 쓰기 락 하에서만 기록)"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False, isolation_level=None)
+        for pragma in SQLITE_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+    
+    def _reader(self) -> sqlite3.Connection:
+        """
+        🆕 현재 스레드 전용 읽기 전용 연결 (첫 호출 시 생성)
+        
+        mode=ro URI 로 열어 쓰기가 불가능하고, WAL 이라 기록 중에도 마지막 커밋 기준으로 읽습니다.
+        공유 캐시(cache=shared)는 테이블 단위 락으로 WAL 의 동시 읽기를 막으므로 쓰지 않습니다.
+        """
+        conn = getattr(self._reader_tls, 'conn', None)
+        if conn is None:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            conn = sqlite3.connect(
+                f"{Path(self.db_path).resolve().as_uri()}?mode=ro",
+                uri=True,
+                check_same_thread=False,
+            )
+            for pragma in SQLITE_READER_PRAGMAS:
+                conn.execute(pragma)
+            self._reader_tls.conn = conn
+            with self._readers_lock:
+                self._readers.append(conn)
+        return conn
+    
+    def close(self):
+        """
+        🆕 대기 중인 기록을 마치고 DB 연결 종료 (종료 시 호출, 여러 번 호출해도 안전)
+        
+        이후 조회는 ProgrammingError, 기록은 에러 로그만 남기고 버려집니다.
+        호출하지 않아도 프로세스 종료(atexit) 시 자동으로 호출됩니다.
+        """
+        if self._write_closed:
+            return
+        self._write_closed = True
+        _open_stores.discard(self)
+        
+        if self._flusher.is_alive():
+            self._write_queue.put(None)
+            self._flusher.join()
+        
+        with self._rwlock.write():
+            with self._readers_lock:
+                readers, self._readers = self._readers, []
+                self._reader_tls = threading.local()
+                self._closed = True
+            for conn in readers:
+                conn.close()
+            self._conn.close()
+    
     def _init_database(self):
         """데이터베이스 테이블 생성"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            
-            # 매매 결과 테이블
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS trade_results (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    stock_code TEXT NOT NULL,
-                    decision TEXT NOT NULL,
-                    confidence REAL NOT NULL,
-                    profit REAL NOT NULL,
-                    win INTEGER NOT NULL,
-                    
-                    -- 추가 컨텍스트 (선택)
-                    rule_score REAL,
-                    cci REAL,
-                    market_mode TEXT,
-                    
-                    -- 타임스탬프
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                    trade_date DATE
-                )
-            """)
-            
-            # 인덱스 생성
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_trade_date 
-                ON trade_results(trade_date)
-            """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_stock_code 
-                ON trade_results(stock_code)
-            """)
-            
-            cursor.execute("""
-                CREATE INDEX IF NOT EXISTS idx_decision 
-                ON trade_results(decision)
-            """)
-            
-            # 일별 집계 테이블 (성능 최적화)
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS daily_summary (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    trade_date DATE UNIQUE NOT NULL,
-                    total_trades INTEGER DEFAULT 0,
-                    win_count INTEGER DEFAULT 0,
-                    loss_count INTEGER DEFAULT 0,
-                    total_profit REAL DEFAULT 0,
-                    avg_confidence REAL DEFAULT 0,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                )
-            """)
-            
-            conn.commit()
-            logger.debug("DB 테이블 초기화 완료")
+        conn = self._conn
+        cursor = conn.cursor()
+        
+        # 매매 결과 테이블
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS trade_results (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                stock_code TEXT NOT NULL,
+                decision TEXT NOT NULL,
+                confidence REAL NOT NULL,
+                profit REAL NOT NULL,
+                win INTEGER NOT NULL,
+                
+                -- 추가 컨텍스트 (선택)
+                rule_score REAL,
+                cci REAL,
+                market_mode TEXT,
+                
+                -- 타임스탬프
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                trade_date DATE
+            )
+        """)
+        
+        # 인덱스 생성
+        # 🆕 날짜/종목 인덱스는 집계 컬럼까지 포함한 커버링 인덱스로 교체
+        # (일별 집계/종목 통계를 테이블 행 없이 인덱스만으로 계산, 기존 단일 컬럼 인덱스는 접두어라 중복)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_trade_date_cover
+            ON trade_results(trade_date, win, profit, confidence)
+        """)
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_stock_cover
+            ON trade_results(stock_code, win, profit)
+        """)
+        
+        cursor.execute("DROP INDEX IF EXISTS idx_trade_date")
+        cursor.execute("DROP INDEX IF EXISTS idx_stock_code")
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_decision 
+            ON trade_results(decision)
+        """)
+        
+        # 🆕 패턴 통계용 부분 커버링 인덱스 (테이블 행을 읽지 않고 집계)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_cci_cover
+            ON trade_results(cci, win, profit) WHERE cci IS NOT NULL
+        """)
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_score_cover
+            ON trade_results(rule_score, win, profit) WHERE rule_score IS NOT NULL
+        """)
+        
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_market_cover
+            ON trade_results(market_mode, win, profit) WHERE market_mode IS NOT NULL
+        """)
+        
+        # 일별 집계 테이블 (성능 최적화)
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS daily_summary (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                trade_date DATE UNIQUE NOT NULL,
+                total_trades INTEGER DEFAULT 0,
+                win_count INTEGER DEFAULT 0,
+                loss_count INTEGER DEFAULT 0,
+                total_profit REAL DEFAULT 0,
+                avg_confidence REAL DEFAULT 0,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # 🆕 일별 집계는 INSERT 트리거가 행마다 증분 갱신 (마감 시 재집계 불필요)
+        # 트리거를 처음 만드는 DB는 기존 기록으로 한 번 다시 집계해 시작점을 맞춤
+        cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'trigger' AND name = 'trg_daily_summary'"
+        )
+        if cursor.fetchone() is None:
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.execute(_DAILY_SUMMARY_TRIGGER_SQL)
+                cursor.execute(_DAILY_SUMMARY_REBUILD_SQL)
+                cursor.execute("COMMIT")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+        
+        # 🆕 플래너 통계 갱신 (커버링 인덱스 선택용, 인덱스당 표본만 읽어 시작 지연 제한)
+        cursor.execute(f"PRAGMA analysis_limit={SQLITE_ANALYSIS_LIMIT}")
+        cursor.execute("ANALYZE")
+        
+        logger.debug("DB 테이블 초기화 완료")
+    
+    def _today(self) -> date:
+        """🆕 오늘 날짜 (TODAY_DATE_TTL 또는 자정 중 먼저 오는 시점까지 캐시)"""
+        expiry, today = self._today_date_cache
+        mono = time.monotonic()
+        if mono >= expiry:
+            now = datetime.now()
+            today = now.date()
+            midnight = datetime.combine(today + timedelta(days=1), datetime.min.time())
+            until_midnight = (midnight - now).total_seconds()
+            self._today_date_cache = (mono + min(TODAY_DATE_TTL, until_midnight), today)
+        return today
     
     # =========================================================================
     # 결과 기록
@@ -191,27 +583,30 @@ class LearningStore:
             cci: CCI 값 (선택)
             market_mode: 시장 모드 (선택)
         """
-        today = datetime.now().date()
+        if self._write_closed:
+            logger.error(f"닫힌 저장소에 매매 결과 기록 시도 - 버림: {stock_code} {profit:+.2f}%")
+            return
+        
+        today = self._today()
+        row = (
+            stock_code, decision, confidence, profit,
+            1 if win else 0,
+            rule_score, cci, market_mode, today
+        )
         
-        with self._lock:
+        # 🆕 DB 기록은 백그라운드 스레드가 일괄 처리 (캐시 무효화도 기록 후 그쪽에서)
+        try:
+            self._write_queue.put_nowait(row)
+        except Full:
+            logger.warning("매매 결과 기록 큐 가득 참 - 직접 기록")
+            self._write_rows([row])
+        
+        # 🆕 DB 락 대신 종목 샤드 락만 보유
+        shard = self._today_shards[hash(stock_code) & (TODAY_SHARDS - 1)]
+        with shard.lock:
             try:
-                # DB에 저장
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        INSERT INTO trade_results 
-                        (stock_code, decision, confidence, profit, win, 
-                         rule_score, cci, market_mode, trade_date)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, (
-                        stock_code, decision, confidence, profit, 
-                        1 if win else 0,
-                        rule_score, cci, market_mode, today
-                    ))
-                    conn.commit()
-                
                 # 메모리에도 저장 (오늘 기록)
-                self._today_results.append({
+                shard.results.append({
                     'stock_code': stock_code,
                     'decision': decision,
                     'confidence': confidence,
@@ -219,9 +614,9 @@ class LearningStore:
                     'win': win,
                     'timestamp': datetime.now(),
                 })
-                
-                # 캐시 무효화
-                self._cache['stats'] = None
+                shard.count += 1
+                shard.wins += 1 if win else 0
+                shard.sum_profit += profit
                 
                 logger.debug(
                     f"매매 결과 기록: {stock_code} {decision} "
@@ -231,42 +626,95 @@ class LearningStore:
             except Exception as e:
                 logger.error(f"매매 결과 기록 실패: {e}")
     
-    def add_result_batch(self, results: List[Dict]):
+    def flush(self):
+        """🆕 대기 중인 매매 결과가 모두 DB에 기록될 때까지 대기"""
+        if self._flusher.is_alive():
+            self._write_queue.join()
+    
+    def _flush_loop(self):
         """
-        매매 결과 일괄 기록 (성능 최적화)
+        🆕 백그라운드 기록 루프
         
-        Args:
-            results: 결과 딕셔너리 리스트
+        첫 행이 들어오면 WRITE_BATCH_WAIT 동안 (최대 WRITE_BATCH_MAX 행) 더 모아
+        한 트랜잭션으로 기록합니다. None 을 받으면 남은 행을 기록하고 종료합니다.
         """
-        today = datetime.now().date()
+        running = True
+        while running:
+            row = self._write_queue.get()
+            rows = []
+            if row is None:
+                running = False
+            else:
+                rows.append(row)
+                deadline = time.monotonic() + WRITE_BATCH_WAIT
+                while len(rows) < WRITE_BATCH_MAX:
+                    remaining = deadline - time.monotonic()
+                    try:
+                        row = self._write_queue.get(timeout=remaining) if remaining > 0 else self._write_queue.get_nowait()
+                    except Empty:
+                        break
+                    if row is None:
+                        running = False
+                        break
+                    rows.append(row)
+            
+            if rows:
+                self._write_rows(rows)
+            
+            # 꺼낸 항목 수만큼 완료 표시 (종료 신호 포함)
+            for _ in range(len(rows) + (0 if running else 1)):
+                self._write_queue.task_done()
+    
+    def _write_rows(self, rows: List[tuple]) -> bool:
+        """
+        🆕 매매 결과 행 일괄 INSERT (한 트랜잭션) + 캐시 무효화 → 성공 여부
         
-        with self._lock:
+        BEGIN IMMEDIATE 로 시작 시점에 쓰기 락을 잡아, 같은 DB를 쓰는 다른 프로세스와
+        트랜잭션 도중 락 승격 충돌(SQLITE_BUSY 후 롤백) 없이 순서대로 기록합니다.
+        """
+        with self._rwlock.write():
             try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.executemany("""
-                        INSERT INTO trade_results 
-                        (stock_code, decision, confidence, profit, win, 
-                         rule_score, cci, market_mode, trade_date)
-                        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    """, [
-                        (
-                            r['stock_code'], r['decision'], r['confidence'],
-                            r['profit'], 1 if r['win'] else 0,
-                            r.get('rule_score'), r.get('cci'), r.get('market_mode'),
-                            today
-                        )
-                        for r in results
-                    ])
-                    conn.commit()
+                cursor = self._conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor.executemany(_INSERT_RESULT_SQL, rows)
+                    cursor.execute("COMMIT")
+                except Exception:
+                    cursor.execute("ROLLBACK")
+                    raise
                 
                 # 캐시 무효화
                 self._cache['stats'] = None
-                
-                logger.info(f"매매 결과 {len(results)}건 일괄 기록 완료")
+                self._cache['pattern_stats'] = None
+                return True
                 
             except Exception as e:
-                logger.error(f"매매 결과 일괄 기록 실패: {e}")
+                logger.error(f"매매 결과 기록 실패 ({len(rows)}건): {e}")
+                return False
+    
+    def add_result_batch(self, results: List[Dict]):
+        """
+        매매 결과 일괄 기록 (성능 최적화)
+        
+        Args:
+            results: 결과 딕셔너리 리스트
+        """
+        if self._write_closed:
+            logger.error(f"닫힌 저장소에 매매 결과 일괄 기록 시도 - 버림: {len(results)}건")
+            return
+        
+        today = self._today()
+        
+        try:
+            rows = [_result_row(r, today) for r in results]
+        except Exception as e:
+            logger.error(f"매매 결과 일괄 기록 실패: {e}")
+            return
+        
+        # 🆕 대기 중인 add_result 기록보다 뒤에 들어가도록 먼저 비움
+        self.flush()
+        if self._write_rows(rows):
+            logger.info(f"매매 결과 {len(results)}건 일괄 기록 완료")
     
     # =========================================================================
     # 통계 조회
@@ -292,55 +740,41 @@ class LearningStore:
             }
         """
         # 캐시 확인
-        import time
         now = time.time()
         if (self._cache['stats'] is not None and 
             now - self._cache['last_update'] < CACHE_REFRESH_INTERVAL):
             return self._cache['stats']
         
-        with self._lock:
+        with self._rwlock.read():
             try:
-                cutoff_date = (datetime.now() - timedelta(days=lookback_days)).date()
+                cutoff_date = self._today() - timedelta(days=lookback_days)
                 
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # 전체 통계
-                    cursor.execute("""
-                        SELECT 
-                            COUNT(*) as total,
-                            SUM(win) as wins,
-                            AVG(profit) as avg_profit,
-                            AVG(confidence) as avg_conf,
-                            SUM(profit) as total_profit
-                        FROM trade_results
-                        WHERE trade_date >= ?
-                    """, (cutoff_date,))
-                    
-                    row = cursor.fetchone()
-                    
-                    total = row[0] or 0
-                    wins = row[1] or 0
-                    avg_profit = row[2] or 0
-                    avg_conf = row[3] or 0.5
-                    total_profit = row[4] or 0
-                    
-                    stats = {
-                        'total_trades': total,
-                        'win_count': wins,
-                        'loss_count': total - wins,
-                        'winrate': (wins / total * 100) if total > 0 else 50,
-                        'avg_profit': avg_profit,
-                        'avg_confidence': avg_conf,
-                        'total_profit': total_profit,
-                        'lookback_days': lookback_days,
-                    }
-                    
-                    # 캐시 업데이트
-                    self._cache['stats'] = stats
-                    self._cache['last_update'] = now
-                    
-                    return stats
+                # 🆕 전체 통계 (daily_summary 일별 행 합산, trade_results 스캔 없음)
+                # 트리거가 모든 기록을 집계하므로 다른 인스턴스/프로세스 기록도 반영됨
+                conn = self._reader()
+                cursor = conn.cursor()
+                cursor.execute(_STATS_FROM_SUMMARY_SQL, (cutoff_date,))
+                total, wins, total_profit, sum_conf = cursor.fetchone()
+                
+                avg_profit = total_profit / total if total else 0
+                avg_conf = sum_conf / total if total else 0.5
+                
+                stats = {
+                    'total_trades': total,
+                    'win_count': wins,
+                    'loss_count': total - wins,
+                    'winrate': (wins / total * 100) if total > 0 else 50,
+                    'avg_profit': avg_profit,
+                    'avg_confidence': avg_conf,
+                    'total_profit': total_profit,
+                    'lookback_days': lookback_days,
+                }
+                
+                # 캐시 업데이트
+                self._cache['stats'] = stats
+                self._cache['last_update'] = now
+                
+                return stats
                     
             except Exception as e:
                 logger.error(f"통계 조회 실패: {e}")
@@ -355,34 +789,75 @@ class LearningStore:
                     'lookback_days': lookback_days,
                 }
     
+    def get_runtime_stats(self) -> Dict:
+        """
+        🆕 런타임 상태 조회 (기록 큐 적체 / 캐시 나이 / 메모리 기록 수)
+        
+        기록 스레드, 캐시 무효화 중 어디가 병목인지 확인할 때 사용합니다.
+        캐시 나이는 캐시가 비어 있으면 None 입니다.
+        """
+        now = time.time()
+        stats_cached = self._cache['stats'] is not None
+        pattern_cached = self._cache['pattern_stats'] is not None
+        
+        today_buffered = 0
+        for shard in self._today_shards:
+            with shard.lock:
+                today_buffered += len(shard.results)
+        
+        return {
+            'write_queue': self._write_queue.qsize(),
+            'write_queue_max': WRITE_QUEUE_MAX,
+            'flusher_alive': self._flusher.is_alive(),
+            'stats_cache_age': now - self._cache['last_update'] if stats_cached else None,
+            'pattern_cache_age': now - self._cache['pattern_last_update'] if pattern_cached else None,
+            'today_buffered': today_buffered,
+        }
+    
+    def get_today_counts(self) -> Dict:
+        """
+        🆕 오늘 매매 집계만 조회 (누적값 사용, 기록 복사 없음)
+        
+        Returns:
+            오늘 통계 딕셔너리 (results 제외)
+        """
+        total = wins = 0
+        total_profit = 0.0
+        for shard in self._today_shards:
+            with shard.lock:
+                total += shard.count
+                wins += shard.wins
+                total_profit += shard.sum_profit
+        
+        return {
+            'total_trades': total,
+            'win_count': wins,
+            'loss_count': total - wins,
+            'winrate': (wins / total * 100) if total > 0 else 0,
+            'total_profit': total_profit,
+        }
+    
+    def get_today_results(self) -> List[Dict]:
+        """🆕 오늘 매매 기록 복사본 (샤드별 최근 기록을 시간순으로 병합)"""
+        results = []
+        for shard in self._today_shards:
+            with shard.lock:
+                results.extend(shard.results)
+        results.sort(key=itemgetter('timestamp'))
+        return results
+    
     def get_today_stats(self) -> Dict:
         """
         오늘 매매 통계 조회
         
+        집계만 필요하면 get_today_counts() 를 사용하세요 (기록 복사 없음).
+        
         Returns:
-            오늘 통계 딕셔너리
+            오늘 통계 딕셔너리 (results: 기록 복사본)
         """
-        with self._lock:
-            if not self._today_results:
-                return {
-                    'total_trades': 0,
-                    'win_count': 0,
-                    'winrate': 0,
-                    'total_profit': 0,
-                }
-            
-            wins = sum(1 for r in self._today_results if r['win'])
-            total = len(self._today_results)
-            total_profit = sum(r['profit'] for r in self._today_results)
-            
-            return {
-                'total_trades': total,
-                'win_count': wins,
-                'loss_count': total - wins,
-                'winrate': (wins / total * 100) if total > 0 else 0,
-                'total_profit': total_profit,
-                'results': list(self._today_results),  # 복사본 반환
-            }
+        stats = self.get_today_counts()
+        stats['results'] = self.get_today_results()
+        return stats
     
     def get_stock_stats(self, stock_code: str) -> Dict:
         """
@@ -394,34 +869,25 @@ class LearningStore:
         Returns:
             종목별 통계
         """
-        with self._lock:
+        with self._rwlock.read():
             try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT 
-                            COUNT(*) as total,
-                            SUM(win) as wins,
-                            AVG(profit) as avg_profit,
-                            MAX(profit) as max_profit,
-                            MIN(profit) as min_profit
-                        FROM trade_results
-                        WHERE stock_code = ?
-                    """, (stock_code,))
-                    
-                    row = cursor.fetchone()
-                    total = row[0] or 0
-                    wins = row[1] or 0
-                    
-                    return {
-                        'stock_code': stock_code,
-                        'total_trades': total,
-                        'win_count': wins,
-                        'winrate': (wins / total * 100) if total > 0 else 50,
-                        'avg_profit': row[2] or 0,
-                        'max_profit': row[3] or 0,
-                        'min_profit': row[4] or 0,
-                    }
+                conn = self._reader()
+                cursor = conn.cursor()
+                cursor.execute(_STOCK_STATS_SQL, (stock_code,))
+                
+                row = cursor.fetchone()
+                total = row[0] or 0
+                wins = row[1] or 0
+                
+                return {
+                    'stock_code': stock_code,
+                    'total_trades': total,
+                    'win_count': wins,
+                    'winrate': (wins / total * 100) if total > 0 else 50,
+                    'avg_profit': row[2] or 0,
+                    'max_profit': row[3] or 0,
+                    'min_profit': row[4] or 0,
+                }
                     
             except Exception as e:
                 logger.error(f"종목 통계 조회 실패: {e}")
@@ -438,92 +904,39 @@ class LearningStore:
         CCI 구간, 점수 구간, 시장 모드별 승률을 분석합니다.
         
         Returns:
-            패턴별 통계 딕셔너리
+            패턴별 통계 딕셔너리 (🆕 CACHE_REFRESH_INTERVAL 동안 캐시, 공유 객체이므로 수정 금지)
         """
-        with self._lock:
+        # 🆕 캐시 확인
+        now = time.time()
+        if (self._cache['pattern_stats'] is not None and
+            now - self._cache['pattern_last_update'] < CACHE_REFRESH_INTERVAL):
+            return self._cache['pattern_stats']
+        
+        with self._rwlock.read():
             try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # CCI 구간별 승률
-                    cursor.execute("""
-                        SELECT 
-                            CASE 
-                                WHEN cci < -100 THEN 'oversold'
-                                WHEN cci > 100 THEN 'overbought'
-                                ELSE 'neutral'
-                            END as cci_zone,
-                            COUNT(*) as total,
-                            SUM(win) as wins,
-                            AVG(profit) as avg_profit
-                        FROM trade_results
-                        WHERE cci IS NOT NULL
-                        GROUP BY cci_zone
-                    """)
-                    
-                    cci_stats = {}
-                    for row in cursor.fetchall():
-                        zone, total, wins, avg_profit = row
-                        cci_stats[zone] = {
-                            'total': total,
-                            'wins': wins or 0,
-                            'winrate': (wins / total * 100) if total > 0 else 50,
-                            'avg_profit': avg_profit or 0,
-                        }
-                    
-                    # 점수 구간별 승률
-                    cursor.execute("""
-                        SELECT 
-                            CASE 
-                                WHEN rule_score >= 80 THEN 'high'
-                                WHEN rule_score >= 70 THEN 'medium'
-                                ELSE 'low'
-                            END as score_zone,
-                            COUNT(*) as total,
-                            SUM(win) as wins,
-                            AVG(profit) as avg_profit
-                        FROM trade_results
-                        WHERE rule_score IS NOT NULL
-                        GROUP BY score_zone
-                    """)
-                    
-                    score_stats = {}
-                    for row in cursor.fetchall():
-                        zone, total, wins, avg_profit = row
-                        score_stats[zone] = {
-                            'total': total,
-                            'wins': wins or 0,
-                            'winrate': (wins / total * 100) if total > 0 else 50,
-                            'avg_profit': avg_profit or 0,
-                        }
-                    
-                    # 시장 모드별 승률
-                    cursor.execute("""
-                        SELECT 
-                            market_mode,
-                            COUNT(*) as total,
-                            SUM(win) as wins,
-                            AVG(profit) as avg_profit
-                        FROM trade_results
-                        WHERE market_mode IS NOT NULL
-                        GROUP BY market_mode
-                    """)
-                    
-                    market_stats = {}
-                    for row in cursor.fetchall():
-                        mode, total, wins, avg_profit = row
-                        market_stats[mode] = {
-                            'total': total,
-                            'wins': wins or 0,
-                            'winrate': (wins / total * 100) if total > 0 else 50,
-                            'avg_profit': avg_profit or 0,
-                        }
-                    
-                    return {
-                        'cci_stats': cci_stats,
-                        'score_stats': score_stats,
-                        'market_stats': market_stats,
+                conn = self._reader()
+                cursor = conn.cursor()
+                
+                # 🆕 CCI 구간 / 점수 구간 / 시장 모드별 승률 (한 번의 쿼리)
+                pattern_stats = {
+                    'cci_stats': {},
+                    'score_stats': {},
+                    'market_stats': {},
+                }
+                cursor.execute(_PATTERN_STATS_SQL)
+                for kind, bucket, total, wins, avg_profit in cursor:
+                    pattern_stats[kind][bucket] = {
+                        'total': total,
+                        'wins': wins or 0,
+                        'winrate': (wins / total * 100) if total > 0 else 50,
+                        'avg_profit': avg_profit or 0,
                     }
+                
+                # 🆕 캐시 업데이트
+                self._cache['pattern_stats'] = pattern_stats
+                self._cache['pattern_last_update'] = now
+                
+                return pattern_stats
                     
             except Exception as e:
                 logger.error(f"패턴 통계 조회 실패: {e}")
@@ -541,60 +954,20 @@ class LearningStore:
         """
         일별 집계 업데이트
         
-        매일 마감 시 호출하여 일별 요약을 저장합니다.
+        🆕 daily_summary 는 INSERT 트리거(trg_daily_summary)가 기록마다 갱신하므로
+        대기 중인 기록만 DB에 반영합니다 (기존 호출부 호환용).
         
         Args:
-            trade_date: 집계 날짜 (기본값: 오늘)
+            trade_date: 집계 날짜 (기본값: 오늘, 로그 표시용)
         """
         if trade_date is None:
-            trade_date = datetime.now().date()
+            trade_date = self._today()
         
-        with self._lock:
-            try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    
-                    # 해당 날짜 집계
-                    cursor.execute("""
-                        SELECT 
-                            COUNT(*) as total,
-                            SUM(win) as wins,
-                            SUM(profit) as total_profit,
-                            AVG(confidence) as avg_conf
-                        FROM trade_results
-                        WHERE trade_date = ?
-                    """, (trade_date,))
-                    
-                    row = cursor.fetchone()
-                    total = row[0] or 0
-                    wins = row[1] or 0
-                    total_profit = row[2] or 0
-                    avg_conf = row[3] or 0
-                    
-                    # UPSERT
-                    cursor.execute("""
-                        INSERT INTO daily_summary 
-                        (trade_date, total_trades, win_count, loss_count, 
-                         total_profit, avg_confidence)
-                        VALUES (?, ?, ?, ?, ?, ?)
-                        ON CONFLICT(trade_date) DO UPDATE SET
-                            total_trades = excluded.total_trades,
-                            win_count = excluded.win_count,
-                            loss_count = excluded.loss_count,
-                            total_profit = excluded.total_profit,
-                            avg_confidence = excluded.avg_confidence
-                    """, (
-                        trade_date, total, wins, total - wins,
-                        total_profit, avg_conf
-                    ))
-                    
-                    conn.commit()
-                    logger.info(f"일별 집계 업데이트: {trade_date} ({total}건)")
-                    
-            except Exception as e:
-                logger.error(f"일별 집계 업데이트 실패: {e}")
+        self.flush()  # 대기 중인 기록 반영 → 트리거가 집계
+        
+        logger.info(f"일별 집계 반영 완료: {trade_date}")
     
-    def get_daily_summaries(self, days: int = 30) -> List[Dict]:
+    def get_daily_summaries(self, days: int = 30) -> List[DailySummary]:
         """
         일별 요약 조회
         
@@ -602,23 +975,23 @@ class LearningStore:
             days: 조회 기간 (일)
         
         Returns:
-            일별 요약 리스트
+            일별 요약 리스트 (🆕 DailySummary 네임드튜플, 행마다 dict 를 만들지 않음)
         """
-        with self._lock:
+        with self._rwlock.read():
             try:
-                cutoff_date = (datetime.now() - timedelta(days=days)).date()
+                cutoff_date = self._today() - timedelta(days=days)
                 
-                with sqlite3.connect(self.db_path) as conn:
-                    conn.row_factory = sqlite3.Row
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT *
-                        FROM daily_summary
-                        WHERE trade_date >= ?
-                        ORDER BY trade_date DESC
-                    """, (cutoff_date,))
-                    
-                    return [dict(row) for row in cursor.fetchall()]
+                conn = self._reader()
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT id, trade_date, total_trades, win_count, loss_count,
+                           total_profit, avg_confidence, created_at
+                    FROM daily_summary
+                    WHERE trade_date >= ?
+                    ORDER BY trade_date DESC
+                """, (cutoff_date,))
+                
+                return list(map(DailySummary._make, cursor))
                     
             except Exception as e:
                 logger.error(f"일별 요약 조회 실패: {e}")
@@ -630,9 +1003,10 @@ class LearningStore:
     
     def clear_today_results(self):
         """오늘 메모리 기록 초기화"""
-        with self._lock:
-            self._today_results.clear()
-            logger.info("오늘 매매 기록 메모리 초기화")
+        for shard in self._today_shards:
+            with shard.lock:
+                shard.clear()
+        logger.info("오늘 매매 기록 메모리 초기화")
     
     def export_to_csv(self, filepath: str, days: int = 30):
         """
@@ -644,40 +1018,50 @@ class LearningStore:
         """
         import csv
         
-        with self._lock:
+        self.flush()  # 🆕 대기 중인 기록 포함
+        
+        with self._rwlock.read():
             try:
-                cutoff_date = (datetime.now() - timedelta(days=days)).date()
+                cutoff_date = self._today() - timedelta(days=days)
                 
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("""
-                        SELECT *
-                        FROM trade_results
-                        WHERE trade_date >= ?
-                        ORDER BY created_at DESC
-                    """, (cutoff_date,))
-                    
-                    columns = [desc[0] for desc in cursor.description]
-                    rows = cursor.fetchall()
-                    
-                    with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                        writer = csv.writer(f)
-                        writer.writerow(columns)
+                conn = self._reader()
+                cursor = conn.cursor()
+                cursor.execute("""
+                    SELECT *
+                    FROM trade_results
+                    WHERE trade_date >= ?
+                    ORDER BY created_at DESC
+                """, (cutoff_date,))
+                
+                columns = [desc[0] for desc in cursor.description]
+                count = 0
+                
+                # 🆕 커서에서 CSV_EXPORT_CHUNK 행씩 읽어 바로 기록 (메모리 사용량 일정)
+                with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                    writer = csv.writer(f)
+                    writer.writerow(columns)
+                    while True:
+                        rows = cursor.fetchmany(CSV_EXPORT_CHUNK)
+                        if not rows:
+                            break
                         writer.writerows(rows)
-                    
-                    logger.info(f"CSV 내보내기 완료: {filepath} ({len(rows)}건)")
+                        count += len(rows)
+                
+                logger.info(f"CSV 내보내기 완료: {filepath} ({count}건)")
                     
             except Exception as e:
                 logger.error(f"CSV 내보내기 실패: {e}")
     
     def get_record_count(self) -> int:
-        """전체 기록 수 조회"""
-        with self._lock:
+        """전체 기록 수 조회 (🆕 대기 중인 기록 포함)"""
+        self.flush()
+        
+        with self._rwlock.read():
             try:
-                with sqlite3.connect(self.db_path) as conn:
-                    cursor = conn.cursor()
-                    cursor.execute("SELECT COUNT(*) FROM trade_results")
-                    return cursor.fetchone()[0]
+                conn = self._reader()
+                cursor = conn.cursor()
+                cursor.execute("SELECT COUNT(*) FROM trade_results")
+                return cursor.fetchone()[0]
             except Exception:
                 return 0
 
@@ -727,6 +1111,7 @@ if __name__ == '__main__':
         )
     
     # 통계 조회
+    store.flush()
     print("\n2. 전체 통계:")
     stats = store.get_stats()
     for key, value in stats.items():
@@ -737,13 +1122,12 @@ if __name__ == '__main__':
     
     # 오늘 통계
     print("\n3. 오늘 통계:")
-    today_stats = store.get_today_stats()
+    today_stats = store.get_today_counts()
     for key, value in today_stats.items():
-        if key != 'results':
-            if isinstance(value, float):
-                print(f"   {key}: {value:.2f}")
-            else:
-                print(f"   {key}: {value}")
+        if isinstance(value, float):
+            print(f"   {key}: {value:.2f}")
+        else:
+            print(f"   {key}: {value}")
     
     # 종목별 통계
     print("\n4. 종목별 통계 (005930):")
@@ -766,6 +1150,7 @@ if __name__ == '__main__':
     
     # 정리
     print("\n7. 테스트 DB 삭제...")
+    store.close()
     test_db.unlink(missing_ok=True)
     
     print("\n" + "=" * 60)
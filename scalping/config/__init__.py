@@ -15,6 +15,7 @@ from scalping.config.config_loader import (
     ConfigLoader,
     get_config_loader,
     get_config,
+    get_config_view,
     DEFAULT_CONFIG,
     HOT_RELOAD_ALLOWED,
     HOT_RELOAD_BLOCKED,
@@ -24,6 +25,7 @@ __all__ = [
     'ConfigLoader',
     'get_config_loader',
     'get_config',
+    'get_config_view',
     'DEFAULT_CONFIG',
     'HOT_RELOAD_ALLOWED',
     'HOT_RELOAD_BLOCKED',
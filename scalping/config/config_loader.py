@@ -31,19 +31,115 @@ SSOT (Single Source of Truth) 설정 관리
 import os
 import yaml
 import json
+import hashlib
 import time
 import shutil
 import logging
 import threading
+import functools
 from pathlib import Path
+from types import MappingProxyType
 from typing import Dict, List, Optional, Any, Callable
 from datetime import datetime
-from dataclasses import dataclass
+from dataclasses import dataclass, field as dataclass_field
+from collections import OrderedDict, deque
 from copy import deepcopy
 
+# 🆕 파일 감시 (선택적 - 없으면 주기 폴링)
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+    WATCHDOG_AVAILABLE = False
+
+# 🆕 설정 지문용 직렬화/해시 (선택적 - 없으면 표준 json / blake2b)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
 # 로거
 logger = logging.getLogger('ScalpingBot.ConfigLoader')
 
+# 🆕 YAML C 확장 (libyaml) 로더/덤퍼 - 없으면 순수 파이썬 버전으로 폴백
+try:
+    from yaml import CSafeLoader as YamlLoader, CSafeDumper as YamlDumper
+    YAML_C_AVAILABLE = True
+except ImportError:
+    from yaml import SafeLoader as YamlLoader, SafeDumper as YamlDumper
+    YAML_C_AVAILABLE = False
+    logger.warning("libyaml 미설치 - 순수 파이썬 YAML 파서 사용 (설정 로드가 느림)")
+
+# 🆕 파일 변경 이벤트 디바운스 (초) - 에디터 저장 시 연속 이벤트 병합
+HOT_RELOAD_DEBOUNCE = 0.1
+
+# 🆕 스키마 검증 결과 캐시 크기 (검증 대상 값 조합 기준 LRU)
+VALIDATION_CACHE_SIZE = 16
+
+
+# =============================================================================
+# 🆕 공유 파일 감시자
+# =============================================================================
+
+# 모든 ConfigLoader 가 Observer 하나를 공유 (inotify 인스턴스 한도 소진 방지)
+# 같은 디렉토리는 watch 하나에 핸들러만 추가, {watch: 등록 핸들러 수}
+_shared_observer = None
+_shared_watches: Dict[Any, int] = {}
+_shared_observer_lock = threading.Lock()
+
+
+def _watch_directory(handler, directory: str):
+    """🆕 공유 Observer 에 디렉토리 감시 핸들러 등록 (Observer 는 첫 등록 시 시작)"""
+    global _shared_observer
+    
+    with _shared_observer_lock:
+        if _shared_observer is None:
+            observer = Observer()
+            observer.daemon = True
+            observer.start()
+            _shared_observer = observer
+        
+        watch = _shared_observer.schedule(handler, directory, recursive=False)
+        _shared_watches[watch] = _shared_watches.get(watch, 0) + 1
+        return watch
+
+
+def _unwatch_directory(handler, watch):
+    """🆕 감시 핸들러 해제 (디렉토리의 마지막 핸들러면 watch 제거, 전부 없으면 Observer 종료)"""
+    global _shared_observer
+    
+    with _shared_observer_lock:
+        observer = _shared_observer
+        if observer is None or watch not in _shared_watches:
+            return
+        
+        _shared_watches[watch] -= 1
+        if _shared_watches[watch] > 0:
+            observer.remove_handler_for_watch(handler, watch)
+            return
+        
+        del _shared_watches[watch]
+        observer.unschedule(watch)
+        
+        if _shared_watches:
+            return
+        
+        observer.stop()
+        _shared_observer = None
+    
+    # 락 밖에서 종료 대기 (다른 로더의 새 등록을 막지 않음)
+    observer.join(timeout=5)
+
 
 # =============================================================================
 # 기본 설정값
@@ -159,12 +255,16 @@ HOT_RELOAD_BLOCKED = [
     'broker.environment',
 ]
 
+# 🆕 금지 규칙 사전 분리 (정확 일치 / 접두사 일치)
+_BLOCKED_EXACT = frozenset(b for b in HOT_RELOAD_BLOCKED if not b.endswith('.*'))
+_BLOCKED_PREFIXES = tuple(b[:-2] for b in HOT_RELOAD_BLOCKED if b.endswith('.*'))
+
 
 # =============================================================================
 # 스키마 정의
 # =============================================================================
 
-@dataclass
+@dataclass(slots=True, frozen=True)  # 🆕 __dict__ 제거 + 불변 (해시 가능)
 class SchemaField:
     """설정 필드 스키마"""
     path: str
@@ -173,7 +273,14 @@ class SchemaField:
     max_value: Any = None
     required: bool = False
     default: Any = None
-    choices: List[Any] = None
+    choices: tuple = None  # 🆕 리스트로 넘겨도 튜플로 고정
+    keys: tuple = dataclass_field(init=False, repr=False, compare=False)  # 🆕 path 분할 결과
+    
+    def __post_init__(self):
+        # 🆕 검증마다 path.split('.') 하지 않도록 미리 분할 (frozen이므로 object.__setattr__)
+        object.__setattr__(self, 'keys', tuple(self.path.split('.')))
+        if self.choices is not None:
+            object.__setattr__(self, 'choices', tuple(self.choices))
 
 
 # 스키마 검증 규칙
@@ -194,6 +301,88 @@ SCHEMA = [
 ]
 
 
+def _compile_field(field: SchemaField) -> Callable[[Any], tuple]:
+    """
+    🆕 SchemaField → 해당 필드에 필요한 검사만 담은 검증 함수 (값 → 오류 메시지 튜플)
+    
+    범위/선택지 유무 분기를 검증 시점이 아니라 컴파일 시점에 한 번만 판단합니다.
+    선택지는 frozenset 으로 조회합니다.
+    """
+    path = field.path
+    field_type = field.type
+    missing = (f"필수 항목 누락: {path}",) if field.required else ()
+    wrong_type = (f"타입 오류: {path} (기대: {field_type.__name__})",)
+    
+    value_checks = []
+    
+    if field.min_value is not None:
+        min_value = field.min_value
+        value_checks.append(
+            lambda v: f"최소값 미달: {path} ({v} < {min_value})" if v < min_value else None
+        )
+    
+    if field.max_value is not None:
+        max_value = field.max_value
+        value_checks.append(
+            lambda v: f"최대값 초과: {path} ({v} > {max_value})" if v > max_value else None
+        )
+    
+    if field.choices:
+        choices = frozenset(field.choices)
+        shown = list(field.choices)
+        value_checks.append(
+            lambda v: f"잘못된 값: {path} ({v} not in {shown})" if v not in choices else None
+        )
+    
+    def check(value) -> tuple:
+        if value is None:
+            return missing
+        if not isinstance(value, field_type):
+            return wrong_type
+        if not value_checks:
+            return ()
+        return tuple(err for err in (c(value) for c in value_checks) if err)
+    
+    return check
+
+
+def _fingerprint(data: Any) -> str:
+    """
+    🆕 설정 지문 (키 정렬 정규 직렬화 → 64비트 해시 16진수)
+    
+    str(dict) 해시와 달리 키 순서/실행마다 달라지지 않아 이력 비교에 쓸 수 있습니다.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            raw = orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            raw = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+    else:
+        raw = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+    
+    return _hash_bytes(raw)
+
+
+def _hash_bytes(raw: bytes) -> str:
+    """🆕 바이트 64비트 해시 16진수 (xxh3_64, 없으면 blake2b)"""
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64(raw).hexdigest()
+    return hashlib.blake2b(raw, digest_size=8).hexdigest()
+
+
+def _freeze(value: Any) -> Any:
+    """🆕 읽기 전용 사본 (dict → MappingProxyType, list → tuple, 하위까지)"""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+# 🆕 컴파일된 스키마 ((키 튜플, 검증 함수), ...) - SCHEMA 순서, 모듈 로드 시 1회 생성
+_COMPILED_SCHEMA = tuple((field.keys, _compile_field(field)) for field in SCHEMA)
+
+
 # =============================================================================
 # 설정 로더 클래스
 # =============================================================================
@@ -225,14 +414,21 @@ class ConfigLoader:
         
         # 현재 설정
         self._config: Dict = {}
+        # 🆕 설정 버전 (변경 시 증가) + 읽기 전용 스냅샷 (버전, 뷰) - 변경 전까지 재사용
+        self._config_version = 0
+        self._snapshot: tuple = (-1, None)
+        self._fingerprint: tuple = (-1, None)  # 🆕 (버전, 설정 지문)
         self._secrets: Dict = {}
-        self._last_mtime: float = 0
+        self._last_mtime: int = 0  # 🆕 st_mtime_ns (정수 나노초, float 비교 오차 없음)
+        self._last_content_hash: Optional[str] = None  # 🆕 마지막으로 읽거나 쓴 파일 내용 해시
         
         # 핫리로드
         self._hot_reload_thread: Optional[threading.Thread] = None
         self._hot_reload_running = False
         self._hot_reload_callback: Optional[Callable] = None
         self._hot_reload_interval = 5  # 초
+        self._hot_reload_watch = None  # 🆕 공유 Observer 등록 정보 (핸들러, watch)
+        self._hot_reload_timer: Optional[threading.Timer] = None
         
         # 대기 중인 변경 (다음날 적용)
         self._pending_changes: Dict = {}
@@ -240,6 +436,9 @@ class ConfigLoader:
         # 변경 이력
         self._change_history: List[Dict] = []
         
+        # 🆕 스키마 검증 결과 캐시 {검증 대상 값 튜플: 오류 목록} (LRU)
+        self._validation_cache: 'OrderedDict[tuple, List[str]]' = OrderedDict()
+        
         # 락
         self._lock = threading.RLock()
         
@@ -272,12 +471,14 @@ class ConfigLoader:
                 else:
                     logger.error(f"설정 파일 없음: {self.config_path}")
                     self._config = deepcopy(DEFAULT_CONFIG)
+                    self._config_version += 1
                     return self._config
             
             try:
-                # YAML 로드
-                with open(self.config_path, 'r', encoding='utf-8') as f:
-                    loaded = yaml.safe_load(f) or {}
+                # YAML 로드 (🆕 바이트로 읽어 내용 해시 보관 → 핫리로드 시 무변경 판별)
+                raw = self.config_path.read_bytes()
+                self._last_content_hash = _hash_bytes(raw)
+                loaded = yaml.load(raw, Loader=YamlLoader) or {}
                 
                 # 기본값과 병합
                 self._config = self._merge_with_defaults(loaded)
@@ -289,7 +490,7 @@ class ConfigLoader:
                         logger.warning(f"설정 검증 오류: {err}")
                 
                 # mtime 저장
-                self._last_mtime = self.config_path.stat().st_mtime
+                self._last_mtime = self.config_path.stat().st_mtime_ns
                 
                 logger.info(f"설정 로드 완료: {self.config_path}")
                 
@@ -301,6 +502,7 @@ class ConfigLoader:
                 logger.error(f"설정 로드 오류: {e}")
                 self._config = deepcopy(DEFAULT_CONFIG)
             
+            self._config_version += 1
             return deepcopy(self._config)
     
     def load_secrets(self) -> Dict:
@@ -319,7 +521,7 @@ class ConfigLoader:
         
         try:
             with open(self.secrets_path, 'r', encoding='utf-8') as f:
-                self._secrets = yaml.safe_load(f) or {}
+                self._secrets = yaml.load(f, Loader=YamlLoader) or {}
             
             logger.info("비밀 설정 로드 완료")
             return deepcopy(self._secrets)
@@ -333,24 +535,37 @@ class ConfigLoader:
         self.config_path.parent.mkdir(parents=True, exist_ok=True)
         
         with open(self.config_path, 'w', encoding='utf-8') as f:
-            yaml.dump(DEFAULT_CONFIG, f, default_flow_style=False, allow_unicode=True)
+            yaml.dump(DEFAULT_CONFIG, f, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True)
         
         logger.info(f"기본 설정 파일 생성: {self.config_path}")
     
     def _merge_with_defaults(self, loaded: Dict) -> Dict:
         """기본값과 병합"""
-        return self._deep_merge(deepcopy(DEFAULT_CONFIG), loaded)
+        # 🆕 _deep_merge 가 base 의 컨테이너를 새로 만들므로 DEFAULT_CONFIG 를 미리 복사하지 않음
+        return self._deep_merge(DEFAULT_CONFIG, loaded)
     
     def _deep_merge(self, base: Dict, override: Dict) -> Dict:
-        """딥 머지"""
-        result = deepcopy(base)
+        """
+        딥 머지
         
-        for key, value in override.items():
-            if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-                result[key] = self._deep_merge(result[key], value)
+        🆕 deepcopy 없이 dict/list 컨테이너만 새로 만들고,
+        불변 값(str/int/float/bool/None)은 참조를 공유합니다.
+        """
+        result = {}
+        
+        for key, value in base.items():
+            if isinstance(value, dict):
+                sub = override.get(key)
+                result[key] = self._deep_merge(value, sub if isinstance(sub, dict) else {})
+            elif isinstance(value, list):
+                result[key] = list(value)
             else:
                 result[key] = value
         
+        for key, value in override.items():
+            if not (isinstance(value, dict) and isinstance(base.get(key), dict)):
+                result[key] = value
+        
         return result
     
     # =========================================================================
@@ -358,39 +573,42 @@ class ConfigLoader:
     # =========================================================================
     
     def _validate_schema(self, config: Dict) -> List[str]:
-        """스키마 검증"""
-        errors = []
+        """
+        스키마 검증
         
-        for field in SCHEMA:
-            value = self._get_nested(config, field.path)
-            
-            # 필수값 체크
-            if value is None:
-                if field.required:
-                    errors.append(f"필수 항목 누락: {field.path}")
-                continue
-            
-            # 타입 체크
-            if not isinstance(value, field.type):
-                errors.append(f"타입 오류: {field.path} (기대: {field.type.__name__})")
-                continue
-            
-            # 범위 체크
-            if field.min_value is not None and value < field.min_value:
-                errors.append(f"최소값 미달: {field.path} ({value} < {field.min_value})")
-            
-            if field.max_value is not None and value > field.max_value:
-                errors.append(f"최대값 초과: {field.path} ({value} > {field.max_value})")
-            
-            # 선택지 체크
-            if field.choices and value not in field.choices:
-                errors.append(f"잘못된 값: {field.path} ({value} not in {field.choices})")
+        🆕 결과는 스키마 항목 값 조합을 키로 캐시합니다 (검증은 이 값들에만 의존,
+        리스트 등 해시 불가 값이 있으면 캐시하지 않음).
+        1 / 1.0 / True 는 같은 키가 되므로 타입도 키에 포함합니다.
+        """
+        values = tuple(self._get_nested(config, keys) for keys, _ in _COMPILED_SCHEMA)
+        key = (values, tuple(map(type, values)))
+        
+        try:
+            cached = self._validation_cache.get(key)
+        except TypeError:
+            return self._check_schema(values)
         
+        if cached is None:
+            cached = self._check_schema(values)
+            self._validation_cache[key] = cached
+            if len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+                self._validation_cache.popitem(last=False)
+        else:
+            self._validation_cache.move_to_end(key)
+        
+        return list(cached)
+    
+    @staticmethod
+    def _check_schema(values: tuple) -> List[str]:
+        """🆕 스키마 항목 값(SCHEMA 순서) 검증 → 오류 목록 (컴파일된 검증 함수 사용)"""
+        errors = []
+        for (_, check), value in zip(_COMPILED_SCHEMA, values):
+            errors.extend(check(value))
         return errors
     
-    def _get_nested(self, d: Dict, path: str) -> Any:
-        """중첩 딕셔너리 값 가져오기"""
-        keys = path.split('.')
+    def _get_nested(self, d: Dict, path) -> Any:
+        """중첩 딕셔너리 값 가져오기 (🆕 path 는 'a.b' 문자열 또는 키 튜플)"""
+        keys = path.split('.') if isinstance(path, str) else path
         value = d
         
         for key in keys:
@@ -440,22 +658,17 @@ class ConfigLoader:
                 return False
             
             try:
-                # 1. 임시 파일에 저장
-                tmp_path = self.config_path.with_suffix('.yaml.tmp')
-                with open(tmp_path, 'w', encoding='utf-8') as f:
-                    yaml.dump(config, f, default_flow_style=False, allow_unicode=True)
-                
-                # 2. 백업 생성
-                if self.config_path.exists():
-                    backup_path = self.config_path.with_suffix('.yaml.bak')
-                    shutil.copy2(self.config_path, backup_path)
-                
-                # 3. 원자적 교체
-                tmp_path.replace(self.config_path)
+                # 1~3. 파일 기록 (임시 파일 → 백업 → 원자적 교체)
+                text = yaml.dump(config, Dumper=YamlDumper, default_flow_style=False, allow_unicode=True)
+                self._write_config_file(text)
                 
-                # 4. 설정 업데이트
+                # 4. 설정 업데이트 (🆕 호출자 딕셔너리와 분리 → 이후 외부 수정이 스냅샷/지문을 어긋나게 하지 않음)
+                if config is not self._config:
+                    config = self._deep_merge(config, {})  # 컨테이너만 복사
                 self._config = config
-                self._last_mtime = self.config_path.stat().st_mtime
+                self._config_version += 1
+                self._last_mtime = self.config_path.stat().st_mtime_ns
+                self._last_content_hash = _hash_bytes(text.encode('utf-8'))
                 
                 # 5. 변경 이력 기록
                 self._record_change("save")
@@ -467,6 +680,41 @@ class ConfigLoader:
                 logger.error(f"설정 저장 오류: {e}")
                 return False
     
+    def _write_config_file(self, text: str):
+        """
+        🆕 설정 파일 기록
+        
+        - 파일이 없으면 O_EXCL 로 바로 생성 (교체할 기존 파일이 없으므로 임시 파일 생략)
+        - 있으면 임시 파일에 쓰고, 기존 파일을 .bak 으로 하드링크한 뒤 원자적 교체
+          (교체 후 .bak 이 이전 내용을 단독 소유 → 데이터 복사 없음, 링크 불가 시 복사)
+        
+        줄바꿈을 고정해 쓴 내용 해시가 파일과 일치합니다.
+        """
+        try:
+            fd = os.open(self.config_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            pass
+        else:
+            with os.fdopen(fd, 'w', encoding='utf-8', newline='\n') as f:
+                f.write(text)
+            return
+        
+        # 1. 임시 파일에 저장
+        tmp_path = self.config_path.with_suffix('.yaml.tmp')
+        with open(tmp_path, 'w', encoding='utf-8', newline='\n') as f:
+            f.write(text)
+        
+        # 2. 백업 생성 (하드링크)
+        backup_path = self.config_path.with_suffix('.yaml.bak')
+        try:
+            backup_path.unlink(missing_ok=True)
+            os.link(self.config_path, backup_path)
+        except OSError:
+            shutil.copy2(self.config_path, backup_path)
+        
+        # 3. 원자적 교체
+        tmp_path.replace(self.config_path)
+    
     def update(self, path: str, value: Any) -> bool:
         """
         개별 설정 업데이트
@@ -487,6 +735,7 @@ class ConfigLoader:
             
             # 설정 업데이트
             self._set_nested(self._config, path, value)
+            self._config_version += 1
             
             # 저장
             return self.save()
@@ -505,6 +754,7 @@ class ConfigLoader:
             count = 0
             for path, value in self._pending_changes.items():
                 self._set_nested(self._config, path, value)
+                self._config_version += 1
                 count += 1
                 logger.info(f"대기 변경 적용: {path} = {value}")
             
@@ -513,23 +763,27 @@ class ConfigLoader:
             
             return count
     
-    def _is_hot_reload_blocked(self, path: str) -> bool:
-        """핫리로드 금지 항목인지 확인"""
-        for blocked in HOT_RELOAD_BLOCKED:
-            if blocked.endswith('.*'):
-                prefix = blocked[:-2]
-                if path.startswith(prefix):
-                    return True
-            elif path == blocked:
-                return True
-        return False
+    @staticmethod
+    @functools.lru_cache(maxsize=512)
+    def _is_hot_reload_blocked(path: str) -> bool:
+        """핫리로드 금지 항목인지 확인 (🆕 규칙이 고정이므로 경로별 결과 캐시)"""
+        return path in _BLOCKED_EXACT or path.startswith(_BLOCKED_PREFIXES)
+    
+    def _config_fingerprint(self) -> str:
+        """🆕 현재 설정 지문 (버전이 바뀌었을 때만 다시 계산)"""
+        version, fp = self._fingerprint
+        if fp is None or version != self._config_version:
+            version = self._config_version
+            fp = _fingerprint(self._config)
+            self._fingerprint = (version, fp)
+        return fp
     
     def _record_change(self, action: str):
         """변경 이력 기록"""
         self._change_history.append({
             'timestamp': datetime.now().isoformat(),
             'action': action,
-            'config_hash': hash(str(self._config)),
+            'config_hash': self._config_fingerprint(),
         })
         
         # 최대 100개 유지
@@ -548,9 +802,12 @@ class ConfigLoader:
         """
         핫리로드 시작
         
+        🆕 watchdog 설치 시 파일 변경 이벤트로 즉시 리로드,
+        미설치 시 interval 주기 폴링으로 폴백합니다.
+        
         Args:
             callback: 변경 감지 시 콜백
-            interval: 체크 간격 (초)
+            interval: 체크 간격 (초, 폴링 모드)
         """
         if self._hot_reload_running:
             logger.warning("핫리로드 이미 실행 중")
@@ -560,6 +817,15 @@ class ConfigLoader:
         self._hot_reload_interval = interval
         self._hot_reload_running = True
         
+        if WATCHDOG_AVAILABLE:
+            try:
+                self._start_file_watch()
+                logger.info("핫리로드 활성화 (파일 감시: watchdog)")
+                return
+            except Exception as e:
+                logger.warning(f"파일 감시 시작 실패, 폴링으로 전환: {e}")
+                self._hot_reload_watch = None
+        
         self._hot_reload_thread = threading.Thread(
             target=self._hot_reload_loop,
             name="ConfigHotReload",
@@ -573,76 +839,147 @@ class ConfigLoader:
         """핫리로드 중지"""
         self._hot_reload_running = False
         
+        if self._hot_reload_timer:
+            self._hot_reload_timer.cancel()
+            self._hot_reload_timer = None
+        
+        if self._hot_reload_watch:
+            _unwatch_directory(*self._hot_reload_watch)
+            self._hot_reload_watch = None
+        
         if self._hot_reload_thread and self._hot_reload_thread.is_alive():
             self._hot_reload_thread.join(timeout=5)
         
         logger.info("핫리로드 중지")
     
+    def _start_file_watch(self):
+        """🆕 설정 파일 디렉토리 감시 등록 (🆕 모듈 공유 Observer 사용)"""
+        loader = self
+        target = str(self.config_path.resolve())
+        
+        class _ConfigFileHandler(FileSystemEventHandler):
+            def on_any_event(self, event):
+                # 원자적 저장(임시파일 → replace)은 moved 이벤트로 들어옴
+                paths = (getattr(event, 'src_path', ''), getattr(event, 'dest_path', ''))
+                if any(p and os.path.abspath(p) == target for p in paths):
+                    loader._schedule_reload()
+        
+        handler = _ConfigFileHandler()
+        watch = _watch_directory(handler, str(self.config_path.resolve().parent))
+        self._hot_reload_watch = (handler, watch)
+    
+    def _schedule_reload(self):
+        """🆕 디바운스 후 리로드 (연속 이벤트는 마지막 1회만 처리)"""
+        if not self._hot_reload_running:
+            return
+        
+        if self._hot_reload_timer:
+            self._hot_reload_timer.cancel()
+        
+        self._hot_reload_timer = threading.Timer(HOT_RELOAD_DEBOUNCE, self._check_and_reload)
+        self._hot_reload_timer.daemon = True
+        self._hot_reload_timer.start()
+    
     def _hot_reload_loop(self):
-        """핫리로드 루프"""
+        """핫리로드 루프 (폴링 모드)"""
         while self._hot_reload_running:
+            self._check_and_reload()
+            time.sleep(self._hot_reload_interval)
+    
+    def _check_and_reload(self):
+        """파일 변경 확인 후 리로드 적용"""
+        try:
+            # 파일 변경 체크 (🆕 exists + stat 대신 stat 1회)
             try:
-                # 파일 변경 체크
-                if self.config_path.exists():
-                    current_mtime = self.config_path.stat().st_mtime
-                    
-                    if current_mtime > self._last_mtime:
-                        logger.info("설정 파일 변경 감지")
-                        
-                        # 리로드
-                        old_config = deepcopy(self._config)
-                        new_config = self.load(force_reload=True)
-                        
-                        # 변경된 항목 확인
-                        changes = self._get_config_diff(old_config, new_config)
-                        
-                        # 핫리로드 가능 항목만 적용
-                        applied = []
-                        pending = []
-                        
-                        for path, (old_val, new_val) in changes.items():
-                            if self._is_hot_reload_blocked(path):
-                                pending.append(path)
-                                # 원래 값으로 복원
-                                self._set_nested(self._config, path, old_val)
-                                self._pending_changes[path] = new_val
-                            else:
-                                applied.append(path)
-                        
-                        if applied:
-                            logger.info(f"핫리로드 적용: {applied}")
-                        
-                        if pending:
-                            logger.warning(f"다음날 적용 대기: {pending}")
-                        
-                        # 콜백 호출
-                        if self._hot_reload_callback and applied:
-                            try:
-                                self._hot_reload_callback(self._config)
-                            except Exception as e:
-                                logger.error(f"핫리로드 콜백 오류: {e}")
-                
-                time.sleep(self._hot_reload_interval)
+                current_mtime = os.stat(self.config_path).st_mtime_ns
+            except FileNotFoundError:
+                return
             
-            except Exception as e:
-                logger.error(f"핫리로드 루프 오류: {e}")
-                time.sleep(self._hot_reload_interval)
+            if current_mtime <= self._last_mtime:
+                return
+            
+            # 🆕 내용이 그대로면 (touch, 같은 내용 저장) 파싱/비교 없이 mtime 만 갱신
+            content_hash = _hash_bytes(self.config_path.read_bytes())
+            if content_hash == self._last_content_hash:
+                self._last_mtime = current_mtime
+                return
+            
+            logger.info("설정 파일 변경 감지")
+            
+            # 리로드 (🆕 load 는 _config 를 새 객체로 교체하므로 이전 설정은 참조만 보관)
+            old_config = self._config
+            old_fp = self._config_fingerprint()
+            new_config = self.load(force_reload=True)
+            
+            # 🆕 지문이 같으면 내용 변화 없음 → 차이 비교/콜백 생략
+            if self._config_fingerprint() == old_fp:
+                logger.debug("설정 내용 변화 없음 (mtime 만 변경)")
+                return
+            
+            # 변경된 항목 확인
+            changes = self._get_config_diff(old_config, new_config)
+            
+            # 핫리로드 가능 항목만 적용
+            applied = []
+            pending = []
+            
+            for path, (old_val, new_val) in changes.items():
+                if self._is_hot_reload_blocked(path):
+                    pending.append(path)
+                    # 원래 값으로 복원
+                    self._set_nested(self._config, path, old_val)
+                    self._config_version += 1
+                    self._pending_changes[path] = new_val
+                else:
+                    applied.append(path)
+            
+            if applied:
+                logger.info(f"핫리로드 적용: {applied}")
+            
+            if pending:
+                logger.warning(f"다음날 적용 대기: {pending}")
+            
+            # 콜백 호출
+            if self._hot_reload_callback and applied:
+                try:
+                    self._hot_reload_callback(self._config)
+                except Exception as e:
+                    logger.error(f"핫리로드 콜백 오류: {e}")
+        
+        except Exception as e:
+            logger.error(f"핫리로드 오류: {e}")
     
     def _get_config_diff(self, old: Dict, new: Dict, prefix: str = "") -> Dict:
-        """설정 차이 추출"""
-        diff = {}
+        """
+        설정 차이 추출
         
-        all_keys = set(old.keys()) | set(new.keys())
+        🆕 재귀 대신 작업 큐로 순회하고, 같은(==) 하위 트리는 건너뜁니다.
+        """
+        diff = {}
+        pending = deque([(prefix, old, new)])
         
-        for key in all_keys:
-            path = f"{prefix}.{key}" if prefix else key
-            old_val = old.get(key)
-            new_val = new.get(key)
+        while pending:
+            base, old_node, new_node = pending.popleft()
+            if old_node is new_node or old_node == new_node:
+                continue
             
-            if isinstance(old_val, dict) and isinstance(new_val, dict):
-                diff.update(self._get_config_diff(old_val, new_val, path))
-            elif old_val != new_val:
-                diff[path] = (old_val, new_val)
+            # 한쪽에만 있는 키
+            for key in old_node.keys() ^ new_node.keys():
+                old_val = old_node.get(key)
+                new_val = new_node.get(key)
+                if old_val != new_val:
+                    diff[f"{base}.{key}" if base else key] = (old_val, new_val)
+            
+            # 양쪽에 있는 키
+            for key in old_node.keys() & new_node.keys():
+                old_val = old_node[key]
+                new_val = new_node[key]
+                path = f"{base}.{key}" if base else key
+                
+                if isinstance(old_val, dict) and isinstance(new_val, dict):
+                    pending.append((path, old_val, new_val))
+                elif old_val != new_val:
+                    diff[path] = (old_val, new_val)
         
         return diff
     
@@ -655,9 +992,30 @@ class ConfigLoader:
         return self._get_nested(self._config, path) or default
     
     def get_all(self) -> Dict:
-        """전체 설정"""
+        """전체 설정 (수정 가능한 복사본)"""
         return deepcopy(self._config)
     
+    def snapshot(self) -> MappingProxyType:
+        """
+        🆕 전체 설정 읽기 전용 뷰 (복사 없음)
+        
+        설정이 바뀔 때만 새로 만들고 그 전까지 같은 객체를 반환합니다.
+        조회만 하는 곳에서는 load()/get_all() 대신 사용하세요.
+        """
+        version, view = self._snapshot
+        if view is not None and version == self._config_version:
+            return view
+        
+        with self._lock:
+            version = self._config_version
+            view = _freeze(self._config)
+            self._snapshot = (version, view)
+            return view
+    
+    def mutable_copy(self) -> Dict:
+        """🆕 전체 설정 수정 가능한 복사본 (get_all 과 동일)"""
+        return self.get_all()
+    
     def get_pending_changes(self) -> Dict:
         """대기 중인 변경"""
         return deepcopy(self._pending_changes)
@@ -672,26 +1030,44 @@ class ConfigLoader:
 # =============================================================================
 
 _loader_instance: Optional[ConfigLoader] = None
+_loader_lock = threading.Lock()  # 🆕 최초 생성 시에만 사용
 
 
 def get_config_loader(
     config_path: str = "config/config.yaml",
     secrets_path: str = "config/secrets.yaml",
 ) -> ConfigLoader:
-    """전역 ConfigLoader 인스턴스"""
+    """전역 ConfigLoader 인스턴스 (🆕 생성 후에는 잠금 없이 반환)"""
     global _loader_instance
     
-    if _loader_instance is None:
-        _loader_instance = ConfigLoader(config_path, secrets_path)
+    loader = _loader_instance
+    if loader is not None:
+        return loader
     
-    return _loader_instance
+    with _loader_lock:
+        if _loader_instance is None:
+            _loader_instance = ConfigLoader(config_path, secrets_path)
+        return _loader_instance
 
 
 def get_config() -> Dict:
-    """현재 설정 가져오기"""
+    """현재 설정 가져오기 (수정 가능한 복사본)"""
     return get_config_loader().load()
 
 
+def get_config_view() -> MappingProxyType:
+    """
+    🆕 현재 설정 읽기 전용 뷰 (복사/잠금 없음)
+    
+    조회만 하는 곳에서 get_config() 대신 사용하세요.
+    수정, deepcopy, json/yaml 직렬화가 필요하면 get_config()를 사용하세요.
+    """
+    loader = get_config_loader()
+    if not loader._config:
+        loader.load()
+    return loader.snapshot()
+
+
 # =============================================================================
 # 테스트 코드
 # =============================================================================
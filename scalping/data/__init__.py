@@ -21,10 +21,6 @@ from scalping.data.market_monitor import (
     MarketMode,
 )
 
-from scalping.data.ohlcv_loader import (
-    OHLCVLoader,
-)
-
 from scalping.data.universe_filter import (
     UniverseFilter,
     StockInfo,
@@ -49,6 +45,16 @@ from scalping.data.stock_mapper import (
     name_to_code,
 )
 
+
+def __getattr__(name: str):
+    """🆕 OHLCVLoader 지연 import (pandas 로드를 실제 사용 시점까지 미룸)"""
+    if name == 'OHLCVLoader':
+        from scalping.data.ohlcv_loader import OHLCVLoader
+        globals()[name] = OHLCVLoader
+        return OHLCVLoader
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # market_monitor
     'MarketMonitor',
@@ -28,6 +28,7 @@ ScalpingBot v2.4 - OHLCV Loader (데이터 로더)
 ============================================================================
 """
 
+import re
 import time
 import logging
 import threading
@@ -62,6 +63,9 @@ NAVER_SISE_URL = "https://finance.naver.com/item/sise_day.naver"
 # User-Agent
 USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
 
+# 🆕 네이버 종목 페이지 현재가 추출 (모듈 로드 시 1회 컴파일)
+_NAVER_PRICE_RE = re.compile(r'<dd>현재가 <span>([0-9,]+)</span>')
+
 
 # =============================================================================
 # 캐시 엔트리
@@ -409,8 +413,7 @@ class OHLCVLoader:
             response = requests.get(url, headers=headers, timeout=5)
             
             if response.status_code == 200:
-                import re
-                match = re.search(r'<dd>현재가 <span>([0-9,]+)</span>', response.text)
+                match = _NAVER_PRICE_RE.search(response.text)
                 if match:
                     return float(match.group(1).replace(',', ''))
         except:
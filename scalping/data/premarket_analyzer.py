@@ -67,6 +67,11 @@ EXCLUDE_PATTERNS = [
     '우', '우B', '1우', '2우', '3우', '우선주', '인버스', '레버리지'
 ]
 
+# 🆕 정규식 (모듈 로드 시 1회 컴파일)
+_HTML_TAG_RE = re.compile(r'<[^>]+>')
+_JSON_BLOCK_RE = re.compile(r'```json\s*(.*?)\s*```', re.DOTALL)
+_CODE_BLOCK_RE = re.compile(r'```\s*(.*?)\s*```', re.DOTALL)
+
 
 # =============================================================================
 # 데이터 클래스
@@ -233,7 +238,7 @@ class NewsCollector:
     
     def _clean_html(self, text: str) -> str:
         """HTML 태그 제거"""
-        text = re.sub(r'<[^>]+>', '', text)
+        text = _HTML_TAG_RE.sub('', text)
         text = text.replace('&quot;', '"')
         text = text.replace('&amp;', '&')
         text = text.replace('&lt;', '<')
@@ -636,13 +641,13 @@ class PreMarketAnalyzer:
             
             # 1. ```json ... ``` 블록
             if not json_str:
-                json_match = re.search(r'```json\s*(.*?)\s*```', response, re.DOTALL)
+                json_match = _JSON_BLOCK_RE.search(response)
                 if json_match:
                     json_str = json_match.group(1)
             
             # 2. ``` ... ``` 블록 (json 명시 없음)
             if not json_str:
-                json_match = re.search(r'```\s*(.*?)\s*```', response, re.DOTALL)
+                json_match = _CODE_BLOCK_RE.search(response)
                 if json_match:
                     json_str = json_match.group(1)
             
@@ -35,10 +35,10 @@ import requests
 from typing import Dict, List, Optional, Any, Tuple, TYPE_CHECKING
 from datetime import datetime, date
 from dataclasses import dataclass
-import pandas as pd
 
 # 타입 힌트용 (순환 import 방지)
 if TYPE_CHECKING:
+    import pandas as pd
     from scalping.execution.broker import KISBroker
 
 # 로거 설정
@@ -543,8 +543,10 @@ class UniverseFilter:
                 return stock
         return None
     
-    def to_dataframe(self) -> pd.DataFrame:
+    def to_dataframe(self) -> 'pd.DataFrame':
         """DataFrame으로 변환"""
+        import pandas as pd  # 🆕 지연 import (엔진 기동 시 pandas 로드 회피)
+        
         if not self._cache:
             self.get_universe_with_info()
         
@@ -13,19 +13,34 @@ ScalpingBot v2.4 - Engine 모듈
 ============================================================================
 """
 
-from scalping.engine.trading_engine import TradingEngine
-
-from scalping.engine.state_machine import (
-    StateMachine,
-    State,
-    StateChange,
-)
-
-from scalping.engine.scheduler import (
-    TradingScheduler,
-    MarketPhase,
-    ScheduledTask,
-)
+import importlib
+
+# 🆕 지연 import (PEP 562)
+# python -m scalping.engine.scalp_engine 실행 시 패키지 __init__이 먼저 로드되므로,
+# 사용하지 않는 trading_engine(pandas 등)을 실제 접근 시점까지 미룹니다.
+_LAZY_IMPORTS = {
+    'TradingEngine': 'scalping.engine.trading_engine',
+    'StateMachine': 'scalping.engine.state_machine',
+    'State': 'scalping.engine.state_machine',
+    'StateChange': 'scalping.engine.state_machine',
+    'TradingScheduler': 'scalping.engine.scheduler',
+    'MarketPhase': 'scalping.engine.scheduler',
+    'ScheduledTask': 'scalping.engine.scheduler',
+}
+
+
+def __getattr__(name: str):
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # 이후 접근은 캐시 사용
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY_IMPORTS))
 
 __all__ = [
     # trading_engine
@@ -26,6 +26,7 @@ ScalpingBot v3.0 - Scalp Engine (스캘핑 전용 엔진)
 """
 
 import os
+import re
 import sys
 import time
 import signal
@@ -73,6 +74,14 @@ CANDLE_INTERVAL = 5           # 봉 간격 (분)
 SCAN_INTERVAL = 5             # 스캔 간격 (초)
 POSITION_CHECK_INTERVAL = 1   # 포지션 체크 간격 (초)
 
+# 🆕 PID 락 파일 (경로 문자열 미리 계산)
+PID_FILE = Path('logs') / 'scalping.pid'
+_PID_FILE = os.fspath(PID_FILE)
+
+# 🆕 AI 필터 응답 JSON 추출 정규식 (모듈 로드 시 1회 컴파일)
+_CODE_BLOCK_JSON_RE = re.compile(r'```(?:json)?\s*(\{.*?\})\s*```', re.DOTALL)
+_FLAT_JSON_RE = re.compile(r'\{[^{}]*\}')
+
 
 # =============================================================================
 # 종목별 분봉 트래커
@@ -194,6 +203,7 @@ class ScalpEngine:
         
         # 상태
         self._running = False
+        self._stop_event = threading.Event()  # 🆕 종료 신호 (대기 중 즉시 깨움)
         self._today_trades: List[Dict] = []
         self._stats = {
             'scans': 0,
@@ -574,12 +584,11 @@ class ScalpEngine:
             True: 락 획득 성공
             False: 이미 실행 중인 프로세스 존재
         """
-        pid_file = Path('logs') / 'scalping.pid'
-        pid_file.parent.mkdir(parents=True, exist_ok=True)
+        PID_FILE.parent.mkdir(parents=True, exist_ok=True)
         
-        if pid_file.exists():
+        if os.path.exists(_PID_FILE):
             try:
-                with open(pid_file, 'r') as f:
+                with open(_PID_FILE, 'r') as f:
                     old_pid = int(f.read().strip())
                 
                 # 프로세스 존재 확인
@@ -595,7 +604,7 @@ class ScalpEngine:
                 pass
         
         # 새 PID 기록
-        with open(pid_file, 'w') as f:
+        with open(_PID_FILE, 'w') as f:
             f.write(str(os.getpid()))
         
         logger.info(f"🔒 PID 락 획득: {os.getpid()}")
@@ -603,10 +612,9 @@ class ScalpEngine:
     
     def _release_pid_lock(self):
         """PID 락 해제"""
-        pid_file = Path('logs') / 'scalping.pid'
         try:
-            if pid_file.exists():
-                pid_file.unlink()
+            if os.path.exists(_PID_FILE):
+                os.unlink(_PID_FILE)
                 logger.debug("PID 락 해제")
         except Exception as e:
             logger.debug(f"PID 락 해제 실패: {e}")
@@ -687,6 +695,7 @@ class ScalpEngine:
         signal.signal(signal.SIGTERM, self._signal_handler)
         
         self._running = True
+        self._stop_event.clear()
         logger.info("\n🚀 ScalpEngine 시작!")
         
         try:
@@ -711,6 +720,7 @@ class ScalpEngine:
                     self._close_all_positions()
                     self._generate_daily_report()
                     self._running = False
+                    self._stop_event.set()
                 
                 else:
                     # 장 시작 전 대기
@@ -729,23 +739,27 @@ class ScalpEngine:
         """시그널 핸들러 (Ctrl+C)"""
         logger.info(f"\n⚠️ 종료 신호 수신 (signal={signum})")
         self._running = False
+        self._stop_event.set()
         # 즉시 종료 처리
         self._shutdown()
         import sys
         sys.exit(0)
     
-    def _interruptible_sleep(self, seconds: float, interval: float = 1.0):
+    def _interruptible_sleep(self, seconds: float):
         """
         인터럽트 가능한 sleep
         
+        🆕 1초 폴링 대신 종료 이벤트 대기 (종료 신호 시 즉시 복귀)
+        
         Args:
             seconds: 총 대기 시간
-            interval: 체크 간격 (기본 1초)
+        
+        Returns:
+            종료 신호 수신 여부
         """
-        elapsed = 0
-        while elapsed < seconds and self._running:
-            time.sleep(min(interval, seconds - elapsed))
-            elapsed += interval
+        if not self._running:
+            return True
+        return self._stop_event.wait(seconds)
     
     def _shutdown(self):
         """종료 처리 - 포지션 청산 + 상태 저장"""
@@ -883,7 +897,12 @@ class ScalpEngine:
         import asyncio
         
         async def run_analysis():
-            return await self.premarket_analyzer.run_full_analysis()
+            try:
+                return await self.premarket_analyzer.run_full_analysis()
+            finally:
+                # 🆕 이 루프에서 만든 AI 비동기 클라이언트는 루프 종료 전에 닫음
+                if self.ai_engine:
+                    await self.ai_engine.aclose_async_client()
         
         # 비동기 실행
         self.premarket_result = asyncio.run(run_analysis())
@@ -973,13 +992,13 @@ class ScalpEngine:
         
         if market_state.mode == MarketMode.EMERGENCY:
             logger.warning("🚨 비상 모드 - 신규 진입 금지")
-            time.sleep(SCAN_INTERVAL)
+            self._interruptible_sleep(SCAN_INTERVAL)
             return
         
         # 2. 킬스위치 체크
         if self.kill_switch.should_pause():
             logger.warning("⚠️ 킬스위치 발동 - 매매 일시 정지")
-            time.sleep(SCAN_INTERVAL)
+            self._interruptible_sleep(SCAN_INTERVAL)
             return
         
         # 3. 포지션 체크 (손절/익절)
@@ -992,7 +1011,7 @@ class ScalpEngine:
         # 루프 시간 조절
         elapsed = time.time() - loop_start
         sleep_time = max(0, SCAN_INTERVAL - elapsed)
-        time.sleep(sleep_time)
+        self._interruptible_sleep(sleep_time)
     
     def _check_universe_refresh(self):
         """장중 유니버스 갱신 (TV100)"""
@@ -1147,7 +1166,6 @@ avoid=true: 관리종목/급락/과열
 
         try:
             import json
-            import re
             response = self.ai_engine.generate(
                 prompt=prompt,
                 max_tokens=10000,  # 테스트: 충분히 늘려서 파싱 성공률 확인
@@ -1162,12 +1180,12 @@ avoid=true: 관리종목/급락/과열
             
             # 방법1: ```json 블록에서 추출
             if '```' in text:
-                match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', text, re.DOTALL)
+                match = _CODE_BLOCK_JSON_RE.search(text)
                 if match:
                     text = match.group(1)
             
             # 방법2: { } 사이만 추출
-            match = re.search(r'\{[^{}]*\}', text)
+            match = _FLAT_JSON_RE.search(text)
             if match:
                 text = match.group(0)
             
@@ -1321,16 +1339,10 @@ avoid=true: 관리종목/급락/과열
         if self.is_simulation_mode and self.simulation_tracker:
             active_positions = self.simulation_tracker.get_active_positions()
             if active_positions:
-                price_dict = {}
-                for pos in active_positions:
-                    try:
-                        price_info = self.broker.get_current_price(pos.stock_code)
-                        if price_info and isinstance(price_info, dict):
-                            price_dict[pos.stock_code] = price_info.get('price', 0)
-                        elif price_info and isinstance(price_info, (int, float)):
-                            price_dict[pos.stock_code] = price_info
-                    except:
-                        pass
+                # 🆕 현재가 일괄 조회 (N회 → 1회 요청)
+                price_dict = self.broker.get_current_prices(
+                    [pos.stock_code for pos in active_positions]
+                )
                 
                 if price_dict:
                     closed = self.simulation_tracker.update_prices(price_dict)
@@ -1758,6 +1770,7 @@ avoid=true: 관리종목/급락/과열
             
             # 일별 집계 업데이트
             store.update_daily_summary()
+            store.close()  # 🆕 임시 저장소 연결 정리
             
             logger.info(f"📚 학습 데이터 저장: {len(sell_trades)}건")
             
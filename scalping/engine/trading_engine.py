@@ -553,6 +553,10 @@ class TradingEngine:
         # 일일 마감 처리
         self._handle_daily_close()
         
+        # 🆕 학습 저장소 대기 기록 반영 + 연결 종료
+        if self.learning_store:
+            self.learning_store.close()
+        
         # 알림 전송
         if self.notifier:
             self.notifier.send_system_stop("정상 종료")
@@ -992,13 +996,16 @@ class TradingEngine:
                 break
             
             # BUY 결정이고 신뢰도 충족 시
-            if result['decision'] == 'BUY' and result['confidence'] >= self.min_ai_confidence:
+            if result.decision == 'BUY' and result.confidence >= self.min_ai_confidence:
                 self._execute_buy(result)
             else:
                 logger.debug(
-                    f"AI 결정 SKIP: {result['stock_code']} "
-                    f"({result['decision']}, 신뢰도: {result['confidence']:.2f})"
+                    f"AI 결정 SKIP: {result.stock_code} "
+                    f"({result.decision}, 신뢰도: {result.confidence:.2f})"
                 )
+            
+            # 🆕 처리 완료된 결과 객체는 풀에 반납
+            result.release()
     
     # =========================================================================
     # 매수/매도 실행
@@ -1006,7 +1013,7 @@ class TradingEngine:
     
     def _execute_buy(self, ai_result):
         """매수 실행"""
-        stock_code = ai_result['stock_code']
+        stock_code = ai_result.stock_code
         
         # 🆕 중복 주문 방지 Lock
         with self._order_lock:
@@ -1030,9 +1037,9 @@ class TradingEngine:
         # 가격 검증
         validation = self.price_validator.validate(
             stock_code=stock_code,
-            analysis_price=ai_result['original_price'],
+            analysis_price=ai_result.original_price,
             current_price=current_price,
-            analysis_time=datetime.fromtimestamp(ai_result['timestamp']),
+            analysis_time=datetime.fromtimestamp(ai_result.timestamp),
         )
         
         if not validation.is_valid:
@@ -1053,28 +1060,28 @@ class TradingEngine:
             self._stats['total_buys'] += 1
             
             # 🆕 CCI 추출
-            entry_cci = ai_result.get('indicators', {}).get('cci', 0)
+            entry_cci = ai_result.indicators.get('cci', 0)
             
             # 포지션 등록
             self.position_manager.add_position(
                 stock_code=stock_code,
-                stock_name=ai_result.get('stock_name') or stock_code,
+                stock_name=ai_result.stock_name or stock_code,
                 entry_price=current_price,
                 quantity=quantity,
-                score=ai_result.get('rule_score', 0),
-                ai_confidence=ai_result['confidence'],
+                score=ai_result.rule_score,
+                ai_confidence=ai_result.confidence,
                 entry_cci=entry_cci,  # 🆕
             )
             
             # 알림
             self.notifier.send_buy_signal(
                 stock_code=stock_code,
-                stock_name=ai_result.get('stock_name') or stock_code,
+                stock_name=ai_result.stock_name or stock_code,
                 price=current_price,
                 quantity=quantity,
-                score=ai_result.get('rule_score', 0),
-                ai_confidence=ai_result['confidence'],
-                grade=self._get_grade(ai_result.get('rule_score', 0)),
+                score=ai_result.rule_score,
+                ai_confidence=ai_result.confidence,
+                grade=self._get_grade(ai_result.rule_score),
             )
             
             # 매매 기록
@@ -1084,8 +1091,8 @@ class TradingEngine:
                 'side': 'BUY',
                 'price': current_price,
                 'quantity': quantity,
-                'score': ai_result.get('rule_score', 0),
-                'ai_confidence': ai_result['confidence'],
+                'score': ai_result.rule_score,
+                'ai_confidence': ai_result.confidence,
                 'entry_cci': entry_cci,  # 🆕
             })
             
@@ -37,6 +37,9 @@ import time
 import logging
 import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Optional, Any, Callable
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
@@ -76,6 +79,7 @@ TR_IDS = {
     'balance': 'TTTC8434R',       # 잔고 조회
     'pending': 'TTTC8001R',       # 미체결 조회
     'price': 'FHKST01010100',     # 현재가 조회
+    'multi_price': 'FHKST11300006',  # 🆕 멀티종목 현재가 조회 (실전 전용)
     'index': 'FHPUP02100000',     # 지수 조회
     'daily_ohlcv': 'FHKST01010400',  # 일봉 데이터
     
@@ -92,6 +96,36 @@ MAX_RETRIES = 3
 RETRY_DELAY = 1.0  # 초
 REQUEST_TIMEOUT = 10  # 초
 
+# 🆕 HTTP 커넥션 풀 크기 (병렬 시세 조회 대비)
+HTTP_POOL_SIZE = 32
+
+# 🆕 멀티종목 시세 조회 1회당 최대 종목 수
+MULTI_PRICE_MAX_CODES = 30
+
+# 🆕 한투 API 초당 호출 한도 (브로커 인스턴스 전체 공유, 병렬 조회 시에도 준수)
+KIS_TPS_LIMIT = 20           # 실전
+KIS_TPS_LIMIT_MOCK = 2       # 모의
+PRICE_FALLBACK_WORKERS = 16  # 종목별 시세 병렬 조회 스레드 수 (모의는 KIS_TPS_LIMIT_MOCK)
+
+
+class _RateLimiter:
+    """🆕 초당 호출 수 제한 (호출 간격을 균등하게 배분, 스레드 안전)"""
+    
+    def __init__(self, rate_per_sec: float):
+        self._interval = 1.0 / rate_per_sec
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self):
+        """다음 호출 슬롯까지 대기"""
+        with self._lock:
+            now = time.monotonic()
+            wait = self._next_time - now
+            self._next_time = max(now, self._next_time) + self._interval
+        
+        if wait > 0:
+            time.sleep(wait)
+
 
 # =============================================================================
 # 데이터 클래스
@@ -250,17 +284,26 @@ class KISBroker:
         self._token_expires: float = 0
         self._token_lock = threading.Lock()
         
+        # 🆕 HTTP 세션 (Keep-Alive 커넥션 재사용)
+        self._session = self._create_session()
+        
         # 웹소켓
         self._ws = None
         self._ws_approval_key: Optional[str] = None
         
-        # 통계
+        # 🆕 API 호출 속도 제한 (모의/실전 한도, 모든 스레드 공유)
+        self._rate_limiter = _RateLimiter(
+            KIS_TPS_LIMIT_MOCK if self.environment == 'V' else KIS_TPS_LIMIT
+        )
+        
+        # 통계 (🆕 병렬 조회 스레드에서도 증가 → 락으로 보호)
         self._stats = {
             'total_orders': 0,
             'success_orders': 0,
             'failed_orders': 0,
             'total_api_calls': 0,
         }
+        self._stats_lock = threading.Lock()
         
         # dry_run 모드용 가상 데이터
         self._mock_positions: Dict[str, Dict] = {}
@@ -271,6 +314,26 @@ class KISBroker:
         env_str = "모의투자" if self.environment == 'V' else "실전투자"
         logger.info(f"KIS 브로커 초기화 ({mode_str}, {env_str})")
     
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """
+        🆕 공유 HTTP 세션 생성
+        
+        매 요청마다 TCP/TLS 연결을 새로 맺지 않도록 커넥션 풀을 사용합니다.
+        연결 단계 실패만 어댑터에서 재시도합니다 (요청이 전송되지 않은 경우라
+        주문 중복 위험 없음). 응답 코드별 재시도는 _request()가 담당합니다.
+        """
+        session = requests.Session()
+        session.headers.update({'Connection': 'keep-alive'})
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=HTTP_POOL_SIZE,
+            max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.2),
+        )
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
     # =========================================================================
     # 토큰 관리
     # =========================================================================
@@ -304,7 +367,7 @@ class KISBroker:
         logger.info("API 토큰 갱신 중...")
         
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/oauth2/tokenP",
                 json={
                     "grant_type": "client_credentials",
@@ -369,7 +432,7 @@ class KISBroker:
             해시키 문자열 (실패 시 빈 문자열)
         """
         try:
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/uapi/hashkey",
                 headers={
                     "appkey": self.app_key,
@@ -422,21 +485,22 @@ class KISBroker:
         url = f"{self.base_url}{endpoint}"
         headers = self._get_headers(tr_id)
         
-        self._stats['total_api_calls'] += 1
+        self._inc_stat('total_api_calls')
         
         last_error = None
         
         for attempt in range(retry_count):
+            self._rate_limiter.acquire()  # 🆕 재시도 포함 실제 전송마다 한도 적용
             try:
                 if method.upper() == 'GET':
-                    response = requests.get(
+                    response = self._session.get(
                         url,
                         headers=headers,
                         params=params,
                         timeout=REQUEST_TIMEOUT
                     )
                 else:
-                    response = requests.post(
+                    response = self._session.post(
                         url,
                         headers=headers,
                         json=json_body,
@@ -598,7 +662,7 @@ class KISBroker:
         Returns:
             OrderResult
         """
-        self._stats['total_orders'] += 1
+        self._inc_stat('total_orders')
         
         # dry_run 모드
         if self.dry_run:
@@ -631,9 +695,10 @@ class KISBroker:
             
             # 🆕 직접 API 호출 (Hashkey 포함 위해)
             url = f"{self.base_url}/uapi/domestic-stock/v1/trading/order-cash"
-            self._stats['total_api_calls'] += 1
+            self._inc_stat('total_api_calls')
+            self._rate_limiter.acquire()  # 🆕
             
-            response = requests.post(
+            response = self._session.post(
                 url,
                 headers=headers,
                 json=body,
@@ -659,7 +724,7 @@ class KISBroker:
                     quantity=quantity,
                 )
                 
-                self._stats['success_orders'] += 1
+                self._inc_stat('success_orders')
                 logger.info(
                     f"✅ 주문 성공: {stock_code} {side.value} {quantity}주 "
                     f"@ {price if price > 0 else '시장가'} (주문번호: {result.order_id})"
@@ -676,13 +741,13 @@ class KISBroker:
                     error=error_msg,
                 )
                 
-                self._stats['failed_orders'] += 1
+                self._inc_stat('failed_orders')
                 logger.error(f"❌ 주문 실패: {stock_code} - {error_msg}")
                 
                 return result
         
         except Exception as e:
-            self._stats['failed_orders'] += 1
+            self._inc_stat('failed_orders')
             logger.exception(f"❌ 주문 에러: {stock_code} - {e}")
             
             return OrderResult(
@@ -743,7 +808,7 @@ class KISBroker:
                 if pos['quantity'] <= 0:
                     del self._mock_positions[stock_code]
         
-        self._stats['success_orders'] += 1
+        self._inc_stat('success_orders')
         logger.info(
             f"🔸 [DRY RUN] 주문: {stock_code} {side.value} {quantity}주 "
             f"@ {price} (주문번호: {order_id})"
@@ -1187,6 +1252,70 @@ class KISBroker:
             logger.error(f"현재가 조회 에러 ({stock_code}): {e}")
             return 0
     
+    def get_current_prices(self, stock_codes: List[str]) -> Dict[str, float]:
+        """
+        🆕 여러 종목 현재가 일괄 조회
+        
+        실전 환경은 멀티종목 시세 API로 30종목씩 한 번에 조회하고,
+        모의투자(멀티종목 API 미지원) 또는 일괄 조회에서 빠진 종목은
+        종목별 조회를 병렬로 수행합니다 (🆕 환경별 초당 호출 한도 내에서).
+        
+        Args:
+            stock_codes: 종목 코드 리스트
+        
+        Returns:
+            {종목코드: 현재가} (조회 실패 종목 제외)
+        """
+        codes = list(dict.fromkeys(stock_codes))
+        prices: Dict[str, float] = {}
+        
+        if self.environment != 'V':
+            for i in range(0, len(codes), MULTI_PRICE_MAX_CODES):
+                prices.update(self._get_multi_price(codes[i:i + MULTI_PRICE_MAX_CODES]))
+        
+        missing = [code for code in codes if code not in prices]
+        if missing:
+            # 🆕 호출 속도는 _request 의 공유 제한기가 맞추고, 모의는 한도 이상 스레드를 띄우지 않음
+            workers = KIS_TPS_LIMIT_MOCK if self.environment == 'V' else PRICE_FALLBACK_WORKERS
+            with ThreadPoolExecutor(max_workers=min(workers, len(missing))) as ex:
+                for code, price in zip(missing, ex.map(self.get_current_price, missing)):
+                    if price:
+                        prices[code] = price
+        
+        return prices
+    
+    def _get_multi_price(self, stock_codes: List[str]) -> Dict[str, float]:
+        """
+        🆕 멀티종목 시세 조회 (최대 30종목, 1회 요청)
+        
+        Returns:
+            {종목코드: 현재가} (실패 시 빈 딕셔너리 → 종목별 조회로 대체)
+        """
+        params = {}
+        for i, code in enumerate(stock_codes, 1):
+            params[f"FID_COND_MRKT_DIV_CODE_{i}"] = "J"
+            params[f"FID_INPUT_ISCD_{i}"] = code
+        
+        try:
+            response = self._request(
+                method='GET',
+                endpoint='/uapi/domestic-stock/v1/quotations/intstock-multprice',
+                tr_id=TR_IDS['multi_price'],
+                params=params
+            )
+            
+            prices = {}
+            for item in response.get('output', []) or []:
+                code = item.get('inter_shrn_iscd', '')
+                price = float(item.get('inter2_prpr', 0) or 0)
+                if code and price:
+                    prices[code] = price
+            return prices
+        
+        except Exception as e:
+            logger.warning(f"멀티종목 시세 조회 실패, 종목별 조회로 대체: {e}")
+            return {}
+    
     def get_stock_info(self, stock_code: str) -> Dict:
         """
         종목 상세 정보 조회
@@ -1544,10 +1673,17 @@ class KISBroker:
     # 유틸리티
     # =========================================================================
     
+    def _inc_stat(self, key: str):
+        """🆕 통계 카운터 증가 (병렬 조회 스레드에서 호출)"""
+        with self._stats_lock:
+            self._stats[key] += 1
+    
     def get_stats(self) -> Dict:
         """브로커 통계 조회"""
+        with self._stats_lock:
+            stats = dict(self._stats)
         return {
-            **self._stats,
+            **stats,
             'dry_run': self.dry_run,
             'environment': self.environment,
         }
@@ -1574,8 +1710,9 @@ class KISBroker:
         try:
             headers = self._get_headers(tr_id)
             url = f"{self.base_url}{endpoint}"
+            self._rate_limiter.acquire()  # 🆕
             
-            response = requests.get(
+            response = self._session.get(
                 url,
                 headers=headers,
                 params=params,
@@ -1663,8 +1800,9 @@ class KISBroker:
         try:
             headers = self._get_headers(tr_id)
             url = f"{self.base_url}{endpoint}"
+            self._rate_limiter.acquire()  # 🆕
             
-            response = requests.get(
+            response = self._session.get(
                 url,
                 headers=headers,
                 params=params,
@@ -12,20 +12,6 @@ ScalpingBot v2.4 - Strategy 모듈
 ============================================================================
 """
 
-from scalping.strategy.indicators import (
-    calculate_cci,
-    calculate_sma,
-    calculate_ema,
-    calculate_distance_from_ma,
-    calculate_volume_ratio,
-    count_consecutive_bullish,
-    count_consecutive_bearish,
-    analyze_candle,
-    analyze_candles_df,
-    calculate_all_indicators,
-    RealtimeIndicators,
-)
-
 from scalping.strategy.score_engine import (
     ScoreEngine,
     ScoreResult,
@@ -38,6 +24,31 @@ from scalping.strategy.score_engine import (
     verify_with_sample,
 )
 
+# 🆕 indicators는 지연 import (numpy/pandas 로드를 실제 사용 시점까지 미룸)
+_INDICATOR_NAMES = (
+    'calculate_cci',
+    'calculate_sma',
+    'calculate_ema',
+    'calculate_distance_from_ma',
+    'calculate_volume_ratio',
+    'count_consecutive_bullish',
+    'count_consecutive_bearish',
+    'analyze_candle',
+    'analyze_candles_df',
+    'calculate_all_indicators',
+    'RealtimeIndicators',
+)
+
+
+def __getattr__(name: str):
+    if name in _INDICATOR_NAMES:
+        from scalping.strategy import indicators
+        value = getattr(indicators, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 __all__ = [
     # indicators
     'calculate_cci',
@@ -21,12 +21,15 @@ ScalpingBot v3.0 - Minute Indicators (분봉 기술적 지표)
 """
 
 import numpy as np
-import pandas as pd
-from typing import Dict, Any, Optional, List, Tuple
+from typing import Dict, Any, Optional, List, Tuple, TYPE_CHECKING
 from dataclasses import dataclass, field
 from collections import deque
 import logging
 
+# 타입 힌트용 (🆕 pandas는 DataFrame 일괄 계산 시에만 필요 - 엔진 기동 시 로드 회피)
+if TYPE_CHECKING:
+    import pandas as pd
+
 logger = logging.getLogger('ScalpingBot.MinuteIndicators')
 
 
@@ -437,9 +440,9 @@ class MinuteIndicators:
 # =============================================================================
 
 def calculate_minute_indicators_df(
-    df: pd.DataFrame,
+    df: 'pd.DataFrame',
     prev_close: float = 0.0,
-) -> pd.DataFrame:
+) -> 'pd.DataFrame':
     """
     DataFrame에 분봉 지표 일괄 계산
     
@@ -766,7 +769,8 @@ if __name__ == '__main__':
     
     # DataFrame 테스트
     print("\n2. DataFrame 일괄 계산 테스트")
-    df = pd.DataFrame([
+    import pandas  # 테스트에서만 로드 (모듈 수준 pd 는 타입 힌트 전용)
+    df = pandas.DataFrame([
         {
             'timestamp': c.timestamp,
             'open': c.open,
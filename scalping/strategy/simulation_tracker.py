@@ -38,6 +38,8 @@ ScalpingBot v3.3 - Simulation Tracker (페이퍼 트레이딩)
 import sqlite3
 import logging
 import csv
+import json
+import threading
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Any, Tuple
@@ -128,6 +130,28 @@ class SimulationTracker:
     실제 매매 없이 신호의 유효성을 검증합니다.
     """
     
+    # 🆕 SQL 상수 (sqlite3 문장 캐시 재사용을 위해 동일 문자열 유지)
+    SQL_INSERT = '''
+        INSERT INTO virtual_positions (
+            stock_code, stock_name, entry_price, entry_time,
+            signal_score, signal_type, take_profit_pct, stop_loss_pct,
+            take_profit_price, stop_loss_price, high_price, low_price,
+            high_pct, low_pct, price_history, high_time_seconds, low_time_seconds,
+            pattern, result, exit_price, exit_time, exit_pct,
+            hold_seconds, date, created_at, updated_at
+        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
+    # 추적 갱신 및 청산 기록 공용 (청산 시 result/exit_* 컬럼이 함께 갱신됨)
+    SQL_UPDATE = '''
+        UPDATE virtual_positions SET
+            high_price = ?, low_price = ?, high_pct = ?, low_pct = ?,
+            price_history = ?, high_time_seconds = ?, low_time_seconds = ?,
+            pattern = ?, result = ?, exit_price = ?, exit_time = ?, exit_pct = ?,
+            hold_seconds = ?, updated_at = ?
+        WHERE id = ?
+    '''
+    
     def __init__(
         self,
         db_path: str = None,
@@ -144,6 +168,11 @@ class SimulationTracker:
         # DB 초기화
         self._init_db()
         
+        # 🆕 쓰기 전용 영구 연결 (autocommit, 배치는 BEGIN IMMEDIATE로 직접 제어)
+        self._db_lock = threading.Lock()
+        self.conn = self._connect(isolation_level=None, check_same_thread=False)
+        self._cur = self.conn.cursor()
+        
         # 오늘 날짜
         self._today = datetime.now().strftime('%Y-%m-%d')
         
@@ -162,11 +191,34 @@ class SimulationTracker:
     # DB 관리
     # =========================================================================
     
+    def _connect(self, **kwargs) -> sqlite3.Connection:
+        """
+        🆕 DB 연결 생성 (연결 단위 PRAGMA 적용)
+        
+        synchronous=NORMAL: WAL 모드에서 커밋마다 fsync 하지 않음
+        temp_store=MEMORY: 임시 테이블/정렬을 메모리에서 처리
+        mmap_size=256MB: 읽기 시 read() 대신 메모리 매핑 사용
+        cache_size=64MB: 페이지 캐시 확대 (음수 = KiB 단위)
+        wal_autocheckpoint=1000: WAL 1000 페이지마다 자동 체크포인트
+        """
+        conn = sqlite3.connect(self.db_path, **kwargs)
+        conn.executescript('''
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA mmap_size=268435456;
+            PRAGMA cache_size=-65536;
+            PRAGMA wal_autocheckpoint=1000;
+        ''')
+        return conn
+    
     def _init_db(self):
         """DB 테이블 생성"""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with sqlite3.connect(self.db_path) as conn:
+        with self._connect() as conn:
+            # 🆕 WAL 모드 (DB 파일에 영구 저장되므로 1회만 설정)
+            conn.execute('PRAGMA journal_mode=WAL')
+            
             conn.execute('''
                 CREATE TABLE IF NOT EXISTS virtual_positions (
                     id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -222,55 +274,77 @@ class SimulationTracker:
     
     def _save_position(self, pos: VirtualPosition) -> int:
         """포지션 DB 저장"""
-        import json
-        
-        with sqlite3.connect(self.db_path) as conn:
-            # 가격 히스토리를 JSON으로 직렬화
-            price_history_json = json.dumps(pos.price_history) if pos.price_history else '[]'
-            
+        with self._db_lock:
             if pos.id == 0:
                 # INSERT
-                cursor = conn.execute('''
-                    INSERT INTO virtual_positions (
-                        stock_code, stock_name, entry_price, entry_time,
-                        signal_score, signal_type, take_profit_pct, stop_loss_pct,
-                        take_profit_price, stop_loss_price, high_price, low_price,
-                        high_pct, low_pct, price_history, high_time_seconds, low_time_seconds,
-                        pattern, result, exit_price, exit_time, exit_pct,
-                        hold_seconds, date, created_at, updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (
-                    pos.stock_code, pos.stock_name, pos.entry_price,
-                    pos.entry_time.isoformat() if pos.entry_time else None,
-                    pos.signal_score, pos.signal_type, pos.take_profit_pct, pos.stop_loss_pct,
-                    pos.take_profit_price, pos.stop_loss_price, pos.high_price, pos.low_price,
-                    pos.high_pct, pos.low_pct, price_history_json, pos.high_time_seconds, pos.low_time_seconds,
-                    pos.pattern, pos.result.value,
-                    pos.exit_price, pos.exit_time.isoformat() if pos.exit_time else None,
-                    pos.exit_pct, pos.hold_seconds, pos.date,
-                    datetime.now().isoformat(), datetime.now().isoformat()
-                ))
-                pos.id = cursor.lastrowid
+                self._cur.execute(self.SQL_INSERT, self._insert_params(pos))
+                pos.id = self._cur.lastrowid
             else:
                 # UPDATE
-                conn.execute('''
-                    UPDATE virtual_positions SET
-                        high_price = ?, low_price = ?, high_pct = ?, low_pct = ?,
-                        price_history = ?, high_time_seconds = ?, low_time_seconds = ?,
-                        pattern = ?, result = ?, exit_price = ?, exit_time = ?, exit_pct = ?,
-                        hold_seconds = ?, updated_at = ?
-                    WHERE id = ?
-                ''', (
-                    pos.high_price, pos.low_price, pos.high_pct, pos.low_pct,
-                    price_history_json, pos.high_time_seconds, pos.low_time_seconds,
-                    pos.pattern, pos.result.value, pos.exit_price,
-                    pos.exit_time.isoformat() if pos.exit_time else None,
-                    pos.exit_pct, pos.hold_seconds, datetime.now().isoformat(),
-                    pos.id
-                ))
-            conn.commit()
+                self._cur.execute(self.SQL_UPDATE, self._update_params(pos))
         return pos.id
     
+    def _insert_params(self, pos: VirtualPosition) -> tuple:
+        """🆕 INSERT 파라미터 생성"""
+        # 가격 히스토리를 JSON으로 직렬화
+        price_history_json = json.dumps(pos.price_history) if pos.price_history else '[]'
+        now_str = datetime.now().isoformat()
+        return (
+            pos.stock_code, pos.stock_name, pos.entry_price,
+            pos.entry_time.isoformat() if pos.entry_time else None,
+            pos.signal_score, pos.signal_type, pos.take_profit_pct, pos.stop_loss_pct,
+            pos.take_profit_price, pos.stop_loss_price, pos.high_price, pos.low_price,
+            pos.high_pct, pos.low_pct, price_history_json, pos.high_time_seconds, pos.low_time_seconds,
+            pos.pattern, pos.result.value,
+            pos.exit_price, pos.exit_time.isoformat() if pos.exit_time else None,
+            pos.exit_pct, pos.hold_seconds, pos.date,
+            now_str, now_str
+        )
+    
+    def _update_params(self, pos: VirtualPosition) -> tuple:
+        """🆕 UPDATE 파라미터 생성"""
+        price_history_json = json.dumps(pos.price_history) if pos.price_history else '[]'
+        return (
+            pos.high_price, pos.low_price, pos.high_pct, pos.low_pct,
+            price_history_json, pos.high_time_seconds, pos.low_time_seconds,
+            pos.pattern, pos.result.value, pos.exit_price,
+            pos.exit_time.isoformat() if pos.exit_time else None,
+            pos.exit_pct, pos.hold_seconds, datetime.now().isoformat(),
+            pos.id
+        )
+    
+    def _save_positions_batch(self, positions: List[VirtualPosition]):
+        """
+        🆕 여러 포지션을 단일 트랜잭션으로 저장
+        
+        포지션별 커밋(fsync) 대신 BEGIN IMMEDIATE ~ COMMIT 한 번으로 처리.
+        신규(id=0) 포지션은 개별 INSERT로 저장합니다.
+        """
+        if not positions:
+            return
+        
+        rows = [self._update_params(p) for p in positions if p.id]
+        for pos in positions:
+            if not pos.id:
+                self._save_position(pos)
+        
+        if not rows:
+            return
+        
+        with self._db_lock:
+            self._cur.execute('BEGIN IMMEDIATE')
+            try:
+                self._cur.executemany(self.SQL_UPDATE, rows)
+                self._cur.execute('COMMIT')
+            except Exception:
+                self._cur.execute('ROLLBACK')
+                raise
+    
+    def close(self):
+        """🆕 영구 DB 연결 종료"""
+        with self._db_lock:
+            self.conn.close()
+    
     # =========================================================================
     # 가상 진입/청산
     # =========================================================================
@@ -423,10 +497,7 @@ class SimulationTracker:
                 # 🆕 패턴 분석
                 pos.pattern = self._analyze_pattern(pos)
                 
-                # DB 저장
-                self._save_position(pos)
-                
-                # 메모리에서 제거
+                # 메모리에서 제거 (DB 저장은 루프 종료 후 일괄 처리)
                 del self._positions[code]
                 closed.append(pos)
                 
@@ -448,6 +519,9 @@ class SimulationTracker:
                     f"패턴:{pos.pattern}"
                 )
         
+        # 🆕 청산 포지션 일괄 저장 (단일 트랜잭션)
+        self._save_positions_batch(closed)
+        
         return closed
     
     def _analyze_pattern(self, pos: VirtualPosition) -> str:
@@ -531,13 +605,25 @@ class SimulationTracker:
             pos.exit_pct = pos.current_pct
             pos.hold_seconds = int((now - pos.entry_time).total_seconds())
             
-            self._save_position(pos)
-            
             self._stats['pending'] -= 1
             
             logger.info(f"📤 강제청산: {pos.stock_name} | {pos.exit_pct:+.2f}%")
         
+        # 🆕 단일 트랜잭션으로 일괄 저장
+        self._save_positions_batch(list(self._positions.values()))
+        
         self._positions.clear()
+        
+        # 🆕 장 마감 시 WAL 파일을 DB에 반영하고 비움
+        self._checkpoint()
+    
+    def _checkpoint(self):
+        """🆕 WAL 체크포인트 (TRUNCATE: 반영 후 WAL 파일 크기 0으로)"""
+        try:
+            with self._db_lock:
+                self._cur.execute('PRAGMA wal_checkpoint(TRUNCATE)')
+        except sqlite3.Error as e:
+            logger.warning(f"WAL 체크포인트 실패: {e}")
     
     # =========================================================================
     # 조회 및 통계
@@ -717,21 +803,27 @@ class SimulationTracker:
         filepath = filepath or f"simulation_results_{datetime.now().strftime('%Y%m%d')}.csv"
         start_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
         
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            rows = conn.execute('''
+        # 🆕 커서를 그대로 csv.writer에 흘려보냄 (중간 리스트/딕셔너리 변환 없음)
+        conn = self._connect()
+        try:
+            cursor = conn.execute('''
                 SELECT * FROM virtual_positions
                 WHERE date >= ?
                 ORDER BY entry_time DESC
-            ''', (start_date,)).fetchall()
-        
-        with open(filepath, 'w', newline='', encoding='utf-8-sig') as f:
-            if rows:
-                writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-                writer.writeheader()
-                writer.writerows([dict(r) for r in rows])
+            ''', (start_date,))
+            header = [col[0] for col in cursor.description]
+            count = 0
+            
+            with open(filepath, 'w', newline='', encoding='utf-8-sig', buffering=1 << 20) as f:
+                writer = csv.writer(f)
+                for count, row in enumerate(cursor, 1):
+                    if count == 1:
+                        writer.writerow(header)
+                    writer.writerow(row)
+        finally:
+            conn.close()
         
-        logger.info(f"CSV 내보내기 완료: {filepath} ({len(rows)}건)")
+        logger.info(f"CSV 내보내기 완료: {filepath} ({count}건)")
         return filepath
     
     def get_trade_timeline(self, trade_id: int = None, stock_code: str = None, date: str = None) -> Optional[Dict]:
@@ -743,7 +835,6 @@ class SimulationTracker:
             stock_code: 종목 코드 (오늘 해당 종목)
             date: 날짜 (기본: 오늘)
         """
-        import json
         date = date or datetime.now().strftime('%Y-%m-%d')
         
         with sqlite3.connect(self.db_path) as conn:
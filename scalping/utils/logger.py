@@ -12,6 +12,7 @@ ScalpingBot v2.4 - Logger (로깅 시스템)
 - 콘솔 컬러 출력 (Windows 호환)
 - 스택 트레이스 자동 포함
 - 로그 레벨 동적 변경
+- 비동기 기록 (QueueHandler → 백그라운드 리스너)
 
 로그 파일 구조:
     logs/
@@ -31,12 +32,19 @@ ScalpingBot v2.4 - Logger (로깅 시스템)
 
 import os
 import sys
+import queue
+import atexit
 import logging
 import traceback
 from pathlib import Path
 from datetime import datetime, date
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
-from typing import Optional, Dict
+from logging.handlers import (
+    RotatingFileHandler,
+    TimedRotatingFileHandler,
+    QueueHandler,
+    QueueListener,
+)
+from typing import Optional, Dict, List
 import threading
 
 # Windows 콘솔 색상 지원
@@ -59,6 +67,7 @@ except ImportError:
 _initialized = False
 _log_dir: Optional[Path] = None
 _lock = threading.Lock()
+_listeners: Dict[str, QueueListener] = {}  # 🆕 백그라운드 로그 기록 스레드
 
 
 # =============================================================================
@@ -134,6 +143,60 @@ class TradeFormatter(logging.Formatter):
         return f"{timestamp},{record.getMessage()}"
 
 
+# =============================================================================
+# 🆕 비동기 로깅 (QueueHandler + QueueListener)
+# =============================================================================
+
+class _LocalQueueHandler(QueueHandler):
+    """
+    같은 프로세스 내 큐 핸들러
+    
+    메시지 문자열만 미리 확정하고 exc_info는 유지하여
+    리스너 쪽 포맷터가 스택 트레이스를 그대로 출력하도록 합니다.
+    """
+    
+    def prepare(self, record):
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+def _start_queue_listener(name: str, handlers: List[logging.Handler]) -> QueueHandler:
+    """
+    실제 핸들러를 백그라운드 리스너로 옮기고 큐 핸들러 반환
+    
+    호출 스레드는 큐 삽입만 수행하므로 디스크/콘솔 I/O로 블로킹되지 않습니다.
+    """
+    old_listener = _listeners.pop(name, None)
+    if old_listener:
+        old_listener.stop()
+    
+    log_queue: queue.Queue = queue.Queue(-1)
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _listeners[name] = listener
+    
+    return _LocalQueueHandler(log_queue)
+
+
+def _stop_queue_listeners():
+    """남은 로그 기록 후 리스너 종료 (프로세스 종료 시)"""
+    for listener in list(_listeners.values()):
+        listener.stop()
+    _listeners.clear()
+
+
+atexit.register(_stop_queue_listeners)
+
+
+def _get_file_handlers() -> List[logging.Handler]:
+    """리스너/루트 로거에 등록된 모든 핸들러"""
+    handlers = list(logging.getLogger().handlers)
+    for listener in _listeners.values():
+        handlers.extend(listener.handlers)
+    return handlers
+
+
 # =============================================================================
 # 로깅 설정 함수
 # =============================================================================
@@ -174,6 +237,9 @@ def setup_logging(
         # 기존 핸들러 제거
         root_logger.handlers.clear()
         
+        # 🆕 실제 핸들러는 리스너 스레드에서 실행
+        handlers: List[logging.Handler] = []
+        
         # 1. 콘솔 핸들러
         if console:
             console_handler = logging.StreamHandler(sys.stdout)
@@ -182,7 +248,7 @@ def setup_logging(
                 fmt='[%(asctime)s] %(levelname)-8s %(name)-20s │ %(message)s',
                 datefmt='%H:%M:%S'
             ))
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # 2. 메인 로그 파일 (일별 로테이션)
         if file:
@@ -200,7 +266,7 @@ def setup_logging(
                 datefmt='%Y-%m-%d %H:%M:%S'
             ))
             main_handler.suffix = "%Y-%m-%d"
-            root_logger.addHandler(main_handler)
+            handlers.append(main_handler)
             
             # 3. 에러 전용 로그 파일
             error_log_path = _log_dir / "errors.log"
@@ -218,7 +284,10 @@ def setup_logging(
                     '%(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             ))
-            root_logger.addHandler(error_handler)
+            handlers.append(error_handler)
+        
+        if handlers:
+            root_logger.addHandler(_start_queue_listener('root', handlers))
         
         _initialized = True
         
@@ -260,7 +329,7 @@ def setup_trade_logger() -> logging.Logger:
     trade_handler.setLevel(logging.INFO)
     trade_handler.setFormatter(TradeFormatter())
     trade_handler.suffix = "%Y-%m-%d"
-    trade_logger.addHandler(trade_handler)
+    trade_logger.addHandler(_start_queue_listener('trades', [trade_handler]))
     
     return trade_logger
 
@@ -381,12 +450,19 @@ def get_log_files() -> Dict[str, str]:
 
 
 def rotate_logs():
-    """수동 로그 로테이션"""
-    root_logger = logging.getLogger()
+    """
+    수동 로그 로테이션
     
-    for handler in root_logger.handlers:
+    🆕 파일 핸들러는 QueueListener 스레드에서 기록하므로,
+    핸들러 락을 잡고 교체해 기록 중인 스트림이 닫히지 않도록 합니다.
+    """
+    for handler in _get_file_handlers():
         if isinstance(handler, (RotatingFileHandler, TimedRotatingFileHandler)):
-            handler.doRollover()
+            handler.acquire()
+            try:
+                handler.doRollover()
+            finally:
+                handler.release()
     
     get_logger().info("로그 로테이션 완료")
 
@@ -12,6 +12,9 @@ ScalpingBot v2.4 - AI Engine 테스트
 - 키 정규화
 - confidence clamp
 - fallback 동작
+- 요청 큐 (오래된 항목 폐기 / 만료 정리 / 합침 / 우선순위)
+- 객체 풀, 배치 응답 파싱, 판단 캐시, 규칙 사전 선별
+- 재시도 (지터 / Retry-After), 스트리밍 조기 종료
 ============================================================================
 """
 
@@ -24,7 +27,20 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scalping.ai.ai_engine import AIEngine
+import time
+from types import SimpleNamespace
+
+import scalping.ai.ai_engine as ai_engine_module
+from scalping.ai.ai_engine import (
+    AIEngine,
+    AIAPIError,
+    AIRequest,
+    AIResult,
+    RateLimitedError,
+    TimedQueue,
+    _ObjectPool,
+    _completed_json,
+)
 
 
 # =============================================================================
@@ -43,6 +59,49 @@ def ai_engine():
     return AIEngine(config)
 
 
+# 학습 통계 없음 (전체 / CCI 구간 / 점수 구간 / 종목 캐시) - 테스트가 db/learning.db 를 만들지 않도록
+EMPTY_LEARNING = ({}, ((50, 0),) * 3, ((50, 0),) * 3, {})
+
+
+@pytest.fixture
+def queued_engine():
+    """요청 큐 테스트용 AI 엔진 (워커 없이 실행 상태, 학습 통계 고정)"""
+    engine = AIEngine({
+        'model': 'qwen3:8b',
+        'timeout': 5,
+        'max_queue_size': 3,
+        'retry_count': 2,
+    })
+    engine._stop_event.clear()
+    engine._learning_snapshot = lambda: EMPTY_LEARNING
+    engine._stock_learning_stats = lambda code, cache: {}
+    return engine
+
+
+def make_request(stock_code: str, rule_score: float = 60, **indicators) -> AIRequest:
+    """테스트 요청 생성"""
+    return AIRequest(
+        stock_code=stock_code,
+        stock_name=f"종목{stock_code}",
+        indicators=indicators or {'cci': 50, 'volume_ratio': 1.5, 'change_pct': 1.0},
+        rule_score=rule_score,
+        market_state={'mode': 'NORMAL'},
+        current_price=10000,
+    )
+
+
+def request_analysis(engine: AIEngine, stock_code: str, rule_score: float = 60, **indicators) -> bool:
+    """request_analysis 호출 (기본값은 사전 선별을 통과하는 지표)"""
+    return engine.request_analysis(
+        stock_code=stock_code,
+        stock_name=f"종목{stock_code}",
+        indicators=indicators or {'cci': 50, 'volume_ratio': 1.5, 'change_pct': 1.0},
+        rule_score=rule_score,
+        market_state={'mode': 'NORMAL'},
+        current_price=10000,
+    )
+
+
 # =============================================================================
 # JSON 파싱 테스트
 # =============================================================================
@@ -187,6 +246,450 @@ class TestPromptGeneration:
         assert "cci" in prompt.lower() or "45" in prompt
 
 
+# =============================================================================
+# 요청 큐 테스트
+# =============================================================================
+
+def queue_item(code: str, age: float = 0.0, high: bool = False):
+    """TimedQueue 항목 (timestamp = monotonic - age)"""
+    return SimpleNamespace(stock_code=code, timestamp=time.monotonic() - age, high=high)
+
+
+class TestTimedQueue:
+    """TimedQueue 테스트"""
+    
+    def test_full_queue_drops_oldest(self):
+        """가득 차면 가장 오래된 항목을 밀어냄"""
+        queue = TimedQueue(maxsize=2)
+        a, b, c = queue_item('A'), queue_item('B'), queue_item('C')
+        
+        assert queue.put(a) is None
+        assert queue.put(b) is None
+        assert queue.put(c) is a
+        
+        assert [queue.get_nowait(), queue.get_nowait()] == [b, c]
+    
+    def test_prune_older_than(self):
+        """만료 항목만 앞에서부터 제거"""
+        queue = TimedQueue()
+        old1, old2, fresh = queue_item('A', age=10), queue_item('B', age=8), queue_item('C')
+        for item in (old1, old2, fresh):
+            queue.put(item)
+        
+        assert queue.prune_older_than(5) == [old1, old2]
+        assert queue.qsize() == 1
+        assert queue.get_nowait() is fresh
+    
+    def test_coalesce_same_key(self):
+        """같은 키의 대기 항목은 최신 항목으로 대체 (맨 뒤로)"""
+        queue = TimedQueue(maxsize=10, key=lambda item: item.stock_code)
+        a1, b, a2 = queue_item('A'), queue_item('B'), queue_item('A')
+        
+        queue.put(a1)
+        queue.put(b)
+        assert queue.put(a2) is a1
+        
+        assert queue.qsize() == 2
+        assert [queue.get_nowait(), queue.get_nowait()] == [b, a2]
+    
+    def test_priority_items_first(self):
+        """우선 항목은 먼저 꺼내고, 일반 큐 초과가 우선 자리를 뺏지 않음"""
+        queue = TimedQueue(maxsize=1, priority=lambda item: item.high, hi_maxsize=1)
+        low1, high, low2 = queue_item('A'), queue_item('B', high=True), queue_item('C')
+        
+        queue.put(low1)
+        queue.put(high)
+        assert queue.put(low2) is low1
+        
+        assert queue.hi_qsize() == 1
+        assert queue.lo_qsize() == 1
+        assert [queue.get_nowait(), queue.get_nowait()] == [high, low2]
+    
+    def test_close_wakes_waiting_get(self):
+        """close() 후 빈 큐의 get()은 None"""
+        queue = TimedQueue()
+        queue.close()
+        assert queue.get(timeout=1) is None
+
+
+class TestRequestQueueing:
+    """request_analysis 큐잉 동작 테스트"""
+    
+    def test_coalesces_pending_request(self, queued_engine):
+        """같은 종목 대기 요청은 하나로 합침"""
+        assert request_analysis(queued_engine, '000001')
+        assert request_analysis(queued_engine, '000001')
+        
+        stats = queued_engine.get_stats()
+        assert queued_engine.get_queue_size() == 1
+        assert stats['coalesced_count'] == 1
+        assert stats['total_requests'] == 2
+    
+    def test_drops_oldest_when_full(self, queued_engine):
+        """큐 상한 초과 시 가장 오래된 요청 폐기"""
+        for code in ('000001', '000002', '000003', '000004'):
+            assert request_analysis(queued_engine, code)
+        
+        assert queued_engine.get_queue_size() == 3
+        assert queued_engine.get_stats()['dropped_count'] == 1
+        assert queued_engine.request_queue.get_nowait().stock_code == '000002'
+    
+    def test_prunes_stale_requests(self, queued_engine):
+        """max_request_age 가 지난 요청은 새 요청 전에 정리"""
+        request_analysis(queued_engine, '000001')
+        queued_engine.max_request_age = 0.0
+        request_analysis(queued_engine, '000002')
+        
+        stats = queued_engine.get_stats()
+        assert stats['stale_dropped'] == 1
+        assert queued_engine.get_queue_size() == 1
+    
+    def test_high_score_goes_to_priority_queue(self, queued_engine):
+        """우선 처리 점수 이상은 우선 큐에서 먼저 처리"""
+        request_analysis(queued_engine, '000001', rule_score=60)
+        request_analysis(queued_engine, '000002', rule_score=90)
+        
+        assert queued_engine.request_queue.hi_qsize() == 1
+        assert queued_engine.request_queue.get_nowait().stock_code == '000002'
+    
+    def test_inflight_request_is_deduped(self, queued_engine):
+        """같은 종목을 처리 중이면 새 요청 무시"""
+        queued_engine._mark_inflight([make_request('000001')])
+        
+        assert not request_analysis(queued_engine, '000001')
+        assert queued_engine.get_stats()['deduped'] == 1
+        assert queued_engine.get_queue_size() == 0
+    
+    def test_rejected_when_stopped(self, ai_engine):
+        """워커 미실행 시 요청 거부"""
+        assert not request_analysis(ai_engine, '000001')
+
+
+# =============================================================================
+# 객체 풀 테스트
+# =============================================================================
+
+class TestObjectPool:
+    """_ObjectPool 테스트"""
+    
+    def test_reuses_released_instance(self):
+        """반납한 인스턴스를 새 값으로 재사용"""
+        pool = _ObjectPool(AIRequest)
+        first = pool.acquire(
+            stock_code='000001', stock_name='A', indicators={}, rule_score=1,
+            market_state={}, current_price=100,
+        )
+        pool.release(first)
+        
+        second = pool.acquire(
+            stock_code='000002', stock_name='B', indicators={'cci': 1}, rule_score=2,
+            market_state={}, current_price=200,
+        )
+        
+        assert second is first
+        assert second.stock_code == '000002'
+        assert second.indicators == {'cci': 1}
+        assert second.current_price == 200
+    
+    def test_applies_defaults_on_reuse(self):
+        """지정하지 않은 필드는 기본값으로 다시 채움"""
+        pool = _ObjectPool(AIResult)
+        values = dict(
+            stock_code='000001', stock_name='A', decision='BUY', confidence=0.9,
+            reason='r', original_price=100, elapsed=0.1,
+        )
+        first = pool.acquire(rule_score=80, indicators={'cci': 1}, **values)
+        pool.release(first)
+        
+        second = pool.acquire(**values)
+        assert second is first
+        assert second.rule_score == 0.0
+        assert second.indicators == {}
+    
+    def test_missing_required_field_keeps_instance_pooled(self):
+        """필수 필드 누락 시 TypeError, 인스턴스는 풀에 남음"""
+        pool = _ObjectPool(AIRequest)
+        pool.release(make_request('000001'))
+        
+        with pytest.raises(TypeError):
+            pool.acquire(stock_code='000002')
+        assert len(pool.free) == 1
+
+
+# =============================================================================
+# 배치 처리 테스트
+# =============================================================================
+
+class TestBatchResponse:
+    """배치 응답 파싱 및 처리 테스트"""
+    
+    def test_matches_by_code(self, ai_engine):
+        """code 값으로 요청과 매칭 (순서 무관, 없는 종목은 None)"""
+        requests_list = [make_request('000001'), make_request('000002'), make_request('000003')]
+        text = json.dumps([
+            {"code": "000002", "decision": "BUY", "confidence": 0.8, "reason": "b"},
+            {"code": "000001", "decision": "HOLD", "confidence": 0.6, "reason": "a"},
+        ])
+        
+        parsed = ai_engine._parse_batch_response(text, requests_list)
+        
+        assert parsed[0]['decision'] == 'HOLD'
+        assert parsed[1]['decision'] == 'BUY'
+        assert parsed[2] is None
+    
+    def test_matches_in_order_without_codes(self, ai_engine):
+        """code 가 없으면 순서대로 매칭"""
+        requests_list = [make_request('000001'), make_request('000002')]
+        text = '[{"decision": "BUY", "confidence": 0.7}]'
+        
+        parsed = ai_engine._parse_batch_response(text, requests_list)
+        
+        assert parsed[0]['decision'] == 'BUY'
+        assert parsed[1] is None
+    
+    def test_array_embedded_in_text(self, ai_engine):
+        """설명이 섞인 응답에서 배열 추출"""
+        requests_list = [make_request('000001')]
+        text = 'Here you go:\n[{"code": "000001", "decision": "sell", "confidence": 0.9}]\nDone.'
+        
+        parsed = ai_engine._parse_batch_response(text, requests_list)
+        
+        assert parsed[0]['decision'] == 'SELL'
+    
+    def test_unparseable_batch_returns_none(self, ai_engine):
+        """파싱 불가 응답은 모두 None (개별 처리 대상)"""
+        requests_list = [make_request('000001'), make_request('000002')]
+        assert ai_engine._parse_batch_response('no json', requests_list) == [None, None]
+    
+    def test_batch_missing_items_processed_individually(self, ai_engine):
+        """배치 응답에서 빠진 종목만 개별 호출"""
+        batch = [make_request('000001'), make_request('000002')]
+        batch_text = '[{"code": "000001", "decision": "BUY", "confidence": 0.8, "reason": "x"}]'
+        single_text = '{"decision": "HOLD", "confidence": 0.7, "reason": "y"}'
+        
+        with patch.object(ai_engine, '_call_api_with_retry', side_effect=[batch_text, single_text]) as call, \
+                patch.object(ai_engine, '_build_prompt', return_value='p'), \
+                patch.object(ai_engine, '_build_batch_prompt', return_value='bp'):
+            results = ai_engine._process_batch(batch)
+        
+        assert call.call_count == 2
+        assert {r.stock_code: r.decision for r in results} == {'000001': 'BUY', '000002': 'HOLD'}
+
+
+# =============================================================================
+# 판단 캐시 테스트
+# =============================================================================
+
+class TestDecisionCache:
+    """판단 LRU 캐시 테스트"""
+    
+    DECISION = {'decision': 'BUY', 'confidence': 0.8, 'reason': 'x'}
+    
+    def test_hit_returns_copy(self, ai_engine):
+        """저장한 판단을 복사본으로 반환"""
+        ai_engine._put_cached_decision(('k',), self.DECISION)
+        
+        cached = ai_engine._get_cached_decision(('k',))
+        assert cached == self.DECISION
+        cached['decision'] = 'SELL'
+        assert ai_engine._get_cached_decision(('k',))['decision'] == 'BUY'
+    
+    def test_low_confidence_not_cached(self, ai_engine):
+        """신뢰도 낮은 판단은 저장 안 함"""
+        ai_engine._put_cached_decision(('k',), {**self.DECISION, 'confidence': 0.3})
+        assert ai_engine._get_cached_decision(('k',)) is None
+    
+    def test_expired_entry_removed(self, ai_engine, monkeypatch):
+        """TTL 지난 항목은 None"""
+        ai_engine._put_cached_decision(('k',), self.DECISION)
+        monkeypatch.setattr(ai_engine_module, 'DECISION_CACHE_TTL', -1)
+        
+        assert ai_engine._get_cached_decision(('k',)) is None
+        assert ('k',) not in ai_engine._decision_cache
+    
+    def test_lru_eviction(self, ai_engine, monkeypatch):
+        """가득 차면 가장 오래 사용하지 않은 항목 제거"""
+        monkeypatch.setattr(ai_engine_module, 'DECISION_CACHE_MAX_SIZE', 2)
+        ai_engine._put_cached_decision(('a',), self.DECISION)
+        ai_engine._put_cached_decision(('b',), self.DECISION)
+        ai_engine._get_cached_decision(('a',))  # a 최근 사용
+        ai_engine._put_cached_decision(('c',), self.DECISION)
+        
+        assert ai_engine._get_cached_decision(('b',)) is None
+        assert ai_engine._get_cached_decision(('a',)) is not None
+        assert ai_engine._get_cached_decision(('c',)) is not None
+    
+    def test_quantized_key_hits_cache(self, ai_engine):
+        """미세한 지표 변화는 같은 키 → API 호출 없이 캐시 사용"""
+        first = make_request('000001', cci=50.2, volume_ratio=1.51, change_pct=1.02)
+        second = make_request('000001', cci=49.8, volume_ratio=1.49, change_pct=0.98)
+        response = '{"decision": "BUY", "confidence": 0.8, "reason": "x"}'
+        
+        with patch.object(ai_engine, '_call_api_with_retry', return_value=response) as call, \
+                patch.object(ai_engine, '_build_prompt', return_value='p'):
+            ai_engine._process_request(first)
+            result = ai_engine._process_request(second)
+        
+        assert call.call_count == 1
+        assert result.decision == 'BUY'
+        assert ai_engine.get_stats()['cache_hits'] == 1
+
+
+# =============================================================================
+# 규칙 사전 선별 테스트
+# =============================================================================
+
+class TestRuleScreen:
+    """규칙 사전 선별 테스트"""
+    
+    def test_obvious_hold_skips_queue(self, queued_engine):
+        """명백한 HOLD 조건은 큐 없이 HOLD 결과"""
+        assert request_analysis(queued_engine, '000001', cci=250, volume_ratio=1.5)
+        
+        result = queued_engine.get_result()
+        assert result.decision == 'HOLD'
+        assert result.reason == 'rule-screen:cci_overbought'
+        assert queued_engine.get_queue_size() == 0
+        assert queued_engine.get_stats()['screened_holds'] == 1
+    
+    @pytest.mark.parametrize('indicators,market_mode,reason', [
+        ({'cci': -150}, 'NORMAL', 'cci_oversold'),
+        ({'cci': 50, 'volume_ratio': 0.5}, 'NORMAL', 'low_volume'),
+        ({'cci': 50, 'change_pct': 7.0}, 'NORMAL', 'already_pumped'),
+        ({'cci': 50}, 'EMERGENCY', 'market_emergency'),
+    ])
+    def test_hold_reasons(self, queued_engine, indicators, market_mode, reason):
+        """HOLD 조건별 사유"""
+        assert queued_engine._rule_screen(indicators, {'mode': market_mode}, 60, '000001') == reason
+    
+    def test_none_indicators_treated_as_missing(self, queued_engine):
+        """None 지표는 없는 것으로 처리 (예외 없음)"""
+        indicators = {'cci': None, 'volume_ratio': None, 'change_pct': None}
+        assert queued_engine._rule_screen(indicators, {'mode': None}, 60, '000001') is None
+    
+    def test_low_pattern_winrate(self, queued_engine):
+        """표본 충분한 구간 승률이 낮으면 HOLD"""
+        cci_table = ((50, 0), (20.0, 10), (50, 0))
+        queued_engine._learning_snapshot = lambda: ({}, cci_table, ((50, 0),) * 3, {})
+        
+        assert queued_engine._rule_screen({'cci': 50}, {}, 60, '000001') == 'low_pattern_winrate'
+    
+    def test_screen_failure_falls_through_to_queue(self, queued_engine):
+        """선별 중 예외는 올리지 않고 일반 경로로 큐잉"""
+        assert request_analysis(queued_engine, '000001', cci='bad')
+        
+        assert queued_engine.get_queue_size() == 1
+        assert queued_engine.get_stats()['screened_holds'] == 0
+
+
+# =============================================================================
+# 재시도 테스트
+# =============================================================================
+
+class TestRetry:
+    """재시도 / 백오프 테스트"""
+    
+    def test_retries_then_succeeds(self, ai_engine):
+        """일시 오류 후 재시도 성공"""
+        with patch.object(ai_engine, '_call_ollama', side_effect=[Exception('boom'), 'ok']) as call, \
+                patch.object(ai_engine_module.time, 'sleep') as sleep:
+            assert ai_engine._call_api_with_retry('p') == 'ok'
+        
+        assert call.call_count == 2
+        assert sleep.call_count == 1
+    
+    def test_non_retriable_error_raises_immediately(self, ai_engine):
+        """400/401/403 은 재시도 없이 즉시 실패"""
+        with patch.object(ai_engine, '_call_ollama', side_effect=AIAPIError('bad', 400)) as call, \
+                patch.object(ai_engine_module.time, 'sleep') as sleep:
+            with pytest.raises(AIAPIError):
+                ai_engine._call_api_with_retry('p')
+        
+        assert call.call_count == 1
+        sleep.assert_not_called()
+    
+    def test_retry_after_is_honored(self, ai_engine):
+        """Retry-After 값만큼 대기 후 재시도"""
+        error = RateLimitedError('slow down', 429, retry_after=1.5)
+        with patch.object(ai_engine, '_call_ollama', side_effect=[error, 'ok']), \
+                patch.object(ai_engine_module.time, 'sleep') as sleep:
+            assert ai_engine._call_api_with_retry('p') == 'ok'
+        
+        sleep.assert_called_once_with(1.5)
+    
+    def test_long_retry_after_gives_up(self, ai_engine):
+        """Retry-After 가 요청 유효 시간보다 길면 재시도 중단"""
+        error = RateLimitedError('slow down', 429, retry_after=120)
+        with patch.object(ai_engine, '_call_ollama', side_effect=error) as call, \
+                patch.object(ai_engine_module.time, 'sleep') as sleep:
+            with pytest.raises(RateLimitedError):
+                ai_engine._call_api_with_retry('p')
+        
+        assert call.call_count == 1
+        sleep.assert_not_called()
+    
+    def test_retry_delay_bounds(self, ai_engine):
+        """지터는 [0, min(backoff, timeout)], Retry-After 는 timeout 으로 제한"""
+        ai_engine.timeout = 2
+        ai_engine.max_request_age = 5.0
+        
+        for _ in range(50):
+            assert 0 <= ai_engine._retry_delay(Exception(), 0.5) <= 0.5
+            assert 0 <= ai_engine._retry_delay(Exception(), 8.0) <= 2
+        assert ai_engine._retry_delay(RateLimitedError('x', 429, retry_after=4), 0.5) == 2
+        assert ai_engine._retry_delay(RateLimitedError('x', 429, retry_after=6), 0.5) is None
+    
+    def test_status_error_parses_retry_after(self):
+        """429 응답은 Retry-After 포함 RateLimitedError"""
+        error = ai_engine_module._status_error('x', 429, {'Retry-After': '3'})
+        assert isinstance(error, RateLimitedError)
+        assert error.retry_after == 3.0
+        
+        error = ai_engine_module._status_error('x', 500, {})
+        assert not isinstance(error, RateLimitedError)
+        assert error.retriable
+
+
+# =============================================================================
+# 스트리밍 조기 종료 테스트
+# =============================================================================
+
+class TestStreamEarlyStop:
+    """스트리밍 응답 조기 종료 테스트"""
+    
+    def test_completed_json(self):
+        """decision/confidence 가 모두 나온 객체만 완성으로 판단"""
+        assert _completed_json('{"decision": "BUY"') is None
+        assert _completed_json('{"decision": "BUY"}') is None
+        assert _completed_json('x {"decision": "BUY", "confidence": 0.8} y') == \
+            '{"decision": "BUY", "confidence": 0.8}'
+        assert _completed_json('[{"code": "1"}]') == '[{"code": "1"}]'
+        assert _completed_json('no json') is None
+    
+    def test_stops_when_json_completes(self, ai_engine):
+        """JSON 완성 시 done 전에 응답 반환"""
+        lines = [
+            json.dumps({'response': '{"decision": "BUY", '}),
+            json.dumps({'response': '"confidence": 0.8}'}),
+            json.dumps({'response': ' extra', 'done': False}),
+        ]
+        parts = []
+        
+        assert ai_engine._feed_stream_line(parts, lines[0]) is None
+        text = ai_engine._feed_stream_line(parts, lines[1])
+        
+        assert json.loads(text) == {'decision': 'BUY', 'confidence': 0.8}
+        assert ai_engine.get_stats()['early_stops'] == 1
+    
+    def test_done_returns_full_text(self, ai_engine):
+        """done 이면 누적 텍스트 전체 반환 (조기 종료 아님)"""
+        parts = []
+        assert ai_engine._feed_stream_line(parts, json.dumps({'response': 'hel'})) is None
+        assert ai_engine._feed_stream_line(parts, '  ') is None
+        assert ai_engine._feed_stream_line(parts, json.dumps({'response': 'lo', 'done': True})) == 'hello'
+        assert ai_engine.get_stats()['early_stops'] == 0
+
+
 # =============================================================================
 # 테스트 실행
 # =============================================================================
@@ -10,6 +10,7 @@ ScalpingBot v2.4 - Broker 테스트
 - 토큰 갱신 로직 (만료 임박 갱신)
 - 주문 body 생성
 - 오류 코드 처리
+- 여러 종목 현재가 일괄 조회 (멀티종목 파싱 / 종목별 대체 조회)
 ============================================================================
 """
 
@@ -21,7 +22,7 @@ import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scalping.execution.broker import KISBroker
+from scalping.execution.broker import KISBroker, MULTI_PRICE_MAX_CODES
 
 
 # =============================================================================
@@ -46,6 +47,32 @@ def broker(broker_config):
     return KISBroker(broker_config, dry_run=True)
 
 
+@pytest.fixture
+def real_broker(broker_config):
+    """실전 환경 브로커 인스턴스 (dry_run, 멀티종목 시세 API 사용)"""
+    return KISBroker({**broker_config, 'environment': 'P'}, dry_run=True)
+
+
+MULTI_PRICE_ENDPOINT = '/uapi/domestic-stock/v1/quotations/intstock-multprice'
+PRICE_ENDPOINT = '/uapi/domestic-stock/v1/quotations/inquire-price'
+
+
+def fake_price_api(multi_prices: dict, single_prices: dict, calls: list):
+    """_request 대체: 멀티종목은 multi_prices, 종목별 조회는 single_prices 로 응답"""
+    def request(method, endpoint, tr_id, params=None, **kwargs):
+        calls.append((endpoint, dict(params or {})))
+        if endpoint == MULTI_PRICE_ENDPOINT:
+            codes = [v for k, v in params.items() if k.startswith('FID_INPUT_ISCD_')]
+            return {'output': [
+                {'inter_shrn_iscd': code, 'inter2_prpr': str(multi_prices[code])}
+                for code in codes if code in multi_prices
+            ]}
+        if endpoint == PRICE_ENDPOINT:
+            return {'output': {'stck_prpr': str(single_prices.get(params['FID_INPUT_ISCD'], 0))}}
+        raise AssertionError(f"unexpected endpoint: {endpoint}")
+    return request
+
+
 # =============================================================================
 # 토큰 관리 테스트
 # =============================================================================
@@ -240,6 +267,71 @@ class TestPositionQuery:
         assert 'available' in balance
 
 
+# =============================================================================
+# 현재가 일괄 조회 테스트
+# =============================================================================
+
+class TestCurrentPrices:
+    """여러 종목 현재가 일괄 조회 테스트"""
+    
+    def test_multi_price_parsing(self, real_broker):
+        """멀티종목 응답 파싱 (코드/가격 없는 항목 제외)"""
+        response = {'output': [
+            {'inter_shrn_iscd': '005930', 'inter2_prpr': '71000'},
+            {'inter_shrn_iscd': '000660', 'inter2_prpr': ''},
+            {'inter_shrn_iscd': '', 'inter2_prpr': '5000'},
+            {'inter_shrn_iscd': '035720', 'inter2_prpr': '48500'},
+        ]}
+        
+        with patch.object(real_broker, '_request', return_value=response) as mock_request:
+            prices = real_broker._get_multi_price(['005930', '000660', '035720'])
+        
+        assert prices == {'005930': 71000.0, '035720': 48500.0}
+        params = mock_request.call_args.kwargs['params']
+        assert params['FID_INPUT_ISCD_1'] == '005930'
+        assert params['FID_INPUT_ISCD_3'] == '035720'
+        assert params['FID_COND_MRKT_DIV_CODE_2'] == 'J'
+    
+    def test_multi_price_failure_returns_empty(self, real_broker):
+        """멀티종목 조회 실패 시 빈 딕셔너리"""
+        with patch.object(real_broker, '_request', side_effect=Exception('API down')):
+            assert real_broker._get_multi_price(['005930']) == {}
+    
+    def test_real_env_chunks_and_falls_back_for_missing(self, real_broker):
+        """실전: 30종목 단위 일괄 조회, 빠진 종목만 종목별 조회"""
+        codes = [f"{i:06d}" for i in range(MULTI_PRICE_MAX_CODES + 5)]
+        multi = {code: 1000 + i for i, code in enumerate(codes) if code != '000003'}
+        calls = []
+        
+        with patch.object(real_broker, '_request', side_effect=fake_price_api(multi, {'000003': 777}, calls)):
+            prices = real_broker.get_current_prices(codes + ['000001'])
+        
+        assert prices == {**multi, '000003': 777.0}
+        multi_calls = [c for c in calls if c[0] == MULTI_PRICE_ENDPOINT]
+        single_calls = [c for c in calls if c[0] == PRICE_ENDPOINT]
+        assert len(multi_calls) == 2
+        assert len(multi_calls[0][1]) == MULTI_PRICE_MAX_CODES * 2
+        assert [c[1]['FID_INPUT_ISCD'] for c in single_calls] == ['000003']
+    
+    def test_mock_env_uses_per_code_lookup(self, broker):
+        """모의투자: 멀티종목 API 없이 종목별 조회, 실패(0) 종목 제외"""
+        calls = []
+        singles = {'005930': 71000, '035720': 48500}
+        
+        with patch.object(broker, '_request', side_effect=fake_price_api({}, singles, calls)):
+            prices = broker.get_current_prices(['005930', '000660', '035720'])
+        
+        assert prices == {'005930': 71000.0, '035720': 48500.0}
+        assert all(endpoint == PRICE_ENDPOINT for endpoint, _ in calls)
+        assert len(calls) == 3
+    
+    def test_empty_codes(self, broker):
+        """빈 목록은 API 호출 없이 빈 결과"""
+        with patch.object(broker, '_request') as mock_request:
+            assert broker.get_current_prices([]) == {}
+        mock_request.assert_not_called()
+
+
 # =============================================================================
 # 테스트 실행
 # =============================================================================
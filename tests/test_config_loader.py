@@ -294,6 +294,29 @@ class TestHotReload:
         assert callback_called[0] == True
 
 
+# =============================================================================
+# 스냅샷 테스트
+# =============================================================================
+
+class TestSnapshot:
+    """읽기 전용 스냅샷 테스트"""
+    
+    def test_snapshot_reused_until_change(self, loader):
+        """변경 전까지 같은 스냅샷, 변경 후 새 값 반영"""
+        loader.load()
+        
+        snap = loader.snapshot()
+        assert loader.snapshot() is snap
+        
+        with pytest.raises(TypeError):
+            snap['logging']['level'] = 'DEBUG'
+        
+        loader.update('logging.level', 'DEBUG')
+        
+        assert loader.snapshot() is not snap
+        assert loader.snapshot()['logging']['level'] == 'DEBUG'
+
+
 # =============================================================================
 # 변경 이력 테스트
 # =============================================================================
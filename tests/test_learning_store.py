@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+============================================================================
+ScalpingBot - LearningStore 테스트
+============================================================================
+AI 누적 학습 저장소 단위 테스트
+
+테스트 항목:
+- 통계 / 일별 요약이 원본 기록(trade_results)과 일치
+- 일괄 기록 (add_result_batch)
+- close() 시 대기 중인 기록 반영, 닫힌 뒤 기록 거부
+============================================================================
+"""
+
+import pytest
+import sqlite3
+import threading
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scalping.ai.learning_store import LearningStore
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def db_path(tmp_path):
+    """임시 DB 경로"""
+    return tmp_path / 'learning.db'
+
+
+@pytest.fixture
+def store(db_path):
+    """임시 DB 를 쓰는 저장소 (테스트 후 종료)"""
+    store = LearningStore(db_path)
+    yield store
+    store.close()
+
+
+def raw_totals(db_path: Path):
+    """원본 기록 직접 집계 → (건수, 승, 수익 합, 신뢰도 합)"""
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("""
+            SELECT COUNT(*), COALESCE(SUM(win), 0),
+                   COALESCE(SUM(profit), 0), COALESCE(SUM(confidence), 0)
+            FROM trade_results
+        """).fetchone()
+
+
+def add_sample_results(store: LearningStore):
+    """add_result 로 여러 스레드에서 매매 결과 기록"""
+    def worker(k):
+        for i in range(50):
+            store.add_result(
+                f"{k:06d}", 'BUY', 0.5 + (i % 5) / 10, (i % 7) - 3.0, i % 7 > 3,
+                rule_score=60 + i % 30, cci=-100 + i * 4, market_mode='NORMAL',
+            )
+
+    threads = [threading.Thread(target=worker, args=(k,)) for k in range(4)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+
+BATCH = [
+    {'stock_code': '005930', 'decision': 'BUY', 'confidence': 0.8, 'profit': 2.5, 'win': True},
+    {'stock_code': '000660', 'decision': 'BUY', 'confidence': 0.6, 'profit': -0.8, 'win': False},
+    {'stock_code': '035720', 'decision': 'BUY', 'confidence': 0.7, 'profit': 1.2, 'win': True,
+     'rule_score': 82, 'cci': 120, 'market_mode': 'NORMAL'},
+]
+
+
+# =============================================================================
+# 통계 일치 테스트
+# =============================================================================
+
+class TestStatsMatchRawRows:
+    """통계 / 일별 요약과 원본 기록 일치 테스트"""
+
+    def test_stats_after_add_result(self, store, db_path):
+        """add_result 후 전체 통계 = 원본 기록 집계"""
+        add_sample_results(store)
+        store.flush()
+
+        total, wins, sum_profit, sum_conf = raw_totals(db_path)
+        stats = store.get_stats()
+
+        assert total == 200
+        assert stats['total_trades'] == total
+        assert stats['win_count'] == wins
+        assert stats['loss_count'] == total - wins
+        assert stats['total_profit'] == pytest.approx(sum_profit)
+        assert stats['avg_profit'] == pytest.approx(sum_profit / total)
+        assert stats['avg_confidence'] == pytest.approx(sum_conf / total)
+
+    def test_daily_summary_after_add_result(self, store, db_path):
+        """트리거가 갱신한 일별 요약 = 원본 기록 집계"""
+        add_sample_results(store)
+        store.update_daily_summary()
+
+        total, wins, sum_profit, sum_conf = raw_totals(db_path)
+        summaries = store.get_daily_summaries()
+
+        assert len(summaries) == 1
+        summary = summaries[0]
+        assert summary.total_trades == total
+        assert summary.win_count == wins
+        assert summary.loss_count == total - wins
+        assert summary.total_profit == pytest.approx(sum_profit)
+        assert summary.avg_confidence == pytest.approx(sum_conf / total)
+
+    def test_batch_after_pending_results(self, store, db_path):
+        """add_result_batch 는 대기 기록 뒤에 반영되고 통계도 갱신"""
+        store.add_result('000001', 'BUY', 0.9, 3.0, True)
+        stats_before = store.get_stats()
+
+        store.add_result_batch(BATCH)
+
+        total, wins, sum_profit, _ = raw_totals(db_path)
+        stats = store.get_stats()
+
+        assert total == 4
+        assert stats is not stats_before  # 기록 후 캐시 무효화
+        assert stats['total_trades'] == total
+        assert stats['win_count'] == wins
+        assert stats['total_profit'] == pytest.approx(sum_profit)
+        assert store.get_daily_summaries()[0].total_trades == total
+        assert store.get_record_count() == total
+
+    def test_invalid_batch_writes_nothing(self, store, db_path):
+        """필수 키가 빠진 일괄 기록은 전체를 버림"""
+        store.add_result_batch(BATCH + [{'stock_code': '000001'}])
+
+        assert raw_totals(db_path)[0] == 0
+
+    def test_stock_stats(self, store):
+        """종목별 통계"""
+        store.add_result_batch(BATCH + [
+            {'stock_code': '005930', 'decision': 'BUY', 'confidence': 0.5, 'profit': -1.0, 'win': False},
+        ])
+
+        stats = store.get_stock_stats('005930')
+
+        assert stats['total_trades'] == 2
+        assert stats['win_count'] == 1
+        assert stats['avg_profit'] == pytest.approx(0.75)
+
+
+# =============================================================================
+# 종료 테스트
+# =============================================================================
+
+class TestClose:
+    """close() 테스트"""
+
+    def test_close_flushes_pending_rows(self, db_path):
+        """flush 없이 close() 해도 대기 중인 기록이 모두 DB에 반영"""
+        store = LearningStore(db_path)
+        add_sample_results(store)
+        store.close()
+
+        assert raw_totals(db_path)[0] == 200
+
+        with sqlite3.connect(db_path) as conn:
+            assert conn.execute("SELECT SUM(total_trades) FROM daily_summary").fetchone()[0] == 200
+
+    def test_close_is_idempotent(self, db_path):
+        """여러 번 close() 해도 안전"""
+        store = LearningStore(db_path)
+        store.close()
+        store.close()
+
+    def test_writes_after_close_are_discarded(self, db_path):
+        """닫힌 뒤 기록은 예외 없이 버림"""
+        store = LearningStore(db_path)
+        store.close()
+
+        store.add_result('000001', 'BUY', 0.9, 3.0, True)
+        store.add_result_batch(BATCH)
+
+        assert raw_totals(db_path)[0] == 0
+
+    def test_reads_after_close_raise(self, db_path):
+        """닫힌 뒤 조회 연결 생성은 ProgrammingError"""
+        store = LearningStore(db_path)
+        store.close()
+
+        with pytest.raises(sqlite3.ProgrammingError):
+            store._reader()
+
+    def test_reopen_keeps_records(self, db_path):
+        """다시 열어도 기록 / 일별 요약 유지"""
+        store = LearningStore(db_path)
+        store.add_result_batch(BATCH)
+        store.close()
+
+        reopened = LearningStore(db_path)
+        try:
+            assert reopened.get_record_count() == len(BATCH)
+            assert reopened.get_stats()['total_trades'] == len(BATCH)
+            assert reopened.get_daily_summaries()[0].total_trades == len(BATCH)
+        finally:
+            reopened.close()
+
+
+# =============================================================================
+# 테스트 실행
+# =============================================================================
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])
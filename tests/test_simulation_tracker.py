@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+============================================================================
+ScalpingBot - SimulationTracker 테스트
+============================================================================
+페이퍼 트레이딩 트래커 단위 테스트
+
+테스트 항목:
+- 가상 진입 기록
+- 익절/손절 청산 일괄 저장
+- 강제 청산(close_all) 일괄 저장 + WAL 체크포인트
+- close() 후 기록 유지
+============================================================================
+"""
+
+import pytest
+import json
+import sqlite3
+
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scalping.strategy.simulation_tracker import SimulationTracker, SimulationResult
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def db_path(tmp_path):
+    """임시 DB 경로"""
+    return tmp_path / 'simulation.db'
+
+
+@pytest.fixture
+def tracker(db_path):
+    """임시 DB 를 쓰는 트래커 (테스트 후 종료)"""
+    tracker = SimulationTracker(db_path=str(db_path))
+    yield tracker
+    tracker.close()
+
+
+def db_rows(db_path: Path):
+    """저장된 포지션 {종목코드: 행}"""
+    with sqlite3.connect(db_path) as conn:
+        conn.row_factory = sqlite3.Row
+        return {
+            row['stock_code']: row
+            for row in conn.execute("SELECT * FROM virtual_positions")
+        }
+
+
+# =============================================================================
+# 진입 / 청산 저장 테스트
+# =============================================================================
+
+class TestPersistence:
+    """포지션 저장 테스트"""
+
+    def test_enter_virtual_inserts_pending_row(self, tracker, db_path):
+        """가상 진입 시 pending 행 저장"""
+        pos = tracker.enter_virtual('005930', '삼성전자', 10000, 80, 'breakout')
+
+        rows = db_rows(db_path)
+        assert pos.id > 0
+        assert rows['005930']['id'] == pos.id
+        assert rows['005930']['result'] == 'pending'
+        assert rows['005930']['take_profit_price'] == pytest.approx(10250)
+
+    def test_update_prices_saves_closed_positions(self, tracker, db_path):
+        """익절/손절 청산 포지션은 한 번에 저장, 미청산은 pending 유지"""
+        tracker.enter_virtual('005930', '삼성전자', 10000, 80, 'breakout')
+        tracker.enter_virtual('000660', 'SK하이닉스', 10000, 80, 'pullback')
+        tracker.enter_virtual('035720', '카카오', 10000, 80, 'breakout')
+
+        closed = tracker.update_prices({'005930': 10300, '000660': 9900, '035720': 10050})
+
+        rows = db_rows(db_path)
+        assert {p.stock_code for p in closed} == {'005930', '000660'}
+        assert rows['005930']['result'] == 'take_profit'
+        assert rows['005930']['exit_price'] == 10300
+        assert rows['005930']['exit_pct'] == pytest.approx(2.5)
+        assert rows['000660']['result'] == 'stop_loss'
+        assert rows['000660']['exit_pct'] == pytest.approx(-0.8)
+        assert json.loads(rows['000660']['price_history'])[0][1] == 9900
+        assert rows['035720']['result'] == 'pending'
+        assert [p.stock_code for p in tracker.get_active_positions()] == ['035720']
+
+        stats = tracker.get_stats()
+        assert stats['take_profit'] == 1
+        assert stats['stop_loss'] == 1
+        assert stats['pending'] == 1
+
+    def test_close_all_saves_expired(self, tracker, db_path):
+        """강제 청산 시 모든 포지션 expired 저장, WAL 비움"""
+        tracker.enter_virtual('005930', '삼성전자', 10000, 80, 'breakout')
+        tracker.enter_virtual('000660', 'SK하이닉스', 10000, 80, 'pullback')
+        tracker.update_prices({'005930': 10100})
+
+        tracker.close_all()
+
+        rows = db_rows(db_path)
+        assert {row['result'] for row in rows.values()} == {SimulationResult.EXPIRED.value}
+        assert rows['005930']['exit_pct'] == pytest.approx(1.0)
+        assert tracker.get_active_positions() == []
+        assert tracker.get_stats()['pending'] == 0
+
+        wal = db_path.with_name(db_path.name + '-wal')
+        assert not wal.exists() or wal.stat().st_size == 0
+
+    def test_daily_stats_after_close(self, db_path):
+        """close() 후 다시 열어도 일일 통계에 청산 기록 반영"""
+        tracker = SimulationTracker(db_path=str(db_path))
+        tracker.enter_virtual('005930', '삼성전자', 10000, 80, 'breakout')
+        tracker.enter_virtual('000660', 'SK하이닉스', 10000, 80, 'pullback')
+        tracker.update_prices({'005930': 10300, '000660': 9900})
+        tracker.close()
+
+        reopened = SimulationTracker(db_path=str(db_path))
+        try:
+            stats = reopened.get_daily_stats()
+            assert stats['total'] == 2
+            assert stats['wins'] == 1
+            assert stats['losses'] == 1
+        finally:
+            reopened.close()
+
+
+# =============================================================================
+# 테스트 실행
+# =============================================================================
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v', '--tb=short'])